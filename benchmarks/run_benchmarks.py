@@ -0,0 +1,311 @@
+"""This file runs the benchmark suite over synthetic tournaments and writes the results as JSON.
+
+Run from the repository root, for example:
+    python -m benchmarks.run_benchmarks --sizes 30 300 3000 --output bench.json
+    python -m benchmarks.run_benchmarks --sizes 30 300 3000 --compare old_bench.json
+
+Every benchmark runs headless. Library files are written to a temporary directory and the
+leaderboard is saved without being opened."""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy
+
+from models import active_player_list, course_list, player_list, yaml_codec
+from models.active_player_list import ActivePlayerList
+from models.calcutta_team import CalcuttaTeam
+from models.course_list import CourseList
+from models.day import Day, calculate_days_calcutta_scores
+from models.leaderboard import Leaderboard
+from models.player_list import PlayerList
+from models.ranking import TournamentRankings
+from models.standings import Standings
+from models.standings_image import StandingsRenderer, encode_png
+from models.tournament_snapshot import load_snapshot, save_snapshot
+
+from .synthetic import DAYS, SyntheticTournament
+
+DEFAULT_SIZES = [30, 300, 3000]
+DEFAULT_REPEAT = 3
+
+# Benchmarks that build one object per cell are skipped above these field sizes unless asked for.
+SIZE_LIMITS = {
+    'leaderboard': 10000,
+    'player_list_load': 10000,
+    'active_player_list_load': 10000,
+}
+
+
+@contextmanager
+def library_directory():
+    """Point every library path at a fresh temporary directory and work from inside it."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        for sub_directory in ('courselib', 'playerlib', 'active_data_lib/active_players', 'active_data_lib/calcutta_teams'):
+            os.makedirs(os.path.join(directory, sub_directory))
+        os.chdir(directory)
+        try:
+            with patch.object(course_list, 'COURSE_LIB_PATH', os.path.join(directory, 'courselib')), \
+                 patch.object(player_list, 'PLAYER_LIB_PATH', os.path.join(directory, 'playerlib')), \
+                 patch.object(active_player_list, 'DATA_LIB_PATH', os.path.join(directory, 'active_data_lib', 'active_players')):
+                yield directory
+        finally:
+            os.chdir(cwd)
+
+
+def write_library(models, library_path):
+    """Save every model to a library directory under the name it would be saved with."""
+    for model in models:
+        with open(os.path.join(library_path, os.path.basename(model.save_path)), 'w') as model_file:
+            yaml_codec.dump(model, model_file)
+
+
+class MockActivePlayerList:
+    """Holds already built ActivePlayers in the same shape as an ActivePlayerList."""
+
+    def __init__(self, active_players):
+        self.active_player_list = active_players
+
+
+def bench_day_scoring(tournament):
+    course = tournament.day_courses['Day 1']
+    score_lists = tournament.score_lists('Day 1')
+
+    def run():
+        Day.from_field(course, score_lists)
+    return run
+
+
+def bench_day_scoring_per_player(tournament):
+    course = tournament.day_courses['Day 1']
+    score_lists = tournament.score_lists('Day 1')
+
+    def run():
+        [Day(course, score_list) for score_list in score_lists]
+    return run
+
+
+def bench_active_players(tournament):
+    def run():
+        tournament.active_players()
+    return run
+
+
+def bench_calcutta_scoring(tournament):
+    active_players = tournament.active_players(['Day 1'])
+    teams = list(tournament.calcutta_teams().values())
+    players = list(active_players.values())
+    player_index = {name: i for i, name in enumerate(active_players)}
+    team_index = [[player_index[team.player_1], player_index[team.player_2]] for team in teams]
+
+    def run():
+        net_score_matrix, modifiers = calculate_days_calcutta_scores([player.days['Day 1'] for player in players],
+                                                                     [player.player_info.twisted_creek_handicap for player in players])
+        CalcuttaTeam.calculate_field_scores(teams, net_score_matrix, modifiers, team_index, 'Day 1')
+    return run
+
+
+def bench_calcutta_scoring_per_team(tournament):
+    active_players = tournament.active_players(['Day 1'])
+    teams = list(tournament.calcutta_teams().values())
+
+    def run():
+        for team in teams:
+            player_1 = active_players[team.player_1]
+            player_2 = active_players[team.player_2]
+            scores_1, modifiers_1 = player_1.days['Day 1'].get_calcutta_scores(player_1.player_info.twisted_creek_handicap)
+            scores_2, modifiers_2 = player_2.days['Day 1'].get_calcutta_scores(player_2.player_info.twisted_creek_handicap)
+            team.calculate_scores(scores_1, modifiers_1, scores_2, modifiers_2, 'Day 1')
+    return run
+
+
+def bench_rankings(tournament):
+    players = list(tournament.active_players().values())
+    teams = list(tournament.calcutta_teams().values())
+
+    def run():
+        TournamentRankings.from_field(players, teams)
+    return run
+
+
+def bench_course_list_load(tournament):
+    write_library(tournament.courses, course_list.COURSE_LIB_PATH)
+    return CourseList
+
+
+def bench_player_list_load(tournament):
+    write_library(tournament.players, player_list.PLAYER_LIB_PATH)
+    return PlayerList
+
+
+def bench_active_player_list_load(tournament):
+    write_library(tournament.players, player_list.PLAYER_LIB_PATH)
+    write_library(tournament.active_players().values(), active_player_list.DATA_LIB_PATH)
+    player_list_model = PlayerList()
+
+    def run():
+        ActivePlayerList(player_list_model)
+    return run
+
+
+def bench_snapshot_load(tournament):
+    snapshot_path = os.path.join(os.getcwd(), 'snapshot')
+    save_snapshot(snapshot_path, tournament.active_players())
+
+    def run():
+        load_snapshot(snapshot_path)
+    return run
+
+
+def bench_leaderboard(tournament):
+    active_players = MockActivePlayerList(tournament.active_players())
+    teams = tournament.calcutta_teams()
+    for team in teams.values():
+        team.days = {day: 0 for day in DAYS}
+
+    def run():
+        Leaderboard(active_players, teams, open_file=False)
+    return run
+
+
+def bench_standings(tournament):
+    active_players = tournament.active_players()
+    teams = tournament.calcutta_teams()
+    for team in teams.values():
+        team.days = {day: 0 for day in DAYS}
+
+    def run():
+        Standings(active_players, teams).sheets()
+    return run
+
+
+def bench_standings_image(tournament):
+    active_players = tournament.active_players()
+    teams = tournament.calcutta_teams()
+    for team in teams.values():
+        team.days = {day: 0 for day in DAYS}
+    sheets = Standings(active_players, teams).sheets()
+
+    def run():
+        renderer = StandingsRenderer()
+        for sheet in sheets:
+            encode_png(renderer.render(sheet))
+    return run
+
+
+BENCHMARKS = {
+    'day_scoring': bench_day_scoring,
+    'day_scoring_per_player': bench_day_scoring_per_player,
+    'active_players': bench_active_players,
+    'calcutta_scoring': bench_calcutta_scoring,
+    'calcutta_scoring_per_team': bench_calcutta_scoring_per_team,
+    'rankings': bench_rankings,
+    'course_list_load': bench_course_list_load,
+    'player_list_load': bench_player_list_load,
+    'active_player_list_load': bench_active_player_list_load,
+    'snapshot_load': bench_snapshot_load,
+    'standings': bench_standings,
+    'standings_image': bench_standings_image,
+    'leaderboard': bench_leaderboard,
+}
+
+
+def measure(run, repeat):
+    """Time the best of repeat runs, then measure the peak traced memory of one more run."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(times), peak
+
+
+def run_benchmarks(sizes, names=None, repeat=DEFAULT_REPEAT, seed=0, ignore_limits=False, log=print):
+    """Run each benchmark at every field size and return the list of results."""
+    results = []
+    for size in sizes:
+        tournament = SyntheticTournament(size, seed=seed)
+        for name in names or BENCHMARKS:
+            if not ignore_limits and size > SIZE_LIMITS.get(name, size):
+                continue
+            with library_directory():
+                run = BENCHMARKS[name](tournament)
+                seconds, peak_bytes = measure(run, repeat)
+            results.append({'benchmark': name, 'size': size, 'seconds': seconds, 'peak_bytes': peak_bytes})
+            log(f'{name:<28s} {size:>7d} {seconds*1000:>12.3f} ms {peak_bytes/2**20:>10.2f} MiB')
+    return results
+
+
+def get_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_results, log=print):
+    """Print the change in time and peak memory of each result against a baseline run."""
+    baseline = {(result['benchmark'], result['size']): result for result in baseline_results}
+    for result in results:
+        old_result = baseline.get((result['benchmark'], result['size']))
+        if not old_result:
+            continue
+        time_ratio = result['seconds'] / old_result['seconds'] if old_result['seconds'] else float('inf')
+        memory_ratio = result['peak_bytes'] / old_result['peak_bytes'] if old_result['peak_bytes'] else float('inf')
+        log(f"{result['benchmark']:<28s} {result['size']:>7d} time x{time_ratio:>6.2f} memory x{memory_ratio:>6.2f}")
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Benchmark the scoring, persistence and leaderboard paths.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Field sizes to benchmark.')
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), help='Only run these benchmarks.')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Runs timed per benchmark.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic tournaments.')
+    parser.add_argument('--ignore-limits', action='store_true', help='Run every benchmark at every size.')
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--compare', help='Compare the results against this earlier JSON file.')
+    args = parser.parse_args(args)
+
+    results = run_benchmarks(args.sizes, args.benchmarks, args.repeat, args.seed, args.ignore_limits)
+    report = {
+        'commit': get_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'seed': args.seed,
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare, 'r') as baseline_file:
+            compare(results, json.load(baseline_file)['results'])
+
+    return report
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    main()
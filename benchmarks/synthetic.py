@@ -0,0 +1,63 @@
+"""This file contains the seeded generator used to build synthetic tournaments for the benchmarks."""
+
+from numpy.random import default_rng
+
+from models.active_player import ActivePlayer
+from models.calcutta_team import CalcuttaTeam
+from models.course import Course
+from models.day import Day
+from models.player import Player
+
+COURSE_LENGTH = 18
+DAYS = ['Day 1', 'Day 2', 'Day 3']
+
+# Relative to par scores and how often they are made by a mid handicap player.
+NET_SCORES = [-2, -1, 0, 1, 2, 3]
+NET_SCORE_WEIGHTS = [0.01, 0.09, 0.35, 0.35, 0.15, 0.05]
+
+
+class SyntheticTournament:
+    """A randomly generated, but repeatable, set of courses, players, rounds and Calcutta teams."""
+
+    def __init__(self, player_count: int, course_count: int=len(DAYS), seed: int=0):
+        self.rng = default_rng(seed)
+        self.courses = [self.generate_course(f'Course {i+1}') for i in range(course_count)]
+        self.players = [self.generate_player(f'Player {i+1:06d}') for i in range(player_count)]
+        self.day_courses = {day: self.courses[i % course_count] for i, day in enumerate(DAYS)}
+        self.score_matrices = {day: self.generate_scores(self.day_courses[day], player_count) for day in DAYS}
+
+    def generate_course(self, course_name):
+        par_order = self.rng.choice([3, 4, 4, 4, 5], COURSE_LENGTH).tolist()
+        handicap_order = (self.rng.permutation(COURSE_LENGTH) + 1).tolist()
+        return Course(course_name, par_order, handicap_order)
+
+    def generate_player(self, player_name):
+        player = Player(player_name, int(self.rng.integers(0, 31)))
+        player.active = True
+        return player
+
+    def generate_scores(self, course, player_count):
+        """Generate a (players x holes) matrix of raw scores on the course."""
+        net_scores = self.rng.choice(NET_SCORES, (player_count, COURSE_LENGTH), p=NET_SCORE_WEIGHTS)
+        return net_scores + course.par_array
+
+    def score_lists(self, day):
+        return self.score_matrices[day].tolist()
+
+    def active_players(self, days=DAYS):
+        """Build an ActivePlayer for every player with rounds for the given days."""
+        active_players = {player.name: ActivePlayer(player) for player in self.players}
+        for day in days:
+            field_days = Day.from_field(self.day_courses[day], self.score_lists(day))
+            for active_player, day_model in zip(active_players.values(), field_days):
+                active_player.days[day] = day_model
+        return active_players
+
+    def calcutta_teams(self):
+        """Pair the players best with worst in the order they were generated."""
+        player_count = len(self.players)
+        teams = dict()
+        for i in range(player_count // 2):
+            team = CalcuttaTeam(self.players[i].name, self.players[player_count - 1 - i].name)
+            teams[f'{team.player_1} and {team.player_2}'] = team
+        return teams
@@ -33,8 +33,9 @@ class CourseController:
             self.model.name = self.view.get_course_name()
             self.model.par_order = self.view.get_par_order()
             self.model.handicap_order = self.view.get_handicap_order()
+            self.model.invalidate_scoring_tables()
 
-        self.model.save()
+        self.model.save(self.course_list_controller.model.store)
         self.course_list_controller.update_course_list()
         self.model = None
         self.view.set_course_data(self.model)
@@ -44,7 +45,7 @@ class CourseController:
         if not self.model:
             return
         
-        self.model.delete()
+        self.model.delete(self.course_list_controller.model.store)
         self.course_list_controller.update_course_list()
         self.model = None
 
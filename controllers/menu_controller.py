@@ -28,7 +28,11 @@ class MenuController:
 
     def generate_leaderboard(self):
         """Generate a leaderboard of the current results."""
+        self.application.score_controller.flush_saves()
+        score_controller = self.application.score_controller
         Leaderboard(
-            self.application.score_controller.player_list_model, 
-            self.application.score_controller.calcutta_team_list
+            score_controller.player_list_model,
+            score_controller.calcutta_team_list,
+            score_controller.rankings,
+            standings=score_controller.get_standings()
             )
@@ -43,7 +43,7 @@ class PlayerListController:
     def activate_player(self, player_name, active_state):
         player = self.get_player(player_name)
         player.active = active_state
-        player.save()
+        player.save(self.model.store)
         self.update_player_list()
         self.application.score_controller.refresh_player_list(self.model)
     
@@ -78,6 +78,9 @@ class PlayerListController:
         if not player_name:
             raise ValueError("No player name provided.")
 
+        # Active players share their Player with the library, so editing or deleting one changes the scores.
+        active = player_name in self.get_player_names() and self.get_player(player_name).active
+
         if not (mosley_open_hc_str or twisted_creek_hc_str):
             self.delete_player(player_name)
         else:
@@ -86,19 +89,21 @@ class PlayerListController:
                 player = self.get_player(player_name)
                 player.mosley_open_handicap = min(20, mosley_open_hc)
                 player.twisted_creek_handicap = min(30, twisted_creek_hc)
-                player.save()
+                player.save(self.model.store)
             else:
                 player = Player(player_name, twisted_creek_hc)
-                player.save()
+                player.save(self.model.store)
         
         self.update_player_list()
+        if active:
+            self.application.score_controller.refresh_player_list(self.model)
         self.clear_entry_fields()
 
     def delete_player(self, player_name):
         """Deletes a player from the library and player list."""
         try:
             player=self.get_player(player_name)
-            player.delete()
+            player.delete(self.model.store)
         except KeyError:
             raise ValueError(f"Attempted to delete {player_name}, but could not find them.")
 
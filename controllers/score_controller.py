@@ -1,16 +1,22 @@
 """This file contains the ScoreController class and its associated functions."""
 
 import os
-import yaml
+from functools import partial
 
 from views.score_view import ScoreView
 from views.menu_view import MenuView
 from models.active_player_list import ActivePlayerList
-from models.day import Day
-from models.calcutta_team import CalcuttaTeam
+from models.library_loader import load_library
+from models.save_queue import SaveQueue
+from models.day import Day, InvalidScoreError, calculate_days_calcutta_scores
+from models.calcutta_team import CalcuttaTeam, calculate_hole_points
 from models.active_player import ActiveTournament
+from models.ranking import RankingIndex, TournamentRankings
+from models.standings import CUT, PLAYERS, TEAMS, Standings
+from models.calcutta_pairing import BALANCED, BEST_WITH_WORST, pair_balanced, pair_best_with_worst
 
 COURSE_LENGTH = 18
+CALCUTTA_PAIRING_MODE = BEST_WITH_WORST
 CALCUTTA_TEAM_PATH = '\\Users\\sammo\Mosley_Open_v4\\active_data_lib\\calcutta_teams'
 
 class ScoreController:
@@ -19,7 +25,16 @@ class ScoreController:
     def __init__(self, application, model: ActivePlayerList, view: ScoreView):
         self.application = application
         self.player_list_model = model
+        self.store = model.store
+        # Without a store, files are written in the background so scoring never waits on them.
+        self.save_queue = SaveQueue() if self.store is None else None
+        self.calcutta_pairing_mode = CALCUTTA_PAIRING_MODE
+        self.journal = model.journal
         self.calcutta_team_list = self.load_calcutta_teams()
+        if self.journal is not None and not self.journal.has_state:
+            self.journal.start(model.active_player_list, self.calcutta_team_list)
+        self.rankings = TournamentRankings.from_field(model.active_player_list.values(), self.calcutta_team_list.values())
+        self.standings = Standings(model.active_player_list, self.calcutta_team_list, self.rankings)
         self.view = view
         self.view.set_controller(self)
         self.populate_course_box()
@@ -30,6 +45,14 @@ class ScoreController:
         """Return to the menu page."""
         self.application.show_frame(MenuView)
 
+    def get_standings(self):
+        """Get the standings of the tournament as it is currently scored. Only the sheets whose
+        inputs have changed since they were last computed are computed again."""
+        self.standings.active_players = self.player_list_model.active_player_list
+        self.standings.calcutta_teams = self.calcutta_team_list
+        self.standings.rankings = self.rankings
+        return self.standings
+
     def get_player(self, player_name):
         """Get the ActivePlayer model by player name."""
         return self.player_list_model.active_player_list[player_name]
@@ -52,8 +75,10 @@ class ScoreController:
 
     def set_up_player_list(self):
         """This function will construct and fill the frames of the ActivePlayerLists."""
-        for frame in self.view.active_player_list_frames.values():
+        for day, frame in self.view.active_player_list_frames.items():
             frame.generate_active_player_frames(self.get_player_names())
+            for player_name, player_frame in frame.active_player_frames.items():
+                player_frame.bind_score_entries(partial(self.enter_hole_score, player_name, day))
     
     def populate_course_box(self):
         """This function loads in the course names to the Course ComboBox."""
@@ -85,6 +110,7 @@ class ScoreController:
         if self.view.current_day == 'Day 1':
             self.calcutta_team_list = self.generate_calcutta_teams()
         elif self.view.current_day == 'Day 2':
+            # The whole field is listed, so a cut can be made again after players have been sent to the Twisted Creek.
             player_list = list(self.player_list_model.active_player_list.values())
             sorted_player_list = sorted(player_list, key=lambda player: (player.net_mosley_open_points, player.total_raw_score), reverse=True)
             cutline_score = self.view.request_cut_line(sorted_player_list)
@@ -92,80 +118,218 @@ class ScoreController:
 
         if self.calcutta_team_list is None:
             self.calcutta_team_list = self.load_calcutta_teams()
+            self.standings.invalidate(TEAMS)
         
-        for team in self.calcutta_team_list.values():
-            self.update_calcutta_scores(team)
+        self.update_calcutta_scores()
 
     def generate_calcutta_teams(self):
-        player_list = list(self.player_list_model.active_player_list.values())
-        ranked_players = sorted(player_list, key=lambda player: (player.get_twisted_creek_daily_points(self.view.current_day), player.days[self.view.current_day].points), reverse=True)
-        if len(ranked_players) % 2 != 0:
-            double_player_name = self.view.request_double_player(ranked_players)
-            player_idx = [i for i, player in enumerate(ranked_players) if player.player_info.name == double_player_name]
-            ranked_players.insert(player_idx[0], ranked_players[player_idx[0]])
-
-        teams = [
-            [ranked_players[i].player_info.name, ranked_players[-1 - i].player_info.name]
-            for i in range(len(ranked_players))
-            if i < 0.5 * len(ranked_players)
-        ]
-        calcutta_teams = [CalcuttaTeam(team[0], team[1]) for team in teams]
-        for team in calcutta_teams:
-            team.save()
+        dogfight = self.rankings.dogfights[self.view.current_day]
+        ranked_players = [self.get_player(player_name) for player_name in dogfight.names()]
+        if self.calcutta_pairing_mode == BALANCED:
+            # The balanced pairing solver handles an odd field itself.
+            net_score_matrix, modifiers = self.get_calcutta_scores(dogfight.names(), self.view.current_day)
+            pairs = pair_balanced(net_score_matrix, modifiers)
+        else:
+            if len(ranked_players) % 2 != 0:
+                double_player_name = self.view.request_double_player(ranked_players)
+                player_idx = [i for i, player in enumerate(ranked_players) if player.player_info.name == double_player_name]
+                ranked_players.insert(player_idx[0], ranked_players[player_idx[0]])
+            pairs = pair_best_with_worst(len(ranked_players))
+
+        teams = [[ranked_players[i].player_info.name, ranked_players[j].player_info.name] for i, j in pairs]
+        self.rankings.calcutta = RankingIndex()
+        calcutta_teams = dict()
+        for team in teams:
+            calcutta_team = CalcuttaTeam(team[0], team[1])
+            calcutta_teams[f'{calcutta_team.player_1} and {calcutta_team.player_2}'] = calcutta_team
+        self.save_calcutta_teams(calcutta_teams.values())
+        self.standings.invalidate(TEAMS)
+        if self.journal is not None:
+            self.journal.record_teams(calcutta_teams.values())
         
         return calcutta_teams
 
     def load_calcutta_teams(self):
-        calcutta_dict = dict()
-        for filename in os.listdir(CALCUTTA_TEAM_PATH):
-            if not filename.endswith('yaml'):
-                continue
-
-            filepath = os.path.join(CALCUTTA_TEAM_PATH, filename)
-            with open(filepath, 'r') as file:
-                calcutta_team = yaml.load(file, Loader=yaml.Loader)
-
-            if not isinstance(calcutta_team, CalcuttaTeam):
-                raise TypeError(f"Invalid CalcuttaTeam file.")
-            
-            calcutta_dict[f'{calcutta_team.player_1} and {calcutta_team.player_2}'] = calcutta_team
-        return calcutta_dict
-
-    def update_calcutta_scores(self, team):
-        player_1 = self.get_player(team.player_1)
-        player_2 = self.get_player(team.player_2)
+        if self.journal is not None and self.journal.has_state:
+            return self.journal.rebuild_calcutta_teams(self.player_list_model.active_player_list)
+
+        if self.store is not None:
+            return self.store.load_calcutta_teams()
+
+        filepaths = [os.path.join(CALCUTTA_TEAM_PATH, filename) for filename in os.listdir(CALCUTTA_TEAM_PATH)
+                     if filename.endswith('yaml')]
+        return {f'{calcutta_team.player_1} and {calcutta_team.player_2}': calcutta_team
+                for calcutta_team in load_library(filepaths, CalcuttaTeam)}
+
+    def update_calcutta_scores(self):
+        """This function calculates the scores of every Calcutta team for the current day at once
+        by stacking the scores of every teamed player into a single matrix."""
+        teams = list(self.calcutta_team_list.values())
+        if not teams:
+            return
+
         day = self.view.current_day
-        player_1_scores, player_1_modifiers = player_1.days[day].get_calcutta_scores(player_1.player_info.twisted_creek_handicap)
-        player_2_scores, player_2_modifiers = player_2.days[day].get_calcutta_scores(player_2.player_info.twisted_creek_handicap)
-        team.calculate_scores(player_1_scores, player_1_modifiers, player_2_scores, player_2_modifiers, day)
-        team.save()
+        player_names = list(dict.fromkeys(name for team in teams for name in (team.player_1, team.player_2)))
+        player_index = {player_name: i for i, player_name in enumerate(player_names)}
+        net_score_matrix, modifiers = self.get_calcutta_scores(player_names, day)
+        team_index = [[player_index[team.player_1], player_index[team.player_2]] for team in teams]
+        CalcuttaTeam.calculate_field_scores(teams, net_score_matrix, modifiers, team_index, day)
+        self.save_calcutta_teams(teams)
+        for team in teams:
+            self.rankings.update_team(team)
+
+    def get_calcutta_scores(self, player_names, day):
+        """Stack the Calcutta net scores and modifiers of the players for the day into one matrix."""
+        players = [self.get_player(player_name) for player_name in player_names]
+        return calculate_days_calcutta_scores([player.days[day] for player in players],
+                                              [player.player_info.twisted_creek_handicap for player in players])
 
     def split_players(self, cutline_score):
         """This function will assign single tournament values to each player based on the cutline."""
-        for player in self.player_list_model.active_player_list.values():
+        players = list(self.player_list_model.active_player_list.values())
+        for player in players:
             if player.net_mosley_open_points >= cutline_score:
                 player.active_tournament = ActiveTournament.MosleyOpen
             else:
                 player.active_tournament = ActiveTournament.TwistedCreek
-
-            player.save()
+            self.rankings.update_player(player)
+        self.save_active_players(players)
+        self.standings.invalidate(CUT)
+        if self.journal is not None:
+            self.journal.record_cut(players)
 
     def save_score_data(self):
         """This function saves all of the data found in the entry boxes and course box to
         each player's ActivePlayer object file."""
         active_player_list_frame = self.view.active_player_list_frames[self.view.current_day]
-        for player_name, player_frame in active_player_list_frame.active_player_frames.items():
-            player_model = self.get_player(player_name)
-            try:
-                player_model.days[self.view.current_day] = Day(self.current_course_model, self.get_score_list(player_frame))
-            except AttributeError:
-                raise ValueError("Please select a course before calculating scores.")
-            player_model.save()
-            player_frame.total_score_label.config(text=str(player_model.days[self.view.current_day].total_raw_score))
+        player_frames = active_player_list_frame.active_player_frames
+        score_lists = [self.get_score_list(player_frame) for player_frame in player_frames.values()]
+        if not score_lists:
+            return
+
+        try:
+            course_model = self.current_course_model
+        except AttributeError:
+            raise ValueError("Please select a course before calculating scores.")
+
+        # Score the whole field at once so every invalid hole is reported together.
+        player_names = list(player_frames)
+        try:
+            days = Day.from_field(course_model, score_lists)
+        except InvalidScoreError as e:
+            hole_strs = [f"{score} on Hole {hole+1} for {player_names[player]}" for player, hole, score in e.invalid_holes]
+            raise ValueError(f"Invalid scores: {', '.join(hole_strs)}")
+
+        player_models = [self.get_player(player_name) for player_name in player_names]
+        for player_name, player_model, day in zip(player_names, player_models, days):
+            player_model.days[self.view.current_day] = day
+            self.rankings.update_player(player_model)
+            player_frames[player_name].total_score_label.config(text=str(day.total_raw_score))
+        self.save_active_players(player_models)
+        self.standings.invalidate(self.view.current_day)
+        if self.journal is not None:
+            self.journal.record_days(self.view.current_day, dict(zip(player_names, days)))
+
+    def save_active_players(self, players):
+        """Save the players, in a single transaction when a store is in use and otherwise
+        through the background save queue."""
+        if self.store is not None:
+            self.store.save_active_players(players)
+            return
+
+        self.save_queue.save_all(players)
+
+    def save_calcutta_teams(self, teams):
+        """Save the Calcutta teams, in a single transaction when a store is in use and otherwise
+        through the background save queue."""
+        if self.store is not None:
+            self.store.save_calcutta_teams(teams)
+            return
+
+        self.save_queue.save_all(teams)
+
+    def flush_saves(self):
+        """Wait for every queued save to be written."""
+        if self.save_queue is not None:
+            self.save_queue.flush()
+
+    def enter_hole_score(self, player_name, day, hole, score_str):
+        """Record a single hole typed into an ActivePlayerView as soon as the entry is left. An invalid
+        score is reported through the view, since nothing upstream of the entry's callback can catch it."""
+        day_model = self.get_player(player_name).days[day]
+        try:
+            strokes = int(score_str) if score_str else None
+        except ValueError:
+            self.view.show_error(f"Please input a valid score for {player_name} on Hole {hole+1}")
+            return
+
+        old_strokes = day_model.raw_score_list[hole] if day_model else None
+        if strokes == old_strokes:
+            return
+
+        try:
+            day_model = self.update_hole_score(player_name, day, hole, strokes)
+        except (KeyError, ValueError) as error:
+            self.view.show_error(error.args[0])
+            return
+        player_frame = self.view.active_player_list_frames[day].active_player_frames[player_name]
+        player_frame.total_score_label.config(text=str(day_model.total_raw_score))
+
+    def get_calcutta_hole(self, player_name, day, hole):
+        """Get a player's Calcutta (net score, modifier) pair for a single hole."""
+        player = self.get_player(player_name)
+        day_model = player.days[day]
+        if not day_model:
+            return 2, 0
+        return day_model.get_calcutta_hole(hole, player.player_info.twisted_creek_handicap)
+
+    def update_hole_score(self, player_name, day, hole, strokes):
+        """Set a single hole's score for a player, accepting partial rounds. The player's totals,
+        their Calcutta teams and the standings are adjusted by the change on that hole alone, and
+        only the changed files are saved. With a journal, the hole is appended to the journal
+        instead of saving any files."""
+        player = self.get_player(player_name)
+        teams = [team for team in self.calcutta_team_list.values() if player_name in (team.player_1, team.player_2)]
+        old_hole_points = [
+            calculate_hole_points(self.get_calcutta_hole(team.player_1, day, hole), self.get_calcutta_hole(team.player_2, day, hole))
+            for team in teams
+        ]
+
+        course_model = player.days[day].course if player.days[day] else getattr(self, 'current_course_model', None)
+        if course_model is None:
+            raise ValueError("Please select a course before entering scores.")
+        day_model = player.set_hole_score(day, hole, strokes, course_model)
+        self.rankings.update_player(player)
+
+        for team, old_points in zip(teams, old_hole_points):
+            new_points = calculate_hole_points(self.get_calcutta_hole(team.player_1, day, hole),
+                                               self.get_calcutta_hole(team.player_2, day, hole))
+            team.update_hole(day, old_points, new_points)
+            self.rankings.update_team(team)
+        self.standings.invalidate(day)
+
+        if self.journal is not None:
+            self.journal.record_hole(player_name, day, hole, strokes, day_model.course)
+        else:
+            self.save_active_players([player])
+            self.save_calcutta_teams(teams)
+
+        return day_model
 
     def refresh_player_list(self, player_list_model):
         """Destroys and recreates the player list in the event that a new player is activated/deactivated."""
-        self.player_list_model.refresh_player_list(player_list_model)
+        # The active players are reconciled in place, and only the changed players' files are written or
+        # deleted. Queued saves land first, so none of them can overwrite those files or recreate a deleted one.
+        self.flush_saves()
+        added, updated, removed = self.player_list_model.refresh_player_list(player_list_model)
+        if self.journal is not None:
+            self.journal.record_roster(self.player_list_model.active_player_list)
+        # A handicap change moves a player's net totals, so only the changed players are re-ranked.
+        for player in removed:
+            self.rankings.remove_player(player.player_info.name)
+        for player in added + updated:
+            self.rankings.update_player(player)
+        self.standings.invalidate(PLAYERS)
         for frame in self.view.active_player_list_frames.values():
             frame.destroy_active_player_frames
         self.set_up_player_list()
@@ -8,6 +8,8 @@ sys.path.append("/Users/sammo/Mosley_Open_v4")
 from models.course_list import CourseList
 from models.player_list import PlayerList
 from models.active_player_list import ActivePlayerList
+from models.sqlite_store import SqliteStore
+from models.score_journal import ScoreJournal
 from views.course_list_view import CourseListView
 from views.player_list_view import PlayerListView
 from views.score_view import ScoreView
@@ -17,14 +19,24 @@ from controllers.player_list_controller import PlayerListController
 from controllers.score_controller import ScoreController
 from controllers.menu_controller import MenuController
 
+# Set to a database path to keep the libraries in SQLite rather than in YAML files.
+STORE_PATH = None
+# Set to a directory to journal every score, so the tournament can be recovered after a crash.
+JOURNAL_PATH = None
+# Set to a directory to snapshot the active players on exit, so the next start skips the data library.
+SNAPSHOT_PATH = None
+
 class App(tk.Tk):
 
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.title('Mosley Open')
+        self.protocol('WM_DELETE_WINDOW', self.close)
         #self.geometry('675x650')
 
         self.frames = dict()
+        self.store = SqliteStore(STORE_PATH) if STORE_PATH else None
+        self.journal = ScoreJournal(JOURNAL_PATH) if JOURNAL_PATH else None
 
         container = ttk.Frame(self)
         container.pack(side='top', fill='both', expand=True)
@@ -37,26 +49,32 @@ class App(tk.Tk):
         self.frames[MenuView] = menu_view
 
         # Prepare the CourseList model, view, and controller.
-        course_list_model = CourseList()
+        course_list_model = CourseList(self.store)
         course_list_view = CourseListView(container)
         self.course_list_controller = CourseListController(self, course_list_model, course_list_view)
         self.frames[CourseListView] = course_list_view
 
         # Prepare the PlayerList model, view, and controller.
-        player_list_model = PlayerList()
+        player_list_model = PlayerList(self.store)
         player_list_view = PlayerListView(container)
         self.player_list_controller = PlayerListController(self, player_list_model, player_list_view)
         self.frames[PlayerListView] = player_list_view
 
         # Prepare the ActivePlayerList model, Score view, and Score controller
-        active_player_list_model = ActivePlayerList(player_list_model)
+        self.active_player_list_model = ActivePlayerList(player_list_model, self.store, self.journal, SNAPSHOT_PATH)
         score_view = ScoreView(container)
-        self.score_controller = ScoreController(self, active_player_list_model, score_view)
+        self.score_controller = ScoreController(self, self.active_player_list_model, score_view)
         self.frames[ScoreView] = score_view
 
         # Show the initial frame
         self.show_frame(MenuView)
 
+    def close(self):
+        """Write every queued save and the snapshot before the window is closed."""
+        self.score_controller.flush_saves()
+        self.active_player_list_model.save_snapshot()
+        self.destroy()
+
     def show_frame(self, view_class):
         """Raises the input view to the front of the application."""
         frame = self.frames[view_class]
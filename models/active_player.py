@@ -1,74 +1,153 @@
 """This file contains the ActivePlayer class and all of its related functions."""
 
-import yaml
 from enum import Enum
 from os import path, remove
 
 from .player import Player
 from .day import Day
+from . import yaml_codec
 
 DATA_LIB_DIR = 'active_data_lib'
 
+@yaml_codec.register_enum
 class ActiveTournament(Enum):
     MosleyOpen = 1
     TwistedCreek = 2
     BothTournaments = 3
 
+class PlayerDays(dict):
+    """A dictionary of the days played by an ActivePlayer. The owning player's running totals
+    are updated whenever a day is assigned, replaced or removed."""
+
+    def __init__(self, on_change, days=None):
+        super().__init__()
+        self._on_change = on_change
+        if days:
+            self.update(days)
+
+    def __setitem__(self, day, day_model):
+        old_day_model = self.get(day)
+        super().__setitem__(day, day_model)
+        self._on_change(old_day_model, day_model)
+
+    def __delitem__(self, day):
+        old_day_model = self[day]
+        super().__delitem__(day)
+        self._on_change(old_day_model, None)
+
+    def update(self, *args, **kwargs):
+        for day, day_model in dict(*args, **kwargs).items():
+            self[day] = day_model
+
+
+@yaml_codec.register_model
 class ActivePlayer:
 
     def __init__(self, player: Player, active_tournament: ActiveTournament=ActiveTournament.BothTournaments):
         self.player_info = self._validate_inputs(player, Player)
         self.active_tournament = self._validate_inputs(active_tournament, ActiveTournament)
-        self.days = {
+        self._reset_totals()
+        self.days = PlayerDays(self._update_totals, {
             'Day 1': None,
             'Day 2': None,
             'Day 3': None,
-            }
+            })
         self.save_path = path.abspath(f'{DATA_LIB_DIR}/active_players/{self.player_info.name}_active.yaml')
 
+    def __getstate__(self):
+        # The running totals are rebuilt on load, so only the plain days dictionary is saved.
+        state = self.__dict__.copy()
+        state['days'] = dict(self.days)
+        for total in ('_total_raw_score', '_total_points', '_days_played'):
+            state.pop(total, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset_totals()
+        self.days = PlayerDays(self._update_totals, state['days'])
+
     def _validate_inputs(self, input, input_class):
         if not isinstance(input, input_class):
             raise TypeError(f"Input {input} must be of Type {input_class}.")
         return input
+
+    def _reset_totals(self):
+        self._total_raw_score = 0
+        self._total_points = 0
+        self._days_played = 0
+
+    def _update_totals(self, old_day, new_day):
+        """Adjust the running totals when a day is replaced."""
+        for day, sign in ((old_day, -1), (new_day, 1)):
+            if isinstance(day, Day):
+                self._total_raw_score += sign*day.total_raw_score
+                self._total_points += sign*day.points
+                self._days_played += sign
     
     @property
     def number_of_days_played(self):
         """A property used to get the total number of days played."""
-        return len(list(filter(None, self.days.values())))
+        return self._days_played
     
     @property
     def total_raw_score(self):
         """A property used to calculate the total raw score of a player."""
-        return sum([day.total_raw_score for day in self.days.values() if isinstance(day, Day)])
+        return self._total_raw_score
 
     @property
     def net_mosley_open_points(self):
         """A property used to calculate a player's points with their Mosley Open handicap applied."""
 
-        return sum([day.get_net_points(self.player_info.mosley_open_handicap) 
-                    for day in self.days.values() if isinstance(day, Day)])
+        return self._total_points - self._days_played*(36-self.player_info.mosley_open_handicap)
     
     @property
     def net_twisted_creek_score(self):
         """A property used to calculate a player's score with their Twisted Creek Handicap applied."""
 
-        return sum([day.get_net_points(self.player_info.twisted_creek_handicap) 
-                    for day in self.days.values() if isinstance(day, Day)])
+        return self._total_points - self._days_played*(36-self.player_info.twisted_creek_handicap)
     
+    def set_hole_score(self, day, hole: int, strokes: int, course=None):
+        """Set or clear (with None) a single hole's score for the day, starting a new Day on the
+        course if none has been started yet. The running totals are adjusted by the change on that hole."""
+
+        day_model = self.days[day]
+        if day_model is None:
+            if course is None:
+                raise ValueError(f"A course is required to start {day} for {self.player_info.name}.")
+            # The new Day is only attached once its first hole is accepted, and attaching it adds its totals.
+            day_model = Day.empty(course)
+            day_model.set_hole(hole, strokes)
+            self.days[day] = day_model
+            return day_model
+
+        points_delta, raw_score_delta = day_model.set_hole(hole, strokes)
+        self._total_points += points_delta
+        self._total_raw_score += raw_score_delta
+        return day_model
+
     def get_twisted_creek_daily_points(self, day):
         return self.days[day].get_net_points(self.player_info.twisted_creek_handicap)
     
-    def save(self):
-        """Save the ActivePlayer object to the data library as a YAML file."""
+    def save(self, store=None):
+        """Save the ActivePlayer object to the data library as a YAML file, or to the store if one is given."""
+
+        if store is not None:
+            store.save_active_players([self])
+            return
 
         try:
             with open(self.save_path, 'w') as player_file:
-                yaml.dump(self, player_file)
+                yaml_codec.dump(self, player_file)
         except Exception as e:
             raise IOError(f"Failed to save player: {e}")
         
-    def delete(self):
-        """Delete the player file from the data library."""
+    def delete(self, store=None):
+        """Delete the player file from the data library, or the player from the store if one is given."""
+        if store is not None:
+            store.delete_active_players([self.player_info.name])
+            return
+
         try:
             if path.exists(self.save_path):
                 remove(self.save_path)
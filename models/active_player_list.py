@@ -1,53 +1,108 @@
 """This file contains the ActivePlayerList class and all of its related functions."""
 
 import os
-import yaml
 
 from .active_player import ActivePlayer
 from .player import Player
 from .player_list import PlayerList
+from .library_loader import load_library
+from .tournament_snapshot import load_snapshot, save_snapshot, snapshot_is_current
 
 PLAYER_LIB_PATH = '\\Users\\sammo\Mosley_Open_v4\\playerlib'
 DATA_LIB_PATH = '\\Users\\sammo\Mosley_Open_v4\\active_data_lib\\active_players'
 
 class ActivePlayerList:
 
-    def __init__(self, player_list_model: PlayerList):
-        self.active_player_list = self._load_player_list(player_list_model)
+    def __init__(self, player_list_model: PlayerList, store=None, journal=None, snapshot_path: str=None):
+        self.store = store
+        self.journal = journal
+        self.snapshot_path = snapshot_path
+        # The Player data each active player was last reconciled with, by player name. Edits to
+        # the library are made to the shared Player objects, so they are compared against this.
+        self.reconciled_player_info = dict()
+        if journal is not None and journal.has_state:
+            # The journal is the latest record of every score, so there are no files to read.
+            self.active_player_list = journal.rebuild_active_players(player_list_model.player_list)
+            self.reconciled_player_info = {player_name: dict(active_player_model.player_info.__dict__)
+                                           for player_name, active_player_model in self.active_player_list.items()}
+        else:
+            self.active_player_list = self._load_player_list(player_list_model)
+            self.refresh_player_list(player_list_model)
 
     def _load_player_list(self, player_list_model):
+        """Load every saved active player, from the store in one query or from the data library."""
+        if self.store is not None:
+            return self.store.load_active_players()
 
-        player_dict = dict()
+        # A snapshot written since the data library last changed holds the same players, and is
+        # read in a fraction of the time.
+        if self.snapshot_path is not None and snapshot_is_current(self.snapshot_path, DATA_LIB_PATH):
+            return load_snapshot(self.snapshot_path)
+
+        player_names = list(player_list_model.player_list)
+        active_player_paths = [os.path.join(DATA_LIB_PATH, f'{player_name}_active.yaml') for player_name in player_names]
+        active_player_models = load_library(active_player_paths, ActivePlayer, missing_ok=True)
+        return {player_name: active_player_model for player_name, active_player_model in zip(player_names, active_player_models)
+                if active_player_model is not None}
+
+    def reconcile(self, player_list_model):
+        """Bring the active players in line with the player library. Players who were activated
+        are added, players who were deactivated or deleted are removed, and players whose Player
+        data changed are given the new data while keeping every Day already entered. Returns the
+        (added, updated, removed) active players."""
+        added, updated, removed = [], [], []
         for player_name, player in player_list_model.player_list.items():
-            active_player_path = os.path.join(DATA_LIB_PATH, f'{player_name}_active.yaml')
-            active_player_model = None
-            try:
-                with open(active_player_path, 'r') as file:
-                    active_player_model = yaml.load(file, Loader=yaml.Loader)
-                
-                if not player.active:
-                    active_player_model.delete()
-                    active_player_model = None
-                elif active_player_model.player_info.__dict__ != player.__dict__:
-                    active_player_model.delete()
-                    active_player_model = ActivePlayer(player)
-                    active_player_model.save()
-            except FileNotFoundError:
-                if player.active:
-                    active_player_model = ActivePlayer(player)
-                    active_player_model.save()
-
-            if active_player_model:
-                player_dict[active_player_model.player_info.name] = active_player_model
-
-        return player_dict
+            active_player_model = self.active_player_list.get(player_name)
+            if not player.active:
+                if active_player_model is not None:
+                    removed.append(self.active_player_list.pop(player_name))
+                    self.reconciled_player_info.pop(player_name, None)
+                continue
+
+            if active_player_model is None:
+                active_player_model = ActivePlayer(player)
+                self.active_player_list[player_name] = active_player_model
+                added.append(active_player_model)
+            elif self.reconciled_player_info.get(player_name, active_player_model.player_info.__dict__) != player.__dict__:
+                updated.append(active_player_model)
+            active_player_model.player_info = player
+            self.reconciled_player_info[player_name] = dict(player.__dict__)
+
+        for player_name in set(self.active_player_list) - set(player_list_model.player_list):
+            removed.append(self.active_player_list.pop(player_name))
+            self.reconciled_player_info.pop(player_name, None)
+
+        return added, updated, removed
+
+    def save_snapshot(self):
+        """Write the active players to the snapshot, if one is in use, so the next start can skip
+        reading the data library. Every save to the data library must have landed first. A store or
+        journal is already the record the tournament starts from, so no snapshot is kept beside one."""
+        if self.snapshot_path is not None and self.store is None and self.journal is None:
+            save_snapshot(self.snapshot_path, self.active_player_list, DATA_LIB_PATH)
 
     def destroy_player_list(self):
         """Remove all active player objects from the active data library."""
+        if self.store is not None:
+            self.store.delete_active_players(list(self.active_player_list))
+            return
+
         for active_player_model in self.active_player_list.values():
             active_player_model.delete()
     
     def refresh_player_list(self, player_list_model):
-        """Refresh the active player list model to get updated/new data."""
-        self.destroy_player_list()
-        self.active_player_list = self._load_player_list(player_list_model)
\ No newline at end of file
+        """Refresh the active player list model to get updated/new data. Only the players that
+        were added, changed or removed are written to or deleted from the data library, and they
+        are returned as with reconcile."""
+        added, updated, removed = self.reconcile(player_list_model)
+        if self.store is not None:
+            self.store.delete_active_players([active_player_model.player_info.name for active_player_model in removed])
+            self.store.save_active_players(added + updated)
+            return added, updated, removed
+
+        for active_player_model in removed:
+            if os.path.exists(active_player_model.save_path):
+                active_player_model.delete()
+        for active_player_model in added + updated:
+            active_player_model.save()
+        return added, updated, removed
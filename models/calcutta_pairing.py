@@ -0,0 +1,51 @@
+"""This file contains the functions used to pair ranked players into Calcutta teams."""
+
+from numpy import array, inf
+
+from .calcutta_team import calculate_field_team_points
+
+BEST_WITH_WORST = 'best_with_worst'
+BALANCED = 'balanced'
+PAIRING_MODES = (BEST_WITH_WORST, BALANCED)
+
+
+def pair_best_with_worst(player_count: int):
+    """Pair the best ranked player with the worst, the second best with the second worst, and
+    so on. The players must already be ranked, and an odd field must already hold its doubled player."""
+    return [(i, player_count - 1 - i) for i in range(player_count) if i < 0.5 * player_count]
+
+
+def pair_balanced(net_score_matrix, modifiers):
+    """Pair ranked players so the projected team points are close to even.
+
+    Each row of the net score matrix and modifiers belongs to one player, best ranked first. The
+    top half of the field is matched against the bottom half by solving an assignment problem
+    over the projected best ball points of every possible pair. The cost of a pair is the squared
+    distance of its points from the mean over every candidate pair, not from the teams actually
+    formed, so it pulls each team towards an average team rather than minimising the spread of
+    the chosen teams directly. In an odd field the middle ranked player is given two partners.
+    Returns a list of (row, row) pairs, which is empty for a field of fewer than two players."""
+
+    player_count = len(net_score_matrix)
+    if player_count < 2:
+        return []
+
+    # Imported here so scipy is only required when the balanced pairing is used.
+    from scipy.optimize import linear_sum_assignment
+
+    rows = list(range(player_count))
+    if player_count % 2 != 0:
+        rows.insert(player_count // 2, player_count // 2)
+
+    top_half = rows[:len(rows) // 2]
+    bottom_half = rows[len(rows) // 2:]
+    team_index = [[i, j] for i in top_half for j in bottom_half]
+    projected_points = calculate_field_team_points(net_score_matrix, modifiers, team_index)
+    projected_points = projected_points.reshape(len(top_half), len(bottom_half))
+
+    cost = (projected_points - projected_points.mean())**2.0
+    # A doubled player can not be their own partner.
+    cost[array(top_half)[:, None] == array(bottom_half)] = inf
+    top_rows, bottom_rows = linear_sum_assignment(cost)
+
+    return [(top_half[i], bottom_half[j]) for i, j in zip(top_rows, bottom_rows)]
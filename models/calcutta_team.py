@@ -1,12 +1,32 @@
 """This file contains the CalcuttaTeam class and all of its related functions."""
 
-import yaml
 from os import path, remove
-from numpy import array
+from numpy import array, asarray, minimum
+from . import yaml_codec
 
 DATA_LIB_DIR = 'active_data_lib'
 COURSE_LENGTH = 18
 
+
+def calculate_hole_points(player_1_hole, player_2_hole):
+    """Calculate a team's points on a single hole from each partner's (net score, modifier) pair."""
+    return 2-min(player_1_hole[0], player_2_hole[0])+player_1_hole[1]+player_2_hole[1]
+
+
+def calculate_field_team_points(net_score_matrix, modifiers, team_index):
+    """This function will calculate the daily points of every team at once. Each row of the team
+    index holds the rows of the two partners in the net score matrix and modifiers."""
+
+    net_score_matrix = asarray(net_score_matrix, dtype=int)
+    modifiers = asarray(modifiers, dtype=int)
+    team_index = asarray(team_index, dtype=int).reshape(-1, 2)
+
+    team_score_matrix = minimum(net_score_matrix[team_index[:, 0]], net_score_matrix[team_index[:, 1]])
+    point_matrix = -1*team_score_matrix+2
+    return point_matrix.sum(axis=1)+modifiers[team_index[:, 0]]+modifiers[team_index[:, 1]]-36
+
+
+@yaml_codec.register_model
 class CalcuttaTeam:
 
     def __init__(self, player_1: str, player_2: str):
@@ -21,7 +41,7 @@ class CalcuttaTeam:
 
     @property
     def total_points(self):
-        return sum(list(self.days.values()))
+        return sum(filter(None, self.days.values()))
     
     def calculate_scores(self, player_1_scores, player_1_modifiers, player_2_scores, player_2_modifiers, day):
         if day not in self.days:
@@ -30,15 +50,42 @@ class CalcuttaTeam:
         team_score_list = [min(player_1_scores[i], player_2_scores[i]) for i in range(COURSE_LENGTH)]
         point_list = -1*array(team_score_list)+2
         self.days[day] = int(sum(point_list)+player_1_modifiers+player_2_modifiers)-36
+
+    @classmethod
+    def calculate_field_scores(cls, teams, net_score_matrix, modifiers, team_index, day):
+        """Calculate the scores of every team for the day in a single vectorized pass."""
+        if any(day not in team.days for team in teams):
+            raise KeyError(f"Invalid day string.")
+
+        team_points = calculate_field_team_points(net_score_matrix, modifiers, team_index)
+        for team, points in zip(teams, team_points):
+            team.days[day] = int(points)
     
-    def save(self):
+    def update_hole(self, day, old_hole_points, new_hole_points):
+        """Adjust the team's score for the day by the change in points on a single hole. A day
+        with no holes played is worth -36 points."""
+        if day not in self.days:
+            raise KeyError(f"Invalid day string.")
+
+        day_points = -36 if self.days[day] is None else self.days[day]
+        self.days[day] = day_points + new_hole_points - old_hole_points
+
+    def save(self, store=None):
+        if store is not None:
+            store.save_calcutta_teams([self])
+            return
+
         try:
             with open(self.save_path, 'w') as calcutta_file:
-                yaml.dump(self, calcutta_file)
+                yaml_codec.dump(self, calcutta_file)
         except Exception as e:
             raise IOError(f"Failed to save player: {e}")
         
-    def delete(self):
+    def delete(self, store=None):
+        if store is not None:
+            store.delete_calcutta_teams([self])
+            return
+
         try:
             if path.exists(self.save_path):
                 remove(self.save_path)
@@ -1,14 +1,17 @@
 """This file contains the Course class and the associated functions needed for creating,
 saving, and loading a course."""
 
-import yaml
 from os import path, remove
+from numpy import arange, array
 
 from .observable_model import ObservableModel
+from . import yaml_codec
 
 COURSE_LENGTH = 18
 COURSE_DIR = 'courselib'
+MAX_DOT_HANDICAP = 3*COURSE_LENGTH
 
+@yaml_codec.register_model
 class Course(ObservableModel):
     """This class contains all of the information specific to a course, and the functions
     needed for saving the course to the course library."""
@@ -24,6 +27,38 @@ class Course(ObservableModel):
         self.par_order = course_par
         self.handicap_order = course_handicap
         self.save_path = path.abspath(f'courselib/{self.name}.yaml')
+        self.invalidate_scoring_tables()
+
+    def __getstate__(self):
+        # The scoring tables are rebuilt on demand, so they are never written to the course library.
+        state = self.__dict__.copy()
+        state.pop('_par_array', None)
+        state.pop('_dot_table', None)
+        return state
+
+    @property
+    def par_array(self):
+        """A read-only array of the par for each hole, built once on first use."""
+        if getattr(self, '_par_array', None) is None:
+            self._par_array = array(self.par_order, dtype=int)
+            self._par_array.flags.writeable = False
+        return self._par_array
+
+    @property
+    def dot_table(self):
+        """A read-only (handicap x hole) table of the strokes given on each hole for every
+        handicap from 0 to 54, built once on first use."""
+        if getattr(self, '_dot_table', None) is None:
+            handicaps = arange(MAX_DOT_HANDICAP+1).reshape(-1, 1)
+            handicap_order = array(self.handicap_order, dtype=int)
+            self._dot_table = (handicaps >= handicap_order).astype(int) + (handicaps - COURSE_LENGTH >= handicap_order)
+            self._dot_table.flags.writeable = False
+        return self._dot_table
+
+    def invalidate_scoring_tables(self):
+        """Discard the cached par array and dot table so they are rebuilt from the current course data."""
+        self._par_array = None
+        self._dot_table = None
 
     def _validate_course_name(self, course_name):
         if not isinstance(course_name, str):
@@ -40,19 +75,27 @@ class Course(ObservableModel):
         if not all([isinstance(hole, int) for hole in course_data]):
             msg = f"Course {data_type} must contain only int type values."
 
-    def save(self):
-        """Save the Course object to the course library as a YAML file."""
+    def save(self, store=None):
+        """Save the Course object to the course library as a YAML file, or to the store if one is given."""
+
+        if store is not None:
+            store.save_courses([self])
+            return
 
         try:
             with open(self.save_path, 'w') as course_file:
-                yaml.dump(self, course_file)
+                yaml_codec.dump(self, course_file)
             self.trigger_event('save')
         except Exception as e:
             raise IOError(f"Failed to save course: {e}")
 
 
-    def delete(self):
-        """Delete the course file from the course library"""
+    def delete(self, store=None):
+        """Delete the course file from the course library, or the course from the store if one is given."""
+        if store is not None:
+            store.delete_courses([self.name])
+            return
+
         try:
             if path.exists(self.save_path):
                 remove(self.save_path)
@@ -1,37 +1,29 @@
 """This file contains the CourseList model class and the associated functions needed
 for handling it."""
 
-import os
-import yaml
-
 from .observable_model import ObservableModel
 from .course import Course
+from .course_registry import course_registry
+from .library_manifest import LibraryManifest
 
 COURSE_LIB_PATH = '\\Users\\sammo\Mosley_Open_v4\\courselib'
 
 class CourseList(ObservableModel):
     """Model for maintaining and processing a list of all courses within the course library."""
 
-    def __init__(self):
+    def __init__(self, store=None):
+        self.store = store
+        self.manifest = LibraryManifest(COURSE_LIB_PATH, Course, lambda course: course.name)
         self.course_list = self._load_course_library()
 
     def _load_course_library(self):
-        course_dict = dict()
-        for filename in os.listdir(COURSE_LIB_PATH):
-
-            if not filename.endswith('.yaml'):
-                continue
-
-            filepath = os.path.join(COURSE_LIB_PATH, filename)
-            with open(filepath, 'r') as file:
-                course_model = yaml.load(file, Loader=yaml.Loader)
-
-            if not isinstance(course_model, Course):
-                raise TypeError(f"Invalid Course File at {filepath}.")
-            
-            course_dict[course_model.name] = course_model
+        """Load the course library. After the first load only the course files added or changed
+        since the last load are read. Every course is merged into the course registry, so the
+        days played on a course share the same instance."""
+        if self.store is not None:
+            return self.store.load_courses()
 
-        return course_dict
+        return {name: course_registry.update(course) for name, course in self.manifest.refresh().items()}
     
     def refresh_course_list(self):
         """Refresh the course list model to get updated/new data then trigger an event."""
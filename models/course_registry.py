@@ -0,0 +1,79 @@
+"""This file contains the CourseRegistry class, which keeps one shared Course instance for every
+course so that the days played on a course can refer to it by id rather than holding a copy."""
+
+import os
+
+from .course import Course
+from . import yaml_codec
+
+
+class CourseRegistry:
+    """A table of the Course every course id resolves to. A course's id is its name, which is
+    also the name it is listed and saved under in the course library.
+
+    Courses loaded from the library are merged into the instance already registered, so every Day
+    that refers to a course sees it as it was last saved. A course id that has not been registered
+    is looked up in the course library the first time it is resolved."""
+
+    def __init__(self):
+        self._courses = dict()
+
+    def __contains__(self, course_id):
+        return course_id in self._courses
+
+    def __len__(self):
+        return len(self._courses)
+
+    def register(self, course: Course):
+        """Make the course the instance its id resolves to."""
+        if not isinstance(course, Course):
+            raise TypeError(f"Input {course} must be of Type {Course}.")
+        self._courses[course.name] = course
+        return course
+
+    def intern(self, course: Course):
+        """Get the registered instance of the course, registering the course if there is none."""
+        registered_course = self._courses.get(course.name)
+        if registered_course is None:
+            return self.register(course)
+        return registered_course
+
+    def update(self, course: Course):
+        """Copy a freshly loaded course into the registered instance, so the days already
+        referring to it are never left with a stale copy, and return the registered instance."""
+        registered_course = self.intern(course)
+        if registered_course is not course and (
+                registered_course.par_order != course.par_order or
+                registered_course.handicap_order != course.handicap_order or
+                registered_course.save_path != course.save_path):
+            registered_course.par_order = course.par_order
+            registered_course.handicap_order = course.handicap_order
+            registered_course.save_path = course.save_path
+            registered_course.invalidate_scoring_tables()
+        return registered_course
+
+    def get(self, course_id):
+        """Resolve a course id to its shared Course instance."""
+        course = self._courses.get(course_id)
+        if course is None:
+            course = self.register(self._load_course(course_id))
+        return course
+
+    def _load_course(self, course_id):
+        # Imported here since the course list imports the library loader, which imports every model.
+        from .course_list import COURSE_LIB_PATH
+
+        course_path = os.path.join(COURSE_LIB_PATH, f'{course_id}.yaml')
+        if not os.path.exists(course_path):
+            raise KeyError(f"Course {course_id} is not in the course library.")
+        with open(course_path, 'r') as course_file:
+            course = yaml_codec.load(course_file)
+        if not isinstance(course, Course):
+            raise TypeError(f"Invalid Course File at {course_path}.")
+        return course
+
+    def clear(self):
+        self._courses.clear()
+
+
+course_registry = CourseRegistry()
@@ -1,85 +1,283 @@
 """This file contains the Day class and all of its related functions."""
 
-from numpy import array, count_nonzero
+from numpy import array, asarray, frombuffer, minimum, nonzero, uint8, where
 
-from .course import Course
+from .course import Course, MAX_DOT_HANDICAP
+from .course_registry import course_registry
+from . import yaml_codec
 
 COURSE_LENGTH = 18
 
+# Define score mapping of Stableford System
+STABLEFORD_CONVERSION = {
+    3 : -1,
+    2 : 0,
+    1 : 1,
+    0 : 2,
+    -1 : 4,
+    -2 : 6,
+    -3 : 8,
+    -4 : 12
+}
+
+# Lookup table for the Stableford System, indexed by net score plus the offset.
+STABLEFORD_OFFSET = -min(STABLEFORD_CONVERSION)
+STABLEFORD_TABLE = array([STABLEFORD_CONVERSION[net_score - STABLEFORD_OFFSET]
+                          for net_score in range(len(STABLEFORD_CONVERSION))])
+
+
+class InvalidScoreError(KeyError):
+    """Raised when one or more holes hold a score the Stableford System can not convert.
+    Every invalid hole is kept in invalid_holes as a (player index, hole index, score) tuple."""
+
+    def __init__(self, invalid_holes):
+        self.invalid_holes = invalid_holes
+        hole_strs = [f"score of {score} on Hole {hole+1} for player {player+1}"
+                     for player, hole, score in invalid_holes]
+        super().__init__(f"Invalid {', '.join(hole_strs)}")
+
+    def __str__(self):
+        return self.args[0]
+
+
+def calculate_field_points(score_matrix, par_order, played=None):
+    """This function will calculate the stableford points for a whole field at once. The score matrix
+    holds one row of 18 raw scores per player, and one point total is returned per row. An optional
+    boolean matrix of the holes played can be given, and holes not played earn no points."""
+
+    score_matrix = asarray(score_matrix, dtype=int)
+    par_array = asarray(par_order, dtype=int)
+    if score_matrix.ndim != 2 or score_matrix.shape[1] != COURSE_LENGTH:
+        raise ValueError(f"Score matrix must have {COURSE_LENGTH} holes per player, got shape {score_matrix.shape}.")
+
+    net_score_matrix = score_matrix - par_array + STABLEFORD_OFFSET
+
+    # Verify that every score is possible and in the lookup table.
+    invalid = (net_score_matrix < 0) | (net_score_matrix >= len(STABLEFORD_TABLE)) | (score_matrix <= 0)
+    if played is not None:
+        played = asarray(played, dtype=bool)
+        invalid &= played
+    if invalid.any():
+        players, holes = nonzero(invalid)
+        raise InvalidScoreError([(int(player), int(hole), int(score_matrix[player, hole]))
+                                 for player, hole in zip(players, holes)])
+
+    if played is not None:
+        return where(played, STABLEFORD_TABLE[net_score_matrix.clip(0, len(STABLEFORD_TABLE)-1)], 0).sum(axis=1)
+    return STABLEFORD_TABLE[net_score_matrix].sum(axis=1)
+
+
+def calculate_field_calcutta_scores(score_matrix, par_order, dot_matrix, played=None):
+    """This function will generate the Calcutta net scores and modifiers for a whole field at once.
+    The par order may be shared by the whole field or given as one row per player, and the dot
+    matrix holds one row of hole modifiers per player. Holes left out of the optional played
+    matrix earn no modifiers and are given the worst net score."""
+
+    net_score_matrix = asarray(score_matrix, dtype=int) - asarray(par_order, dtype=int)
+    if played is not None:
+        played = asarray(played, dtype=bool)
+        net_score_matrix = where(played, net_score_matrix, 0)
+    # Only the bonus points for holes under par are counted. Deducting a point for each triple
+    # bogey would change the Calcutta totals of past events, so it waits on the tournament rules.
+    modifiers = -(net_score_matrix * (net_score_matrix < 0)).sum(axis=1)
+
+    # A net triple bogey is capped at a double bogey once the dots are applied.
+    net_score_matrix = minimum(net_score_matrix - asarray(dot_matrix, dtype=int), 2)
+
+    if played is not None:
+        net_score_matrix = where(played, net_score_matrix, 2)
+
+    return net_score_matrix, modifiers
+
+
+def stack_scores(days):
+    """Stack the packed scores of the days into one (days x 18) matrix, with zero for a hole not played."""
+    return frombuffer(b''.join(day.scores for day in days), dtype=uint8).reshape(-1, COURSE_LENGTH)
+
+
+def calculate_days_calcutta_scores(days, handicaps):
+    """Generate the Calcutta net scores and modifiers of a whole field from each player's Day and
+    Twisted Creek handicap, reading every score column straight from the packed scores."""
+    score_matrix = stack_scores(days)
+    played = score_matrix > 0
+    par_matrix = array([day.course.par_array for day in days]).reshape(-1, COURSE_LENGTH)
+    dot_matrix = array([day.generate_dots(handicap) for day, handicap in zip(days, handicaps)]).reshape(-1, COURSE_LENGTH)
+    return calculate_field_calcutta_scores(where(played, score_matrix, par_matrix), par_matrix, dot_matrix, played)
+
+
+def pack_scores(score_list):
+    """Pack a list of raw scores into one byte per hole, with zero for a hole not played."""
+    if isinstance(score_list, list) and None not in score_list:
+        # A full round of ordinary scores is packed in one step.
+        try:
+            scores = bytes(score_list)
+        except (TypeError, ValueError):
+            scores = None
+        if scores is not None and 0 not in scores:
+            return scores
+
+    invalid_holes = [(hole, score) for hole, score in enumerate(score_list) if score is not None and not 0 < score < 256]
+    if invalid_holes:
+        hole_strs = [f"score of {score} on Hole {hole+1}" for hole, score in invalid_holes]
+        raise KeyError(f"Invalid {', '.join(hole_strs)}")
+    return bytes([0 if score is None else int(score) for score in score_list])
+
+
+@yaml_codec.register_model
 class Day:
+    """A player's round on a course. The raw scores are packed one byte per hole, so a field of
+    days can be stacked into a single score matrix without going through Python lists."""
+
+    __slots__ = ('_course', 'course_id', 'scores', 'points')
 
-    def __init__(self, course: Course, score_list: list):
+    def __init__(self, course: Course, score_list: list, points: int=None):
         self.course = course
         self.raw_score_list = score_list
-        self.points = self.calculate_points()
+        self.points = self.calculate_points() if points is None else points
+
+    def __getstate__(self):
+        # The course is saved by id, and is registered so the day can be loaded again in this session.
+        course_registry.intern(self.course)
+        return {'course_id': self.course_id, 'raw_score_list': self.raw_score_list, 'points': self.points}
+
+    def __setstate__(self, state):
+        self.raw_score_list = state['raw_score_list']
+        self.points = state['points']
+        if 'course' in state:
+            # Days saved before courses were interned hold their own copy of the course.
+            self.course = course_registry.intern(state['course'])
+        else:
+            # The course is resolved on first use, so days can be parsed before the course list is loaded.
+            self.course_id = state['course_id']
+            self._course = None
+
+    @property
+    def raw_score_list(self):
+        """The raw score of every hole, or None for a hole not played yet."""
+        return [score or None for score in self.scores]
+
+    @raw_score_list.setter
+    def raw_score_list(self, score_list: list):
+        self.scores = pack_scores(score_list)
+
+    @property
+    def course(self):
+        """The shared Course instance the day was played on."""
+        if self._course is None:
+            self._course = course_registry.get(self.course_id)
+        return self._course
+
+    @course.setter
+    def course(self, course: Course):
+        self.course_id = course.name
+        self._course = course
+
+    @classmethod
+    def empty(cls, course: Course):
+        """Create a Day with no holes played, to be filled in hole by hole."""
+        return cls(course, [None]*COURSE_LENGTH, 0)
+
+    @classmethod
+    def from_scores(cls, course: Course, scores: bytes, points: int):
+        """Create a Day from raw scores already packed one byte per hole, with the points they earned."""
+        day = cls.__new__(cls)
+        day.course = course
+        day.scores = scores
+        day.points = points
+        return day
+
+    @classmethod
+    def from_field(cls, course: Course, score_lists: list):
+        """Create a Day for every score list in the field, scoring the whole field in one pass. Every
+        score is checked while scoring, so the field is packed as a whole."""
+        score_matrix = asarray(score_lists, dtype=int)
+        field_points = calculate_field_points(score_matrix, course.par_array).tolist()
+        packed_scores = score_matrix.astype(uint8).tobytes()
+        return [cls.from_scores(course, packed_scores[row*COURSE_LENGTH:(row+1)*COURSE_LENGTH], points)
+                for row, points in enumerate(field_points)]
 
     @property
     def total_raw_score(self):
         """A property used to calculate the total raw score for the day."""
-        return sum(self.raw_score_list)
+        return sum(self.scores)
+
+    @property
+    def thru(self):
+        """A property used to get the number of holes played so far."""
+        return COURSE_LENGTH - self.scores.count(0)
+
+    @property
+    def played(self):
+        """A property used to get which holes have been played."""
+        return [score > 0 for score in self.scores]
+
+    @property
+    def filled_score_list(self):
+        """A property used to get the raw scores with par standing in for any hole not played yet."""
+        return [score or par for score, par in zip(self.scores, self.course.par_order)]
+
+    def set_hole(self, hole: int, strokes: int):
+        """Set or clear (with None) the score of a single hole. Only that hole is re-scored, and the
+        change in points and raw score is returned."""
+
+        if not 0 <= hole < COURSE_LENGTH:
+            raise ValueError(f"Hole {hole+1} must be between 1 and {COURSE_LENGTH}.")
+
+        old_strokes = self.scores[hole] or None
+        old_points = self.get_hole_points(hole)
+        if strokes is not None:
+            net_score = strokes - self.course.par_array[hole]
+            if net_score not in STABLEFORD_CONVERSION or strokes <= 0:
+                raise KeyError(f"Invalid score of {strokes} on Hole {hole+1}")
+
+        self.scores = self.scores[:hole] + bytes([strokes or 0]) + self.scores[hole+1:]
+        points_delta = self.get_hole_points(hole) - old_points
+        self.points += points_delta
+
+        return points_delta, (strokes or 0) - (old_strokes or 0)
+
+    def get_hole_points(self, hole: int):
+        """Get the stableford points earned on a single hole."""
+        strokes = self.scores[hole]
+        if not strokes:
+            return 0
+        return STABLEFORD_CONVERSION[int(strokes - self.course.par_array[hole])]
+
+    def get_calcutta_hole(self, hole: int, handicap: int):
+        """Get the Calcutta net score and modifier for a single hole."""
+        net_score_matrix, modifiers = calculate_field_calcutta_scores(
+            [[self.filled_score_list[hole]]], self.course.par_array[hole], [[self.generate_dots(handicap)[hole]]],
+            [[self.played[hole]]])
+
+        return int(net_score_matrix[0, 0]), int(modifiers[0])
 
     def get_calcutta_scores(self, handicap: int):
         """This function will accept a handicap and generate the net scores after applying
         the handicap to the raw scores."""
-        hole_modifiers = self.generate_dots(handicap)
-        net_score_list = list(array(self.raw_score_list)-array(self.course.par_order))
-        bonus_points = sum(-score for score in net_score_list if score<0)
-        deductions = count_nonzero(net_score_list == 3)
-        modifiers = bonus_points - deductions
-        net_score_list = list(array(net_score_list)-array(hole_modifiers))
-        for i, score in enumerate(net_score_list):
-            if score == 3:
-                net_score_list[i] = 2
-
-        return net_score_list, modifiers
+        net_score_matrix, modifiers = calculate_field_calcutta_scores(
+            [self.filled_score_list], self.course.par_array, [self.generate_dots(handicap)], [self.played])
+
+        return net_score_matrix[0].tolist(), int(modifiers[0])
 
     def generate_dots(self, handicap: int):
         """This function will calculate the hole by hole modifiers for a given course.
         These modifiers are applied to the player's raw score for the Calcutta."""
 
-        handicap_order = self.course.handicap_order
-        hole_modifiers = []
-        for hole in handicap_order:
-            if (handicap - COURSE_LENGTH - hole) >= 0:
-                hole_modifiers.append(2)
-            elif (handicap - hole) >= 0:
-                hole_modifiers.append(1)
-            else:
-                hole_modifiers.append(0)
-
-        if len(hole_modifiers) != COURSE_LENGTH:
-            raise ValueError("Not enough holes provided for hole modifier calculations.")
-        
-        return hole_modifiers
+        if not 0 <= handicap <= MAX_DOT_HANDICAP:
+            raise ValueError(f"Handicap {handicap} must be between 0 and {MAX_DOT_HANDICAP}.")
+
+        return self.course.dot_table[handicap]
     
     def calculate_points(self):
         """This function will calculate the number of points earned using the stableford system."""
 
-        # Define score mapping of Stableford System
-        stableford_conversion = {
-            3 : -1,
-            2 : 0,
-            1 : 1,
-            0 : 2,
-            -1 : 4,
-            -2 : 6,
-            -3 : 8,
-            -4 : 12
-        }
-
-        net_score_list = array(self.raw_score_list) - array(self.course.par_order)
-
-        # Begin calculating the dogfight score
-        points = 0
-        for hole, net_score in enumerate(net_score_list):
-            
-            # Verify that the score is possible and in the dictionary.
-            if net_score not in stableford_conversion or self.course.par_order[hole]+net_score <= 0:
-                raise KeyError(f"Invalid score of {self.score_list[hole]} on Hole {hole+1}")
-
-            points += stableford_conversion[net_score]
-        
-        return points
+        try:
+            points = calculate_field_points([self.filled_score_list], self.course.par_array, [self.played])
+        except InvalidScoreError as e:
+            hole_strs = [f"score of {score} on Hole {hole+1}" for _, hole, score in e.invalid_holes]
+            raise KeyError(f"Invalid {', '.join(hole_strs)}")
+
+        return int(points[0])
     
     def get_net_points(self, handicap: int):
         return self.points - (36-handicap)
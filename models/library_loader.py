@@ -0,0 +1,60 @@
+"""This file contains the functions used to load a whole library directory in one parallel step.
+Files are read on a thread pool, since startup is dominated by file I/O on network storage, and
+can optionally be parsed on a process pool."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from . import yaml_codec
+# Every model class must be registered with the codec before a worker process can parse it.
+from . import active_player, calcutta_team, course, day, player
+
+READ_THREADS = 16
+PARSE_PROCESSES = None
+PARSE_CHUNK_SIZE = 64
+
+
+def read_file(filepath, missing_ok: bool=False):
+    """Read a library file, returning None for a missing file when missing_ok is set."""
+    try:
+        with open(filepath, 'r') as file:
+            return file.read()
+    except FileNotFoundError:
+        if missing_ok:
+            return None
+        raise
+
+
+def read_files(filepaths, missing_ok: bool=False, threads: int=READ_THREADS):
+    """Read every file at once on a thread pool, returning their contents in order."""
+    if threads and threads > 1 and len(filepaths) > 1:
+        with ThreadPoolExecutor(min(threads, len(filepaths))) as executor:
+            return list(executor.map(partial(read_file, missing_ok=missing_ok), filepaths))
+    return [read_file(filepath, missing_ok) for filepath in filepaths]
+
+
+def parse_model(text):
+    return None if text is None else yaml_codec.load(text)
+
+
+def parse_files(texts, processes: int=PARSE_PROCESSES):
+    """Parse the file contents into models, on a process pool when processes is set and there
+    are enough files to be worth sending to the workers."""
+    if processes and processes > 1 and len(texts) > PARSE_CHUNK_SIZE:
+        with ProcessPoolExecutor(processes) as executor:
+            return list(executor.map(parse_model, texts, chunksize=PARSE_CHUNK_SIZE))
+    return [parse_model(text) for text in texts]
+
+
+def load_library(filepaths, model_class, missing_ok: bool=False, threads: int=READ_THREADS,
+                 processes: int=PARSE_PROCESSES):
+    """Load the model in each file, in order. Every file must hold an instance of the model class,
+    and with missing_ok set a missing file loads as None."""
+    filepaths = list(filepaths)
+    models = parse_files(read_files(filepaths, missing_ok, threads), processes)
+    for filepath, model in zip(filepaths, models):
+        if model is None and missing_ok:
+            continue
+        if not isinstance(model, model_class):
+            raise TypeError(f"Invalid {model_class.__name__} File at {filepath}.")
+    return models
@@ -0,0 +1,53 @@
+"""This file contains the LibraryManifest class, which lets a library directory be refreshed by
+re-parsing only the files that were added or changed since the last scan."""
+
+import os
+from collections import namedtuple
+
+from .library_loader import load_library
+
+ManifestEntry = namedtuple('ManifestEntry', ['mtime_ns', 'size', 'key'])
+
+
+class LibraryManifest:
+    """An index of every model file in a library directory, recording each file's modification
+    time, size and the key its model is listed under. The index is kept in memory alongside the
+    loaded models, since every model has to be parsed at startup anyway."""
+
+    def __init__(self, library_path: str, model_class, get_key):
+        self.library_path = library_path
+        self.model_class = model_class
+        self.get_key = get_key
+        self.entries = dict()
+        self.models = dict()
+
+    def scan(self):
+        """Get the (path, mtime, size) of every model file currently in the library."""
+        files = dict()
+        for entry in os.scandir(self.library_path):
+            if not entry.name.endswith('.yaml'):
+                continue
+            stat = entry.stat()
+            files[entry.name] = (entry.path, stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def refresh(self):
+        """Scan the library, parse only the added and changed files, forget the removed ones, and
+        return every model keyed as in the library lists."""
+        files = self.scan()
+        changed_files = [
+            filename for filename, (_, mtime_ns, size) in files.items()
+            if filename not in self.entries or self.entries[filename][:2] != (mtime_ns, size)
+        ]
+        changed_models = load_library([files[filename][0] for filename in changed_files], self.model_class)
+
+        for filename in set(self.entries) - set(files):
+            del self.entries[filename]
+            del self.models[filename]
+
+        for filename, model in zip(changed_files, changed_models):
+            _, mtime_ns, size = files[filename]
+            self.entries[filename] = ManifestEntry(mtime_ns, size, self.get_key(model))
+            self.models[filename] = model
+
+        return {self.entries[filename].key: self.models[filename] for filename in files}
@@ -1,12 +1,13 @@
 """This file contains the Player class and all of its related functions."""
 
-import yaml
 from os import path, remove
 
 from .observable_model import ObservableModel
+from . import yaml_codec
 
 PLAYER_LIB_DIR = 'playerlib'
 
+@yaml_codec.register_model
 class Player(ObservableModel):
     """An object to represent all of the data and logic unique to a player."""
 
@@ -43,17 +44,25 @@ class Player(ObservableModel):
         # The Mosley Open handicap is restricted to 0-20
         self.mosley_open_handicap = min(20, handicap)
 
-    def save(self):
-        """Save the Player object to the player library as a YAML file."""
+    def save(self, store=None):
+        """Save the Player object to the player library as a YAML file, or to the store if one is given."""
+
+        if store is not None:
+            store.save_players([self])
+            return
 
         try:
             with open(self.save_path, 'w') as player_file:
-                yaml.dump(self, player_file)
+                yaml_codec.dump(self, player_file)
         except Exception as e:
             raise IOError(f"Failed to save player: {e}")
         
-    def delete(self):
-        """Delete the player file from the course library."""
+    def delete(self, store=None):
+        """Delete the player file from the course library, or the player from the store if one is given."""
+        if store is not None:
+            store.delete_players([self.name])
+            return
+
         try:
             if path.exists(self.save_path):
                 remove(self.save_path)
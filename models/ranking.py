@@ -0,0 +1,113 @@
+"""This file contains the RankingIndex class, which keeps a competition's standings sorted as scores
+are saved, and the TournamentRankings class, which holds the index of every competition."""
+
+from bisect import bisect_left, insort
+
+from .active_player import ActiveTournament
+
+DAYS = ('Day 1', 'Day 2', 'Day 3')
+
+
+class RankingIndex:
+    """A sorted index of entries from best to worst. Each entry is ranked by a tuple key where
+    larger values are better, and entries with equal keys keep the order they were first added in."""
+
+    def __init__(self):
+        self._entries = []
+        self._entry_by_name = dict()
+        self._sequence = dict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, name):
+        return name in self._entry_by_name
+
+    def update(self, name, key):
+        """Insert an entry, or move it to the position given by its new key."""
+        if name in self._entry_by_name:
+            self.remove(name)
+        sequence = self._sequence.setdefault(name, len(self._sequence))
+        entry = (tuple(-value for value in key), sequence, name)
+        insort(self._entries, entry)
+        self._entry_by_name[name] = entry
+
+    def remove(self, name):
+        """Remove an entry from the index if it is present."""
+        entry = self._entry_by_name.pop(name, None)
+        if entry is None:
+            return
+        del self._entries[bisect_left(self._entries, entry)]
+
+    def rank(self, name):
+        """Get the 1-based position of an entry."""
+        return bisect_left(self._entries, self._entry_by_name[name]) + 1
+
+    def key(self, name):
+        """Get the key an entry is currently ranked by."""
+        return tuple(-value for value in self._entry_by_name[name][0])
+
+    def top(self, n):
+        """Get the names of the best n entries."""
+        return [entry[2] for entry in self._entries[:n]]
+
+    def names(self):
+        """Get the names of every entry from best to worst."""
+        return [entry[2] for entry in self._entries]
+
+
+class TournamentRankings:
+    """The ranking indexes of the Mosley Open, the Twisted Creek, each daily dogfight and the Calcutta."""
+
+    def __init__(self):
+        self.mosley_open = RankingIndex()
+        self.twisted_creek = RankingIndex()
+        self.dogfights = {day: RankingIndex() for day in DAYS}
+        self.calcutta = RankingIndex()
+
+    @classmethod
+    def from_field(cls, active_players, calcutta_teams):
+        """Build the rankings for every ActivePlayer and CalcuttaTeam."""
+        rankings = cls()
+        for active_player in active_players:
+            rankings.update_player(active_player)
+        for team in calcutta_teams:
+            rankings.update_team(team)
+        return rankings
+
+    def update_player(self, active_player):
+        """Move a player to their current position in every competition they are part of."""
+        name = active_player.player_info.name
+
+        if active_player.active_tournament != ActiveTournament.TwistedCreek:
+            self.mosley_open.update(name, (active_player.net_mosley_open_points, active_player.total_raw_score))
+        else:
+            self.mosley_open.remove(name)
+
+        if active_player.active_tournament != ActiveTournament.MosleyOpen:
+            self.twisted_creek.update(name, (active_player.net_twisted_creek_score, active_player.total_raw_score))
+        else:
+            self.twisted_creek.remove(name)
+
+        for day, dogfight in self.dogfights.items():
+            if active_player.days[day]:
+                key = (active_player.get_twisted_creek_daily_points(day), active_player.days[day].points)
+                dogfight.update(name, key)
+            else:
+                dogfight.remove(name)
+
+    def remove_player(self, name):
+        """Remove a player from every competition."""
+        self.mosley_open.remove(name)
+        self.twisted_creek.remove(name)
+        for dogfight in self.dogfights.values():
+            dogfight.remove(name)
+
+    def update_team(self, team):
+        """Move a Calcutta team to its current position."""
+        self.calcutta.update(team_name(team), (team.total_points,))
+
+
+def team_name(team):
+    """The name a CalcuttaTeam is listed under."""
+    return f'{team.player_1} and {team.player_2}'
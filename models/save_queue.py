@@ -0,0 +1,99 @@
+"""This file contains the SaveQueue class, which writes models to the data library on a background
+thread so that saving never blocks the interface."""
+
+import atexit
+import os
+import tempfile
+import threading
+
+from . import yaml_codec
+
+
+def atomic_write(filepath, text):
+    """Write the text to a temporary file beside the target, then swap it into place, so the
+    target is never left half written."""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(filepath), prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as temp_file:
+            temp_file.write(text)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, filepath)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class SaveQueue:
+    """A write-behind queue of models waiting to be saved. Saving a model that is already queued
+    only keeps the latest request, so repeated saves of the same model become a single write, and
+    each model is serialized at the moment it is written.
+
+    Saves run on the queue's own thread. Call flush to wait for every queued write to finish, for
+    example before reading the data library or generating a leaderboard."""
+
+    def __init__(self, start: bool=True):
+        self._pending = dict()
+        self._writing = 0
+        self._errors = []
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='SaveQueue', daemon=True)
+        if start:
+            self.start()
+
+    def start(self):
+        self._thread.start()
+        # Write anything still queued before the application exits.
+        atexit.register(self.flush)
+
+    def save(self, model):
+        """Queue the model to be written to its save path."""
+        with self._condition:
+            # Move the model to the back of the queue, replacing any earlier request for it.
+            self._pending.pop(model.save_path, None)
+            self._pending[model.save_path] = model
+            self._condition.notify_all()
+
+    def save_all(self, models):
+        for model in models:
+            self.save(model)
+
+    @property
+    def pending(self):
+        with self._condition:
+            return len(self._pending) + self._writing
+
+    def flush(self, timeout: float=None):
+        """Wait until every queued save has been written. Raises IOError if any write failed
+        since the last flush."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: not self._pending and not self._writing, timeout):
+                raise IOError(f"Timed out waiting for {len(self._pending) + self._writing} saves.")
+            errors, self._errors = self._errors, []
+
+        if errors:
+            raise IOError(f"Failed to save: {'; '.join(str(error) for error in errors)}")
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                save_path = next(iter(self._pending))
+                model = self._pending.pop(save_path)
+                self._writing += 1
+
+            try:
+                atomic_write(save_path, yaml_codec.dump(model))
+            except RuntimeError:
+                # The model changed while it was being serialized. Write it again unless a newer
+                # save of it has already been queued.
+                with self._condition:
+                    self._pending.setdefault(save_path, model)
+            except Exception as e:
+                with self._condition:
+                    self._errors.append(e)
+            finally:
+                with self._condition:
+                    self._writing -= 1
+                    self._condition.notify_all()
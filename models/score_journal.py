@@ -0,0 +1,243 @@
+"""This file contains the ScoreJournal class, an append-only log of score events that the active
+players and Calcutta teams can be rebuilt from after a restart or a crash."""
+
+import atexit
+import json
+import os
+
+from .active_player import ActivePlayer, ActiveTournament
+from .calcutta_team import CalcuttaTeam
+from .course import Course
+from .course_registry import course_registry
+from .day import COURSE_LENGTH, Day, calculate_days_calcutta_scores
+from .save_queue import atomic_write
+
+JOURNAL_FILE = 'journal.jsonl'
+SNAPSHOT_FILE = 'snapshot.json'
+
+# Events are fsynced in batches of this size, and any day, cut or team event is synced at once.
+SYNC_BATCH = 32
+# The journal is compacted into a snapshot after this many events.
+SNAPSHOT_INTERVAL = 5000
+
+
+def empty_state():
+    return {'courses': {}, 'players': {}, 'teams': []}
+
+
+def apply_event(state, event):
+    """Apply a single journal event to the journal state."""
+    players = state['players']
+    event_type = event['type']
+    if event_type == 'course':
+        state['courses'][event['name']] = {'par': event['par'], 'handicap': event['handicap']}
+    elif event_type == 'day':
+        player = players.setdefault(event['player'], _new_player())
+        player['days'][event['day']] = {'course': event['course'], 'scores': list(event['scores'])}
+    elif event_type == 'hole':
+        player = players.setdefault(event['player'], _new_player())
+        day = player['days'].setdefault(event['day'], {'course': event['course'], 'scores': [None]*COURSE_LENGTH})
+        day['scores'][event['hole']] = event['strokes']
+    elif event_type == 'cut':
+        for player_name, tournament in event['tournaments'].items():
+            players.setdefault(player_name, _new_player())['tournament'] = tournament
+    elif event_type == 'teams':
+        state['teams'] = [list(team) for team in event['teams']]
+    elif event_type == 'reset':
+        for player_name in event['players']:
+            players.pop(player_name, None)
+    else:
+        raise ValueError(f"Unknown journal event type {event_type}.")
+
+
+def _new_player():
+    return {'tournament': ActiveTournament.BothTournaments.value, 'days': {}}
+
+
+class ScoreJournal:
+    """An append-only journal of score events kept beside a snapshot of the state it describes.
+
+    Every event is applied to an in-memory copy of the state as it is recorded. Events are
+    fsynced in batches, and once enough have built up the state is written out as a new
+    snapshot and the journal is started again. On startup the latest snapshot is read and only
+    the journal written after it is replayed, so recovery time depends on the journal tail
+    rather than the size of the field."""
+
+    def __init__(self, journal_path: str, sync_batch: int=SYNC_BATCH, snapshot_interval: int=SNAPSHOT_INTERVAL):
+        os.makedirs(journal_path, exist_ok=True)
+        self.journal_file_path = os.path.join(journal_path, JOURNAL_FILE)
+        self.snapshot_path = os.path.join(journal_path, SNAPSHOT_FILE)
+        self.sync_batch = sync_batch
+        self.snapshot_interval = snapshot_interval
+
+        self.state = empty_state()
+        self.sequence = 0
+        self.events_since_snapshot = 0
+        self._unsynced = 0
+        self._recover()
+        self._file = open(self.journal_file_path, 'a')
+        atexit.register(self.close)
+
+    @property
+    def has_state(self):
+        """Whether anything has ever been recorded in the journal."""
+        return self.sequence > 0
+
+    def _recover(self):
+        """Load the latest snapshot, then replay the journal events written after it. A final
+        event that was only partly written before a crash is discarded."""
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r') as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            self.state = snapshot['state']
+            self.sequence = snapshot['sequence']
+
+        if not os.path.exists(self.journal_file_path):
+            return
+
+        valid_length = 0
+        with open(self.journal_file_path, 'rb') as journal_file:
+            for line in journal_file:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break
+                valid_length += len(line)
+                if event['seq'] <= self.sequence:
+                    continue
+                apply_event(self.state, event)
+                self.sequence = event['seq']
+                self.events_since_snapshot += 1
+
+        if valid_length < os.path.getsize(self.journal_file_path):
+            with open(self.journal_file_path, 'r+b') as journal_file:
+                journal_file.truncate(valid_length)
+
+    def _append(self, event, sync: bool=False):
+        self.sequence += 1
+        event['seq'] = self.sequence
+        apply_event(self.state, event)
+        self._file.write(json.dumps(event) + '\n')
+        self._unsynced += 1
+        self.events_since_snapshot += 1
+
+        if sync or self._unsynced >= self.sync_batch:
+            self.sync()
+        if self.events_since_snapshot >= self.snapshot_interval:
+            self.compact()
+
+    def sync(self):
+        """Make every recorded event durable."""
+        if self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def compact(self):
+        """Write the current state as a new snapshot and start an empty journal. Should the
+        journal not be cleared after the snapshot is written, its events are skipped on
+        recovery since they are older than the snapshot."""
+        self.sync()
+        atomic_write(self.snapshot_path, json.dumps({'sequence': self.sequence, 'state': self.state}))
+        self._file.close()
+        self._file = open(self.journal_file_path, 'w')
+        self.events_since_snapshot = 0
+
+    def close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def record_course(self, course: Course):
+        """Record a course's layout the first time it is played, or whenever it has changed."""
+        layout = {'par': [int(par) for par in course.par_order], 'handicap': [int(hc) for hc in course.handicap_order]}
+        if self.state['courses'].get(course.name) != layout:
+            self._append({'type': 'course', 'name': course.name, **layout})
+
+    def record_day(self, player_name, day, day_model: Day, sync: bool=True):
+        """Record a player's whole round for the day."""
+        self.record_course(day_model.course)
+        scores = [None if score is None else int(score) for score in day_model.raw_score_list]
+        self._append({'type': 'day', 'player': player_name, 'day': day, 'course': day_model.course.name,
+                      'scores': scores}, sync)
+
+    def record_days(self, day, day_models: dict):
+        """Record the rounds of many players for the day, syncing once at the end."""
+        for player_name, day_model in day_models.items():
+            self.record_day(player_name, day, day_model, sync=False)
+        self.sync()
+
+    def record_hole(self, player_name, day, hole: int, strokes: int, course: Course):
+        """Record a single hole's score, or its removal when strokes is None."""
+        self.record_course(course)
+        self._append({'type': 'hole', 'player': player_name, 'day': day, 'hole': hole,
+                      'strokes': None if strokes is None else int(strokes), 'course': course.name})
+
+    def record_cut(self, active_players):
+        """Record the tournament every player was placed in by the cut."""
+        tournaments = {player.player_info.name: player.active_tournament.value for player in active_players}
+        self._append({'type': 'cut', 'tournaments': tournaments}, sync=True)
+
+    def record_teams(self, calcutta_teams):
+        """Record a newly generated set of Calcutta teams."""
+        self._append({'type': 'teams', 'teams': [[team.player_1, team.player_2] for team in calcutta_teams]}, sync=True)
+
+    def record_roster(self, active_players: dict):
+        """Forget the journaled scores of players who are no longer active."""
+        reset_players = [player_name for player_name in self.state['players'] if player_name not in active_players]
+        if reset_players:
+            self._append({'type': 'reset', 'players': reset_players}, sync=True)
+
+    def start(self, active_players: dict, calcutta_teams: dict):
+        """Begin the journal from the tournament as it was loaded from the data library, and
+        write it straight out as the first snapshot."""
+        for player_name, active_player in active_players.items():
+            for day, day_model in active_player.days.items():
+                if day_model:
+                    self.record_day(player_name, day, day_model, sync=False)
+        self.record_cut(active_players.values())
+        self.record_teams(calcutta_teams.values())
+        self.compact()
+
+    def rebuild_active_players(self, player_list: dict):
+        """Rebuild an ActivePlayer for every active player in the player library, with the
+        tournament and days recorded in the journal."""
+        courses = {name: course_registry.intern(Course(name, list(layout['par']), list(layout['handicap'])))
+                   for name, layout in self.state['courses'].items()}
+        active_players = dict()
+        for player_name, player in player_list.items():
+            if not player.active:
+                continue
+            player_state = self.state['players'].get(player_name, _new_player())
+            active_player = ActivePlayer(player, ActiveTournament(player_state['tournament']))
+            for day, day_state in player_state['days'].items():
+                active_player.days[day] = Day(courses[day_state['course']], list(day_state['scores']))
+            active_players[player_name] = active_player
+        return active_players
+
+    def rebuild_calcutta_teams(self, active_players: dict):
+        """Rebuild the journaled Calcutta teams and re-score every day either partner has played."""
+        teams = [CalcuttaTeam(player_1, player_2) for player_1, player_2 in self.state['teams']
+                 if player_1 in active_players and player_2 in active_players]
+        for day in (teams[0].days if teams else ()):
+            played_teams = [team for team in teams
+                            if active_players[team.player_1].days[day] or active_players[team.player_2].days[day]]
+            if played_teams:
+                score_calcutta_day(played_teams, active_players, day)
+        return {f'{team.player_1} and {team.player_2}': team for team in teams}
+
+
+def score_calcutta_day(teams, active_players, day):
+    """Score the teams for the day. A partner who has not started the day counts as having no
+    holes played."""
+    player_names = list(dict.fromkeys(name for team in teams for name in (team.player_1, team.player_2)))
+    player_index = {player_name: i for i, player_name in enumerate(player_names)}
+    players = [active_players[player_name] for player_name in player_names]
+    any_day = next(player.days[day] for player in players if player.days[day])
+    days = [player.days[day] or Day.empty(any_day.course) for player in players]
+
+    net_score_matrix, modifiers = calculate_days_calcutta_scores(days, [player.player_info.twisted_creek_handicap for player in players])
+    team_index = [[player_index[team.player_1], player_index[team.player_2]] for team in teams]
+    CalcuttaTeam.calculate_field_scores(teams, net_score_matrix, modifiers, team_index, day)
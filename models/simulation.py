@@ -0,0 +1,285 @@
+"""This file contains the TournamentSimulator class, which estimates each player's and Calcutta team's
+chances of finishing on top by simulating the remaining rounds many thousands of times."""
+
+from concurrent.futures import ProcessPoolExecutor
+from numpy import arange, argpartition, array, bincount, cumsum, float32, int8, int32, minimum, ones, where, zeros
+from numpy.random import default_rng, SeedSequence
+
+from .active_player import ActiveTournament
+from .day import STABLEFORD_OFFSET, STABLEFORD_TABLE, calculate_field_calcutta_scores
+from .ranking import team_name
+
+COURSE_LENGTH = 18
+OUTCOMES = len(STABLEFORD_TABLE)
+
+# The Calcutta modifier earned by each outcome, taken from the Day scoring rules.
+CALCUTTA_MODIFIER_TABLE = calculate_field_calcutta_scores(arange(OUTCOMES)[:, None], STABLEFORD_OFFSET, [[0]])[1].astype(int8)
+POINTS_TABLE = STABLEFORD_TABLE.astype(int8)
+
+# Smoothing weights, in holes, used when a player has few holes played.
+PLAYER_PRIOR_WEIGHT = COURSE_LENGTH
+HOLE_PRIOR_WEIGHT = 2
+
+DEFAULT_SIMULATIONS = 10000
+DEFAULT_CHUNK_SIZE = 2000
+TOP_FINISH = 3
+NOT_ELIGIBLE = -10**9
+
+
+class SimulationResult:
+    """The finishing probabilities from a simulation. Each competition maps a player or team
+    name to a dictionary with 'win' and 'top 3' probabilities, and cut maps a player name to
+    the probability of making the Mosley Open cut."""
+
+    def __init__(self, simulations, mosley_open, twisted_creek, calcutta, cut):
+        self.simulations = simulations
+        self.mosley_open = mosley_open
+        self.twisted_creek = twisted_creek
+        self.calcutta = calcutta
+        self.cut = cut
+
+
+class TournamentSimulator:
+    """Fit a score distribution for every player on every hole from the rounds already played and
+    simulate the remaining rounds for the whole field at once. A remaining day that has already
+    been started keeps the holes played so far, and only the rest of it is simulated."""
+
+    def __init__(self, active_players, calcutta_teams, remaining_courses: dict, cut_size: int=None):
+        self.players = list(active_players)
+        self.teams = list(calcutta_teams)
+        self.remaining_days = list(remaining_courses)
+        self.remaining_courses = [remaining_courses[day] for day in self.remaining_days]
+        self.cut_size = cut_size if 'Day 2' in self.remaining_days else None
+        self.model = self._build_model()
+
+    def _observed_outcomes(self):
+        """Get the outcome index of every hole played, along with the course and hole it was played on."""
+        observed = []
+        for i, player in enumerate(self.players):
+            for day in player.days.values():
+                if not day:
+                    continue
+                for hole, score in enumerate(day.raw_score_list):
+                    if score is not None:
+                        observed.append((i, day.course.name, hole, score - day.course.par_order[hole] + STABLEFORD_OFFSET))
+        return observed
+
+    def fit_probabilities(self, course):
+        """Fit a (player x hole x outcome) probability table for the course. Each player's holes on
+        this course are smoothed towards the player's overall distribution, which is in turn
+        smoothed towards the whole field's distribution."""
+
+        player_counts = zeros((len(self.players), OUTCOMES))
+        hole_counts = zeros((len(self.players), COURSE_LENGTH, OUTCOMES))
+        for i, course_name, hole, outcome in self._observed_outcomes():
+            player_counts[i, outcome] += 1
+            if course_name == course.name:
+                hole_counts[i, hole, outcome] += 1
+
+        field_distribution = player_counts.sum(axis=0) + 1
+        field_distribution /= field_distribution.sum()
+
+        player_distribution = player_counts + PLAYER_PRIOR_WEIGHT*field_distribution
+        player_distribution /= player_distribution.sum(axis=1, keepdims=True)
+
+        hole_distribution = hole_counts + HOLE_PRIOR_WEIGHT*player_distribution[:, None, :]
+        hole_distribution /= hole_distribution.sum(axis=2, keepdims=True)
+
+        # Outcomes that would mean a raw score of zero or less are impossible.
+        raw_scores = arange(OUTCOMES) - STABLEFORD_OFFSET + course.par_array[:, None]
+        hole_distribution = where(raw_scores > 0, hole_distribution, 0)
+        return hole_distribution / hole_distribution.sum(axis=2, keepdims=True)
+
+    def _started_holes(self):
+        """Get which holes of each remaining day every player has played, as a (day x player x hole)
+        mask, and the outcome of each of those holes."""
+        played = zeros((len(self.remaining_days), len(self.players), COURSE_LENGTH), dtype=bool)
+        outcomes = zeros(played.shape, dtype=int8)
+        for day_index, (day, course) in enumerate(zip(self.remaining_days, self.remaining_courses)):
+            for i, player in enumerate(self.players):
+                day_model = player.days[day]
+                if not day_model:
+                    continue
+                if day_model.course.name != course.name:
+                    raise ValueError(f"{player.player_info.name} started {day} on {day_model.course.name}, not {course.name}.")
+                played[day_index, i] = day_model.played
+                outcomes[day_index, i] = [score - par + STABLEFORD_OFFSET if score is not None else 0
+                                          for score, par in zip(day_model.raw_score_list, course.par_order)]
+        return played, outcomes
+
+    def _completed_totals(self):
+        """Get each player's and team's totals without the remaining days, which are simulated in
+        full, including any holes of them already played."""
+        mosley_open_points, twisted_creek_points, raw_scores = [], [], []
+        for player in self.players:
+            started_days = [player.days[day] for day in self.remaining_days if player.days[day]]
+            points = sum(day_model.points for day_model in started_days)
+            mosley_open_points.append(player.net_mosley_open_points - points + len(started_days)*(36-player.player_info.mosley_open_handicap))
+            twisted_creek_points.append(player.net_twisted_creek_score - points + len(started_days)*(36-player.player_info.twisted_creek_handicap))
+            raw_scores.append(player.total_raw_score - sum(day_model.total_raw_score for day_model in started_days))
+        team_points = [team.total_points - sum(team.days[day] or 0 for day in self.remaining_days) for team in self.teams]
+        return mosley_open_points, twisted_creek_points, raw_scores, team_points
+
+    def _build_model(self):
+        """Collect everything a simulation needs into plain arrays so it can be sent to worker processes."""
+        player_index = {player.player_info.name: i for i, player in enumerate(self.players)}
+        tournaments = array([player.active_tournament.value for player in self.players], dtype=int)
+        twisted_creek_handicaps = array([player.player_info.twisted_creek_handicap for player in self.players])
+        played, played_outcomes = self._started_holes()
+        mosley_open_points, twisted_creek_points, raw_scores, team_points = self._completed_totals()
+
+        model = {
+            'cdf': array([cumsum(self.fit_probabilities(course), axis=2) for course in self.remaining_courses],
+                         dtype=float32).reshape(-1, len(self.players), COURSE_LENGTH, OUTCOMES),
+            'par': array([course.par_array for course in self.remaining_courses], dtype=int).reshape(-1, COURSE_LENGTH),
+            'dots': array([course.dot_table[twisted_creek_handicaps] for course in self.remaining_courses],
+                          dtype=int8).reshape(-1, len(self.players), COURSE_LENGTH),
+            'played': played,
+            'played_outcomes': played_outcomes,
+            'cut_day': self.remaining_days.index('Day 2') if self.cut_size else None,
+            'cut_size': self.cut_size,
+            'mosley_open_handicaps': array([player.player_info.mosley_open_handicap for player in self.players]),
+            'twisted_creek_handicaps': twisted_creek_handicaps,
+            'mosley_open_points': array(mosley_open_points, dtype=int),
+            'twisted_creek_points': array(twisted_creek_points, dtype=int),
+            'raw_scores': array(raw_scores, dtype=int),
+            'mosley_open_eligible': tournaments != ActiveTournament.TwistedCreek.value,
+            'twisted_creek_eligible': tournaments != ActiveTournament.MosleyOpen.value,
+            'team_index': array([[player_index[team.player_1], player_index[team.player_2]] for team in self.teams],
+                                dtype=int).reshape(-1, 2),
+            'team_points': array(team_points, dtype=int),
+        }
+        return model
+
+    def run(self, simulations: int=DEFAULT_SIMULATIONS, processes: int=None, seed=None,
+            chunk_size: int=DEFAULT_CHUNK_SIZE):
+        """Simulate the remaining rounds and return the finishing probabilities. With processes
+        set, the simulations are split across a process pool."""
+
+        chunks = [min(chunk_size, simulations - start) for start in range(0, simulations, chunk_size)]
+        seeds = SeedSequence(seed).spawn(len(chunks))
+
+        if processes and processes > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(processes, initializer=_set_worker_model, initargs=(self.model,)) as executor:
+                chunk_counts = list(executor.map(_simulate_worker_chunk, chunks, seeds))
+        else:
+            chunk_counts = [simulate_chunk(self.model, chunk, chunk_seed) for chunk, chunk_seed in zip(chunks, seeds)]
+
+        counts = {key: sum(chunk[key] for chunk in chunk_counts) for key in chunk_counts[0]}
+        return self._to_result(simulations, counts)
+
+    def _to_result(self, simulations, counts):
+        player_names = [player.player_info.name for player in self.players]
+        team_names = [team_name(team) for team in self.teams]
+
+        def probabilities(names, prefix):
+            return {
+                name: {'win': counts[f'{prefix}_win'][i]/simulations, 'top 3': counts[f'{prefix}_top'][i]/simulations}
+                for i, name in enumerate(names)
+            }
+
+        cut = {name: counts['cut'][i]/simulations for i, name in enumerate(player_names)} if self.cut_size else {}
+        return SimulationResult(
+            simulations,
+            probabilities(player_names, 'mosley_open'),
+            probabilities(player_names, 'twisted_creek'),
+            probabilities(team_names, 'calcutta'),
+            cut
+        )
+
+
+def simulate_chunk(model, simulations, seed):
+    """Simulate the remaining rounds for every player at once, returning how often each player
+    and team won, finished in the top 3, and made the cut."""
+
+    rng = default_rng(seed)
+    players = len(model['raw_scores'])
+    mosley_open_points = ones((simulations, 1), dtype=int)*model['mosley_open_points']
+    twisted_creek_points = ones((simulations, 1), dtype=int)*model['twisted_creek_points']
+    raw_scores = ones((simulations, 1), dtype=int)*model['raw_scores']
+    team_points = ones((simulations, 1), dtype=int)*model['team_points']
+    mosley_open_eligible = ones((simulations, 1), dtype=bool)*model['mosley_open_eligible']
+    twisted_creek_eligible = ones((simulations, 1), dtype=bool)*model['twisted_creek_eligible']
+    made_cut = zeros((simulations, players), dtype=bool)
+
+    for day_index, cdf in enumerate(model['cdf']):
+        # Draw an outcome for every simulation, player and hole by inverting the fitted distributions.
+        draws = rng.random((simulations, players, COURSE_LENGTH), dtype=float32)
+        outcomes = zeros(draws.shape, dtype=int8)
+        for outcome in range(OUTCOMES-1):
+            outcomes += draws >= cdf[:, :, outcome]
+        # Holes already played keep the score they were played in.
+        outcomes = where(model['played'][day_index], model['played_outcomes'][day_index], outcomes)
+
+        points = POINTS_TABLE[outcomes].sum(axis=2, dtype=int32)
+        raw_scores += outcomes.sum(axis=2, dtype=int32) + (model['par'][day_index].sum() - COURSE_LENGTH*STABLEFORD_OFFSET)
+        mosley_open_points += points - (36-model['mosley_open_handicaps'])
+        twisted_creek_points += points - (36-model['twisted_creek_handicaps'])
+
+        if len(model['team_index']):
+            team_points += _simulate_calcutta(model, day_index, outcomes)
+
+        if day_index == model['cut_day']:
+            keys = where(mosley_open_eligible, _ranking_keys(mosley_open_points, raw_scores), NOT_ELIGIBLE)
+            made_cut = _top_mask(keys, model['cut_size'])
+            mosley_open_eligible = made_cut
+            twisted_creek_eligible = ~made_cut
+
+    counts = {'cut': made_cut.sum(axis=0)}
+    for prefix, keys in (
+        ('mosley_open', where(mosley_open_eligible, _ranking_keys(mosley_open_points, raw_scores), NOT_ELIGIBLE)),
+        ('twisted_creek', where(twisted_creek_eligible, _ranking_keys(twisted_creek_points, raw_scores), NOT_ELIGIBLE)),
+        ('calcutta', team_points),
+    ):
+        counts[f'{prefix}_win'] = _win_counts(keys)
+        counts[f'{prefix}_top'] = _top_mask(keys, TOP_FINISH).sum(axis=0)
+    return counts
+
+
+def _win_counts(keys):
+    """Count how often each entry had the best key, leaving out simulations where no entry was
+    eligible, such as a Twisted Creek with nobody in its field."""
+    entries = keys.shape[1]
+    keys = keys[keys.max(axis=1, initial=NOT_ELIGIBLE) > NOT_ELIGIBLE]
+    return bincount(keys.argmax(axis=1), minlength=entries) if len(keys) else zeros(entries, dtype=int)
+
+
+def _simulate_calcutta(model, day_index, outcomes):
+    """Score every team in every simulation for one simulated day. This applies the same rules as
+    calculate_field_calcutta_scores, working on the small int8 outcome matrix directly."""
+    partner_1, partner_2 = model['team_index'][:, 0], model['team_index'][:, 1]
+    modifiers = CALCUTTA_MODIFIER_TABLE[outcomes].sum(axis=2, dtype=int32)
+    net_score_matrix = minimum(outcomes - model['dots'][day_index] - STABLEFORD_OFFSET, 2).astype(int8)
+
+    team_scores = minimum(net_score_matrix[:, partner_1], net_score_matrix[:, partner_2])
+    return (2-team_scores).sum(axis=2, dtype=int32) + modifiers[:, partner_1] + modifiers[:, partner_2] - 36
+
+
+def _ranking_keys(points, raw_scores):
+    """Combine points and the raw score tie breaker into a single sortable key."""
+    return points*10000 + raw_scores
+
+
+def _top_mask(keys, n):
+    """Mark the best n entries of every simulation."""
+    entries = keys.shape[1]
+    mask = zeros(keys.shape, dtype=bool)
+    if entries <= n:
+        mask[:] = keys > NOT_ELIGIBLE
+        return mask
+    top = argpartition(-keys, n-1, axis=1)[:, :n]
+    mask[arange(len(keys))[:, None], top] = True
+    return mask & (keys > NOT_ELIGIBLE)
+
+
+_worker_model = None
+
+
+def _set_worker_model(model):
+    """Give a worker process the simulation model once, rather than with every chunk."""
+    global _worker_model
+    _worker_model = model
+
+
+def _simulate_worker_chunk(simulations, seed):
+    return simulate_chunk(_worker_model, simulations, seed)
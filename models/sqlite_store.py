@@ -0,0 +1,207 @@
+"""This file contains the SqliteStore class, an optional storage backend that keeps the player,
+course, active player and Calcutta team libraries in a single SQLite database instead of one
+YAML file per model."""
+
+import json
+import sqlite3
+
+from .active_player import ActivePlayer, ActiveTournament
+from .calcutta_team import CalcuttaTeam
+from .course import Course
+from .course_registry import course_registry
+from .day import Day
+from .player import Player
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT PRIMARY KEY,
+    mosley_open_handicap INTEGER NOT NULL,
+    twisted_creek_handicap INTEGER NOT NULL,
+    active INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS courses (
+    name TEXT PRIMARY KEY,
+    par_order TEXT NOT NULL,
+    handicap_order TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS active_players (
+    name TEXT PRIMARY KEY,
+    mosley_open_handicap INTEGER NOT NULL,
+    twisted_creek_handicap INTEGER NOT NULL,
+    active_tournament INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS days (
+    player_name TEXT NOT NULL REFERENCES active_players(name) ON DELETE CASCADE,
+    day TEXT NOT NULL,
+    course_name TEXT NOT NULL,
+    raw_scores TEXT NOT NULL,
+    points INTEGER NOT NULL,
+    PRIMARY KEY (player_name, day)
+);
+CREATE TABLE IF NOT EXISTS calcutta_teams (
+    player_1 TEXT NOT NULL,
+    player_2 TEXT NOT NULL,
+    days TEXT NOT NULL,
+    PRIMARY KEY (player_1, player_2)
+);
+"""
+
+
+class SqliteStore:
+    """Model storage backed by a SQLite database. Each table is keyed by player name, course
+    name or (player, day), every save is a single transaction, and each library is loaded with
+    a single query."""
+
+    def __init__(self, database_path: str):
+        self.database_path = database_path
+        self.connection = sqlite3.connect(database_path)
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def load_players(self):
+        """Load every player in the library as a dictionary keyed by player name."""
+        rows = self.connection.execute(
+            'SELECT name, mosley_open_handicap, twisted_creek_handicap, active FROM players ORDER BY name'
+        )
+        player_dict = dict()
+        for name, mosley_open_handicap, twisted_creek_handicap, active in rows:
+            player_dict[name] = _build_player(name, mosley_open_handicap, twisted_creek_handicap, bool(active))
+        return player_dict
+
+    def save_players(self, players):
+        """Insert or update the players in one transaction."""
+        rows = [(player.name, player.mosley_open_handicap, player.twisted_creek_handicap, int(player.active))
+                for player in players]
+        with self.connection:
+            self.connection.executemany(
+                'INSERT INTO players (name, mosley_open_handicap, twisted_creek_handicap, active) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (name) DO UPDATE SET mosley_open_handicap = excluded.mosley_open_handicap, '
+                'twisted_creek_handicap = excluded.twisted_creek_handicap, active = excluded.active',
+                rows
+            )
+
+    def delete_players(self, player_names):
+        with self.connection:
+            self.connection.executemany('DELETE FROM players WHERE name = ?', [(name,) for name in player_names])
+
+    def load_courses(self):
+        """Load every course in the library as a dictionary keyed by course name."""
+        rows = self.connection.execute('SELECT name, par_order, handicap_order FROM courses ORDER BY name')
+        return {name: course_registry.update(Course(name, json.loads(par_order), json.loads(handicap_order)))
+                for name, par_order, handicap_order in rows}
+
+    def save_courses(self, courses):
+        """Insert or update the courses in one transaction."""
+        rows = [(course.name, json.dumps([int(par) for par in course.par_order]),
+                 json.dumps([int(handicap) for handicap in course.handicap_order])) for course in courses]
+        with self.connection:
+            self.connection.executemany(
+                'INSERT INTO courses (name, par_order, handicap_order) VALUES (?, ?, ?) '
+                'ON CONFLICT (name) DO UPDATE SET par_order = excluded.par_order, handicap_order = excluded.handicap_order',
+                rows
+            )
+
+    def delete_courses(self, course_names):
+        with self.connection:
+            self.connection.executemany('DELETE FROM courses WHERE name = ?', [(name,) for name in course_names])
+
+    def load_active_players(self, courses: dict=None):
+        """Load every active player, along with the days they have played, as a dictionary keyed
+        by player name. Each player's info is the snapshot saved with them, so it can be checked
+        against the player library. Days are played on the given courses, or on the courses in
+        the store if none are given."""
+        if courses is None:
+            courses = self.load_courses()
+
+        rows = self.connection.execute(
+            'SELECT a.name, a.mosley_open_handicap, a.twisted_creek_handicap, a.active_tournament, '
+            'd.day, d.course_name, d.raw_scores, d.points '
+            'FROM active_players a LEFT JOIN days d ON d.player_name = a.name ORDER BY a.name'
+        )
+        active_player_dict = dict()
+        for name, mosley_open_handicap, twisted_creek_handicap, active_tournament, day, course_name, raw_scores, points in rows:
+            active_player = active_player_dict.get(name)
+            if active_player is None:
+                player = _build_player(name, mosley_open_handicap, twisted_creek_handicap, True)
+                active_player = ActivePlayer(player, ActiveTournament(active_tournament))
+                active_player_dict[name] = active_player
+            if day is not None:
+                if course_name not in courses:
+                    raise KeyError(f"{name} played {day} on unknown course {course_name}.")
+                active_player.days[day] = Day(courses[course_name], json.loads(raw_scores), points)
+
+        return active_player_dict
+
+    def save_active_players(self, active_players):
+        """Insert or update the active players and all of their days in one transaction."""
+        active_players = list(active_players)
+        player_rows = []
+        day_rows = []
+        for active_player in active_players:
+            player_info = active_player.player_info
+            player_rows.append((player_info.name, player_info.mosley_open_handicap, player_info.twisted_creek_handicap,
+                                active_player.active_tournament.value))
+            for day, day_model in active_player.days.items():
+                if day_model:
+                    raw_scores = json.dumps([None if score is None else int(score) for score in day_model.raw_score_list])
+                    day_rows.append((player_info.name, day, day_model.course.name, raw_scores, int(day_model.points)))
+
+        with self.connection:
+            self.connection.executemany(
+                'INSERT INTO active_players (name, mosley_open_handicap, twisted_creek_handicap, active_tournament) '
+                'VALUES (?, ?, ?, ?) ON CONFLICT (name) DO UPDATE SET '
+                'mosley_open_handicap = excluded.mosley_open_handicap, '
+                'twisted_creek_handicap = excluded.twisted_creek_handicap, active_tournament = excluded.active_tournament',
+                player_rows
+            )
+            self.connection.executemany('DELETE FROM days WHERE player_name = ?', [(row[0],) for row in player_rows])
+            self.connection.executemany(
+                'INSERT INTO days (player_name, day, course_name, raw_scores, points) VALUES (?, ?, ?, ?, ?)',
+                day_rows
+            )
+
+    def delete_active_players(self, player_names):
+        """Delete the active players and, through the foreign key, all of their days."""
+        with self.connection:
+            self.connection.executemany('DELETE FROM active_players WHERE name = ?', [(name,) for name in player_names])
+
+    def load_calcutta_teams(self):
+        """Load every Calcutta team as a dictionary keyed by team name."""
+        rows = self.connection.execute('SELECT player_1, player_2, days FROM calcutta_teams ORDER BY rowid')
+        calcutta_dict = dict()
+        for player_1, player_2, days in rows:
+            calcutta_team = CalcuttaTeam(player_1, player_2)
+            calcutta_team.days.update(json.loads(days))
+            calcutta_dict[f'{player_1} and {player_2}'] = calcutta_team
+        return calcutta_dict
+
+    def save_calcutta_teams(self, calcutta_teams):
+        """Insert or update the Calcutta teams in one transaction."""
+        rows = [(team.player_1, team.player_2, json.dumps({day: None if points is None else int(points)
+                                                           for day, points in team.days.items()}))
+                for team in calcutta_teams]
+        with self.connection:
+            self.connection.executemany(
+                'INSERT INTO calcutta_teams (player_1, player_2, days) VALUES (?, ?, ?) '
+                'ON CONFLICT (player_1, player_2) DO UPDATE SET days = excluded.days',
+                rows
+            )
+
+    def delete_calcutta_teams(self, calcutta_teams):
+        with self.connection:
+            self.connection.executemany('DELETE FROM calcutta_teams WHERE player_1 = ? AND player_2 = ?',
+                                        [(team.player_1, team.player_2) for team in calcutta_teams])
+
+
+def _build_player(name, mosley_open_handicap, twisted_creek_handicap, active):
+    """Rebuild a Player, keeping handicaps that were edited independently of each other."""
+    player = Player(name, twisted_creek_handicap)
+    player.mosley_open_handicap = mosley_open_handicap
+    player.active = active
+    return player
@@ -0,0 +1,210 @@
+"""This file contains the Standings class, which computes the rows of every leaderboard competition
+as plain data, independent of how the leaderboard is exported. The rows are computed from an
+immutable snapshot of the field, so the competitions can be computed side by side on a process pool."""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .ranking import DAYS, TournamentRankings, team_name
+
+# Set to compute the stale sheets on a pool of this many processes.
+STANDINGS_PROCESSES = None
+
+# A competition's board: the sheet it is listed under, the title printed above it, the column
+# headers, and one row of plain values per entry from first to last.
+Sheet = namedtuple('Sheet', ['name', 'title', 'header', 'rows'])
+
+MOSLEY_OPEN = 'Mosley Open'
+TWISTED_CREEK = 'Twisted Creek Classic'
+CALCUTTA = 'Calcutta'
+DOGFIGHTS = {day: f'{day} Dogfight' for day in DAYS}
+SHEET_NAMES = (MOSLEY_OPEN, TWISTED_CREEK, CALCUTTA, *DOGFIGHTS.values())
+
+# The inputs the standings are computed from: each day's scores, the cut, the Calcutta teams and
+# the players in the field along with their handicaps.
+CUT = 'cut'
+TEAMS = 'teams'
+PLAYERS = 'players'
+INPUTS = (*DAYS, CUT, TEAMS, PLAYERS)
+
+# The inputs each sheet depends on. A sheet is only recomputed once one of these has changed.
+SHEET_INPUTS = {
+    MOSLEY_OPEN: (*DAYS, CUT, PLAYERS),
+    TWISTED_CREEK: (*DAYS, CUT, PLAYERS),
+    # Team points are scored from the days their players have played.
+    CALCUTTA: (*DAYS, TEAMS, PLAYERS),
+    **{dogfight_name: (day, PLAYERS) for day, dogfight_name in DOGFIGHTS.items()},
+}
+
+# Everything the sheets are computed from, as plain values. Players map to their (Mosley Open
+# handicap, Twisted Creek handicap, points for each day or None), teams map to their (points for
+# each day, total points), and orders map every sheet name to its entries from first to last.
+FieldSnapshot = namedtuple('FieldSnapshot', ['players', 'teams', 'orders'])
+
+
+class Standings:
+    """The standings of every competition in a tournament. Each input the standings are computed
+    from has a version that is bumped whenever it changes, and each sheet is cached alongside the
+    versions of the inputs it depends on. A sheet is only recomputed once one of those versions has
+    moved, so exporting to several formats, or again after a single day has changed, only computes
+    the sheets that are out of date. The stale sheets are computed together from one snapshot of
+    the field, on a process pool when processes is set."""
+
+    def __init__(self, active_players: dict, calcutta_teams: dict, rankings: TournamentRankings=None,
+                 processes: int=STANDINGS_PROCESSES):
+        self.active_players = active_players
+        self.calcutta_teams = calcutta_teams
+        if rankings is None:
+            rankings = TournamentRankings.from_field(active_players.values(), calcutta_teams.values())
+        self.rankings = rankings
+        self.processes = processes
+        self.versions = dict.fromkeys(INPUTS, 0)
+        self._sheets = dict()
+        # The version of every sheet last exported to each destination.
+        self._exported = dict()
+
+    def invalidate(self, *inputs):
+        """Mark inputs as changed, so every sheet depending on them is recomputed when next used."""
+        for input_name in inputs:
+            if input_name not in self.versions:
+                raise KeyError(f"Unknown standings input {input_name}.")
+            self.versions[input_name] += 1
+
+    def _sheet_key(self, name):
+        return tuple(self.versions[input_name] for input_name in SHEET_INPUTS[name])
+
+    def is_stale(self, name):
+        """Whether a sheet has not been computed since its inputs last changed."""
+        cached = self._sheets.get(name)
+        return cached is None or cached[0] != self._sheet_key(name)
+
+    def _update(self, names):
+        """Recompute every stale sheet among the names from a single snapshot of the field."""
+        stale_names = [name for name in names if self.is_stale(name)]
+        if not stale_names:
+            return
+        field = snapshot_field(self.active_players, self.calcutta_teams, self.rankings)
+        for name, sheet in zip(stale_names, compute_sheets(field, stale_names, self.processes)):
+            self._sheets[name] = (self._sheet_key(name), sheet)
+
+    def sheet(self, name):
+        """Get the Sheet of one competition by its sheet name."""
+        if name not in SHEET_INPUTS:
+            raise KeyError(f"No leaderboard sheet named {name}.")
+        self._update([name])
+        return self._sheets[name][1]
+
+    def sheets(self):
+        """Get the Sheet of every competition in leaderboard order."""
+        self._update(SHEET_NAMES)
+        return [self._sheets[name][1] for name in SHEET_NAMES]
+
+    def changed_sheets(self, destination):
+        """Get the Sheets whose inputs have changed since they were last marked as exported to the
+        destination, bringing every sheet up to date first. Each destination, such as an export
+        format and path, is tracked on its own."""
+        exported = self._exported.get(destination, dict())
+        return [sheet for sheet in self.sheets() if exported.get(sheet.name) != self._sheets[sheet.name][0]]
+
+    def mark_exported(self, destination, sheets):
+        """Record that the sheets, as last computed, have been exported to the destination."""
+        exported = self._exported.setdefault(destination, dict())
+        for sheet in sheets:
+            exported[sheet.name] = self._sheets[sheet.name][0]
+
+
+def snapshot_field(active_players, calcutta_teams, rankings):
+    """Copy everything the sheets are computed from out of the live models."""
+    players = dict()
+    for player_name, player in active_players.items():
+        day_points = tuple(int(player.days[day].points) if player.days[day] else None for day in DAYS)
+        players[player_name] = (player.player_info.mosley_open_handicap, player.player_info.twisted_creek_handicap, day_points)
+
+    teams = {name: (tuple(team.days[day] for day in DAYS), team.total_points) for name, team in calcutta_teams.items()}
+
+    orders = {
+        MOSLEY_OPEN: tuple(rankings.mosley_open.names()),
+        TWISTED_CREEK: tuple(rankings.twisted_creek.names()),
+        CALCUTTA: tuple(rankings.calcutta.names()),
+        **{DOGFIGHTS[day]: tuple(dogfight.names()) for day, dogfight in rankings.dogfights.items()},
+    }
+    return FieldSnapshot(players, teams, orders)
+
+
+def _tournament_header():
+    header = ['Player', 'Point Target']
+    for _ in DAYS:
+        header.extend(['Points', 'Net Points'])
+    return header + ['Total Score', 'Position']
+
+
+def _tournament_sheet(field, name, title, handicap_index):
+    rows = []
+    for position, player_name in enumerate(field.orders[name], start=1):
+        mosley_open_handicap, twisted_creek_handicap, day_points = field.players[player_name]
+        point_target = 36-(mosley_open_handicap, twisted_creek_handicap)[handicap_index]
+        row = [player_name, point_target]
+        for points in day_points:
+            row.extend([None, None] if points is None else [points, points-point_target])
+        played = [points for points in day_points if points is not None]
+        row.extend([sum(played) - len(played)*point_target, position])
+        rows.append(row)
+    return Sheet(name, title, _tournament_header(), rows)
+
+
+def _calcutta_sheet(field):
+    rows = []
+    for position, name in enumerate(field.orders[CALCUTTA], start=1):
+        day_points, total_points = field.teams[name]
+        rows.append([name, *day_points, total_points, position])
+    return Sheet(CALCUTTA, 'Calcutta', ['Team', *DAYS, 'Total', 'Position'], rows)
+
+
+def _dogfight_sheet(field, day):
+    name = DOGFIGHTS[day]
+    day_index = DAYS.index(day)
+    rows = []
+    for position, player_name in enumerate(field.orders[name], start=1):
+        _, twisted_creek_handicap, day_points = field.players[player_name]
+        point_target = 36-twisted_creek_handicap
+        points = day_points[day_index]
+        rows.append([player_name, point_target, points, points-point_target, position])
+    return Sheet(name, name, ['Player', 'Point Target', 'Points', 'Net Points', 'Position'], rows)
+
+
+def compute_sheet(field: FieldSnapshot, name):
+    """Compute one competition's Sheet from a snapshot of the field."""
+    if name == MOSLEY_OPEN:
+        return _tournament_sheet(field, MOSLEY_OPEN, 'Mosley Open', 0)
+    if name == TWISTED_CREEK:
+        return _tournament_sheet(field, TWISTED_CREEK, 'Twisted Creek', 1)
+    if name == CALCUTTA:
+        return _calcutta_sheet(field)
+    for day, dogfight_name in DOGFIGHTS.items():
+        if name == dogfight_name:
+            return _dogfight_sheet(field, day)
+    raise KeyError(f"No leaderboard sheet named {name}.")
+
+
+# The snapshot a worker process computes its sheets from, sent once when the worker starts.
+_worker_field = None
+
+
+def _start_worker(field):
+    global _worker_field
+    _worker_field = field
+
+
+def _compute_worker_sheet(name):
+    return compute_sheet(_worker_field, name)
+
+
+def compute_sheets(field: FieldSnapshot, names, processes: int=STANDINGS_PROCESSES):
+    """Compute the Sheets of the named competitions in order. With processes set, the sheets are
+    computed side by side on a process pool, where every worker is given the snapshot once as it
+    starts and each task only sends a sheet name."""
+    names = list(names)
+    if processes and processes > 1 and len(names) > 1:
+        with ProcessPoolExecutor(min(processes, len(names)), initializer=_start_worker, initargs=(field,)) as executor:
+            return list(executor.map(_compute_worker_sheet, names))
+    return [compute_sheet(field, name) for name in names]
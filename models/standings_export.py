@@ -0,0 +1,80 @@
+"""This file contains the exporters that write leaderboard standings to a file without a GUI. Each
+exporter takes the Sheets of a Standings and a path, and more can be added to EXPORTERS."""
+
+import csv
+import html
+import json
+import os
+
+from .leaderboard import export_xlsx
+from .standings_image import export_png, export_svg
+
+
+def export_csv(sheets, directory):
+    """Write each sheet to its own CSV file in the directory, named after the sheet."""
+    os.makedirs(directory, exist_ok=True)
+    for sheet in sheets:
+        with open(os.path.join(directory, f'{sheet.name}.csv'), 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(sheet.header)
+            writer.writerows(sheet.rows)
+
+
+def export_json(sheets, filepath):
+    """Write every sheet to a JSON file as a list of objects holding the sheet's name, title,
+    header and rows."""
+    with open(filepath, 'w') as json_file:
+        json.dump([sheet._asdict() for sheet in sheets], json_file)
+
+
+def export_html(sheets, filepath):
+    """Write every sheet to an HTML page as a table, with the leader of each board highlighted."""
+    lines = ['<!DOCTYPE html>', '<html>', '<head>', '<meta charset="utf-8">', '<title>Leaderboard</title>',
+             '<style>',
+             'table { border-collapse: collapse; margin-bottom: 2em; font-family: "Times New Roman", serif; }',
+             'caption, th { background: #000000; color: #FFFFFF; font-weight: bold; }',
+             'caption { font-size: 24pt; } th { font-size: 20pt; }',
+             'td { background: #BFBFBF; font-size: 18pt; text-align: center; border: 1px solid #000000; }',
+             'tr.leader td { background: #BF8F00; }',
+             '</style>', '</head>', '<body>']
+    for sheet in sheets:
+        lines.append(f'<table id="{html.escape(sheet.name)}">')
+        lines.append(f'<caption>{html.escape(sheet.title)}</caption>')
+        lines.append('<tr>' + ''.join(f'<th>{html.escape(str(value))}</th>' for value in sheet.header) + '</tr>')
+        for row in sheet.rows:
+            row_class = ' class="leader"' if row[-1] == 1 else ''
+            cells = ''.join(f'<td>{"" if value is None else html.escape(str(value))}</td>' for value in row)
+            lines.append(f'<tr{row_class}>{cells}</tr>')
+        lines.append('</table>')
+    lines += ['</body>', '</html>']
+
+    with open(filepath, 'w') as html_file:
+        html_file.write('\n'.join(lines) + '\n')
+
+
+# The exporters that write each sheet to a file of its own, so unchanged sheets can be left alone.
+PER_SHEET_EXPORTERS = {'csv', 'png', 'svg'}
+
+EXPORTERS = {
+    'xlsx': export_xlsx,
+    'csv': export_csv,
+    'json': export_json,
+    'html': export_html,
+    'png': export_png,
+    'svg': export_svg,
+}
+
+
+def export_standings(standings, export_format, path, changed_only: bool=False):
+    """Export the standings in one of the EXPORTERS formats. With changed_only, a format that writes
+    a file per sheet only rewrites the sheets that have changed since they were last exported in
+    that format to the same path."""
+    if export_format not in EXPORTERS:
+        raise ValueError(f"Unknown leaderboard export format {export_format}.")
+    destination = (export_format, os.path.abspath(path))
+    if changed_only and export_format in PER_SHEET_EXPORTERS:
+        sheets = standings.changed_sheets(destination)
+    else:
+        sheets = standings.sheets()
+    EXPORTERS[export_format](sheets, path)
+    standings.mark_exported(destination, sheets)
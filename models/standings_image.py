@@ -0,0 +1,277 @@
+"""This file contains the StandingsRenderer class, which draws leaderboard standings straight to PNG
+and SVG images for display screens, with no spreadsheet program or imaging library needed."""
+
+import os
+import struct
+import zlib
+from collections import namedtuple
+from html import escape
+
+import numpy
+from numpy import uint8
+
+# Every glyph of the 5x7 display font, as one byte per column with the top row in the lowest bit.
+FONT = {
+    ' ': (0x00, 0x00, 0x00, 0x00, 0x00), '!': (0x00, 0x00, 0x5F, 0x00, 0x00), '"': (0x00, 0x07, 0x00, 0x07, 0x00),
+    '#': (0x14, 0x7F, 0x14, 0x7F, 0x14), '$': (0x24, 0x2A, 0x7F, 0x2A, 0x12), '%': (0x23, 0x13, 0x08, 0x64, 0x62),
+    '&': (0x36, 0x49, 0x56, 0x20, 0x50), "'": (0x00, 0x00, 0x07, 0x00, 0x00), '(': (0x00, 0x1C, 0x22, 0x41, 0x00),
+    ')': (0x00, 0x41, 0x22, 0x1C, 0x00), '*': (0x2A, 0x1C, 0x7F, 0x1C, 0x2A), '+': (0x08, 0x08, 0x3E, 0x08, 0x08),
+    ',': (0x00, 0x50, 0x30, 0x00, 0x00), '-': (0x08, 0x08, 0x08, 0x08, 0x08), '.': (0x00, 0x60, 0x60, 0x00, 0x00),
+    '/': (0x20, 0x10, 0x08, 0x04, 0x02), '0': (0x3E, 0x51, 0x49, 0x45, 0x3E), '1': (0x00, 0x42, 0x7F, 0x40, 0x00),
+    '2': (0x42, 0x61, 0x51, 0x49, 0x46), '3': (0x21, 0x41, 0x45, 0x4B, 0x31), '4': (0x18, 0x14, 0x12, 0x7F, 0x10),
+    '5': (0x27, 0x45, 0x45, 0x45, 0x39), '6': (0x3C, 0x4A, 0x49, 0x49, 0x30), '7': (0x01, 0x71, 0x09, 0x05, 0x03),
+    '8': (0x36, 0x49, 0x49, 0x49, 0x36), '9': (0x06, 0x49, 0x49, 0x29, 0x1E), ':': (0x00, 0x36, 0x36, 0x00, 0x00),
+    ';': (0x00, 0x56, 0x36, 0x00, 0x00), '<': (0x08, 0x14, 0x22, 0x41, 0x00), '=': (0x14, 0x14, 0x14, 0x14, 0x14),
+    '>': (0x00, 0x41, 0x22, 0x14, 0x08), '?': (0x02, 0x01, 0x51, 0x09, 0x06), '@': (0x32, 0x49, 0x79, 0x41, 0x3E),
+    'A': (0x7E, 0x11, 0x11, 0x11, 0x7E), 'B': (0x7F, 0x49, 0x49, 0x49, 0x36), 'C': (0x3E, 0x41, 0x41, 0x41, 0x22),
+    'D': (0x7F, 0x41, 0x41, 0x22, 0x1C), 'E': (0x7F, 0x49, 0x49, 0x49, 0x41), 'F': (0x7F, 0x09, 0x09, 0x09, 0x01),
+    'G': (0x3E, 0x41, 0x49, 0x49, 0x7A), 'H': (0x7F, 0x08, 0x08, 0x08, 0x7F), 'I': (0x00, 0x41, 0x7F, 0x41, 0x00),
+    'J': (0x20, 0x40, 0x41, 0x3F, 0x01), 'K': (0x7F, 0x08, 0x14, 0x22, 0x41), 'L': (0x7F, 0x40, 0x40, 0x40, 0x40),
+    'M': (0x7F, 0x02, 0x0C, 0x02, 0x7F), 'N': (0x7F, 0x04, 0x08, 0x10, 0x7F), 'O': (0x3E, 0x41, 0x41, 0x41, 0x3E),
+    'P': (0x7F, 0x09, 0x09, 0x09, 0x06), 'Q': (0x3E, 0x41, 0x51, 0x21, 0x5E), 'R': (0x7F, 0x09, 0x19, 0x29, 0x46),
+    'S': (0x46, 0x49, 0x49, 0x49, 0x31), 'T': (0x01, 0x01, 0x7F, 0x01, 0x01), 'U': (0x3F, 0x40, 0x40, 0x40, 0x3F),
+    'V': (0x1F, 0x20, 0x40, 0x20, 0x1F), 'W': (0x3F, 0x40, 0x38, 0x40, 0x3F), 'X': (0x63, 0x14, 0x08, 0x14, 0x63),
+    'Y': (0x07, 0x08, 0x70, 0x08, 0x07), 'Z': (0x61, 0x51, 0x49, 0x45, 0x43), '[': (0x00, 0x7F, 0x41, 0x41, 0x00),
+    '\\': (0x02, 0x04, 0x08, 0x10, 0x20), ']': (0x00, 0x41, 0x41, 0x7F, 0x00), '^': (0x04, 0x02, 0x01, 0x02, 0x04),
+    '_': (0x40, 0x40, 0x40, 0x40, 0x40), '`': (0x00, 0x01, 0x02, 0x04, 0x00), 'a': (0x20, 0x54, 0x54, 0x54, 0x78),
+    'b': (0x7F, 0x48, 0x44, 0x44, 0x38), 'c': (0x38, 0x44, 0x44, 0x44, 0x20), 'd': (0x38, 0x44, 0x44, 0x48, 0x7F),
+    'e': (0x38, 0x54, 0x54, 0x54, 0x18), 'f': (0x08, 0x7E, 0x09, 0x01, 0x02), 'g': (0x0C, 0x52, 0x52, 0x52, 0x3E),
+    'h': (0x7F, 0x08, 0x04, 0x04, 0x78), 'i': (0x00, 0x44, 0x7D, 0x40, 0x00), 'j': (0x20, 0x40, 0x44, 0x3D, 0x00),
+    'k': (0x7F, 0x10, 0x28, 0x44, 0x00), 'l': (0x00, 0x41, 0x7F, 0x40, 0x00), 'm': (0x7C, 0x04, 0x18, 0x04, 0x78),
+    'n': (0x7C, 0x08, 0x04, 0x04, 0x78), 'o': (0x38, 0x44, 0x44, 0x44, 0x38), 'p': (0x7C, 0x14, 0x14, 0x14, 0x08),
+    'q': (0x08, 0x14, 0x14, 0x18, 0x7C), 'r': (0x7C, 0x08, 0x04, 0x04, 0x08), 's': (0x48, 0x54, 0x54, 0x54, 0x20),
+    't': (0x04, 0x3F, 0x44, 0x40, 0x20), 'u': (0x3C, 0x40, 0x40, 0x20, 0x7C), 'v': (0x1C, 0x20, 0x40, 0x20, 0x1C),
+    'w': (0x3C, 0x40, 0x30, 0x40, 0x3C), 'x': (0x44, 0x28, 0x10, 0x28, 0x44), 'y': (0x0C, 0x50, 0x50, 0x50, 0x3C),
+    'z': (0x44, 0x64, 0x54, 0x4C, 0x44), '{': (0x00, 0x08, 0x36, 0x41, 0x00), '|': (0x00, 0x00, 0x7F, 0x00, 0x00),
+    '}': (0x00, 0x41, 0x36, 0x08, 0x00), '~': (0x10, 0x08, 0x08, 0x10, 0x08),
+}
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+# Pixels between glyphs and around the text of a cell, before scaling.
+GLYPH_SPACING = 1
+CELL_PADDING = 2
+
+# Each font pixel is drawn as a square of this many pixels.
+SCALE = 2
+PNG_COMPRESSION = 1
+# The most lines of text kept drawn at once.
+TEXT_CACHE_SIZE = 4096
+
+# Images are drawn as indices into this palette of the leaderboard's colours, which keeps them a
+# third of the size of RGB images and lets the PNG be written with a palette too.
+PALETTE = numpy.array([(0x00, 0x00, 0x00), (0xFF, 0xFF, 0xFF), (0xBF, 0x8F, 0x00), (0xBF, 0xBF, 0xBF)], dtype=uint8)
+BLACK, WHITE, GOLD, GREY = range(len(PALETTE))
+
+# The (background, text) colour of each kind of row, matching the Excel leaderboard.
+ROW_COLORS = {
+    'Title': (BLACK, WHITE),
+    'Header': (BLACK, WHITE),
+    'Leader': (GOLD, BLACK),
+    'Field': (GREY, BLACK),
+}
+
+# The drawn state of one sheet: its title, header and column widths, the text of every row, and
+# the image (or SVG row elements) the rows were drawn into.
+Board = namedtuple('Board', ['layout', 'rows', 'image'])
+
+
+def as_text(value):
+    return "" if value is None else str(value)
+
+
+def row_style(row):
+    return 'Leader' if row and row[-1] == 1 else 'Field'
+
+
+class StandingsRenderer:
+    """Draws the Sheets of a Standings as images. Every row is stamped from a cached template of
+    its fill and borders, and its text is pasted together from cached tiles of coloured glyphs. The
+    last image of each sheet is kept, and when a sheet is drawn again with the same title, header
+    and column widths only the rows whose values changed are drawn over it."""
+
+    def __init__(self, scale: int=SCALE):
+        self.scale = scale
+        self.row_height = (GLYPH_HEIGHT + 2*CELL_PADDING)*scale
+        self.border = max(1, scale//2)
+        self._glyphs = dict()
+        self._texts = dict()
+        self._templates = dict()
+        self._png_boards = dict()
+        self._svg_boards = dict()
+        self.rows_drawn = 0
+
+    def glyph(self, char, style):
+        """Get the tile of a character in a kind of row: the glyph in the row's text colour on its
+        fill, as tall as a row and followed by the space before the next glyph. Unknown characters
+        are drawn as '?'."""
+        key = (char, style)
+        if key not in self._glyphs:
+            background, foreground = ROW_COLORS[style]
+            columns = FONT.get(char, FONT['?']) + (0,)*GLYPH_SPACING
+            mask = numpy.array([[(column >> row) & 1 for column in columns] for row in range(GLYPH_HEIGHT)], dtype=bool)
+            mask = mask.repeat(self.scale, axis=0).repeat(self.scale, axis=1)
+            tile = numpy.empty((self.row_height, mask.shape[1]), dtype=uint8)
+            tile[:] = background
+            tile[CELL_PADDING*self.scale:][:GLYPH_HEIGHT*self.scale][mask] = foreground
+            self._glyphs[key] = tile
+        return self._glyphs[key]
+
+    def text(self, text, style):
+        """Get the pixels of a line of text in a kind of row. Recent lines are cached, as most
+        values on a board are small numbers repeated from row to row."""
+        key = (text, style)
+        if key not in self._texts:
+            if len(self._texts) >= TEXT_CACHE_SIZE:
+                self._texts.clear()
+            self._texts[key] = numpy.concatenate([self.glyph(char, style) for char in text], axis=1)
+        return self._texts[key]
+
+    def text_width(self, text):
+        return (len(text)*(GLYPH_WIDTH + GLYPH_SPACING) + 2*CELL_PADDING)*self.scale
+
+    def layout(self, sheet):
+        """Get the title, header and pixel width of every column of a sheet."""
+        texts = [[as_text(value) for value in sheet.header]] + [[as_text(value) for value in row] for row in sheet.rows]
+        widths = [max(self.text_width(row[column]) for row in texts if column < len(row))
+                  for column in range(len(sheet.header))]
+        # The title spans every column, so the last column takes up any room it needs.
+        widths[-1] += max(0, self.text_width(sheet.title) - sum(widths))
+        return sheet.title, tuple(sheet.header), tuple(widths)
+
+    def row_template(self, style, widths):
+        """Get an empty row of a kind: its fill, with a border below it and right of every cell."""
+        key = (style, widths)
+        if key not in self._templates:
+            template = numpy.empty((self.row_height, sum(widths)), dtype=uint8)
+            template[:] = ROW_COLORS[style][0]
+            template[-self.border:] = BLACK
+            for right in numpy.cumsum(widths):
+                template[:, right-self.border:right] = BLACK
+            self._templates[key] = template
+        return self._templates[key]
+
+    def _draw_row(self, image, index, texts, style, widths):
+        y = index*self.row_height + self.border
+        image[y:y+self.row_height, self.border:] = self.row_template(style, tuple(widths))
+        x = self.border
+        for text, width in zip(texts, widths):
+            if text:
+                pixels = self.text(text, style)
+                # The space after the last glyph is left out, so the text sits in the middle.
+                left = x + (width - pixels.shape[1] + GLYPH_SPACING*self.scale)//2
+                image[y:y+self.row_height, left:left+pixels.shape[1]] = pixels
+            x += width
+        self.rows_drawn += 1
+
+    def render(self, sheet):
+        """Draw a sheet as an array of PALETTE indices, redrawing only the changed rows of its last image
+        when its layout is unchanged."""
+        layout = self.layout(sheet)
+        title, header, widths = layout
+        rows = [tuple(as_text(value) for value in row) for row in sheet.rows]
+        board = self._png_boards.get(sheet.name)
+
+        if board is not None and board.layout == layout and len(board.rows) == len(rows):
+            image = board.image
+            for index, (old_row, row, values) in enumerate(zip(board.rows, rows, sheet.rows)):
+                if old_row != row:
+                    self._draw_row(image, index+2, row, row_style(values), widths)
+        else:
+            height = (len(rows) + 2)*self.row_height + self.border
+            image = numpy.full((height, sum(widths) + self.border), BLACK, dtype=uint8)
+            self._draw_row(image, 0, [title], 'Title', [sum(widths)])
+            self._draw_row(image, 1, header, 'Header', widths)
+            for index, (row, values) in enumerate(zip(rows, sheet.rows)):
+                self._draw_row(image, index+2, row, row_style(values), widths)
+
+        self._png_boards[sheet.name] = Board(layout, rows, image)
+        return image
+
+    def render_svg(self, sheet):
+        """Draw a sheet as an SVG document, rebuilding only the elements of changed rows when its
+        layout is unchanged."""
+        layout = self.layout(sheet)
+        title, header, widths = layout
+        rows = [tuple(as_text(value) for value in row) for row in sheet.rows]
+        board = self._svg_boards.get(sheet.name)
+
+        if board is not None and board.layout == layout and len(board.rows) == len(rows):
+            elements = board.image
+            for index, (old_row, row, values) in enumerate(zip(board.rows, rows, sheet.rows)):
+                if old_row != row:
+                    elements[index+2] = self._svg_row(index+2, row, row_style(values), widths)
+        else:
+            elements = [self._svg_row(0, [title], 'Title', [sum(widths)]), self._svg_row(1, header, 'Header', widths)]
+            elements += [self._svg_row(index+2, row, row_style(values), widths)
+                         for index, (row, values) in enumerate(zip(rows, sheet.rows))]
+
+        self._svg_boards[sheet.name] = Board(layout, rows, elements)
+        width = sum(widths)
+        height = len(elements)*self.row_height
+        font_size = GLYPH_HEIGHT*self.scale
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                f'viewBox="0 0 {width} {height}" font-family="Times New Roman, serif" font-size="{font_size}" '
+                f'text-anchor="middle" dominant-baseline="central">\n' + ''.join(elements) + '</svg>\n')
+
+    def _svg_row(self, index, texts, style, widths):
+        background, foreground = ('#%02X%02X%02X' % tuple(PALETTE[color]) for color in ROW_COLORS[style])
+        y = index*self.row_height
+        x = 0
+        elements = []
+        for text, width in zip(texts, widths):
+            elements.append(f'<rect x="{x}" y="{y}" width="{width}" height="{self.row_height}" fill="{background}" '
+                            f'stroke="#000000" stroke-width="{self.border}"/>'
+                            f'<text x="{x + width/2:g}" y="{y + self.row_height/2:g}" fill="{foreground}">{escape(text)}</text>')
+            x += width
+        self.rows_drawn += 1
+        return ''.join(elements) + '\n'
+
+
+def to_rgb(image):
+    """Convert an image of PALETTE indices to an RGB image array."""
+    return PALETTE[image]
+
+
+def encode_png(image):
+    """Encode an image of PALETTE indices as a PNG file."""
+    height, width = image.shape
+    # Every scanline starts with a filter type byte. Each is stored as its difference from the
+    # scanline above (filter type 2), so the many repeated scanlines of a row compress to nothing.
+    scanlines = numpy.full((height, width + 1), 2, dtype=uint8)
+    scanlines[:, 1:] = image
+    scanlines[1:, 1:] -= image[:-1]
+
+    def chunk(chunk_type, data):
+        return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+    return (b'\x89PNG\r\n\x1a\n' +
+            chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0)) +
+            chunk(b'PLTE', PALETTE.tobytes()) +
+            chunk(b'IDAT', zlib.compress(scanlines.tobytes(), PNG_COMPRESSION)) +
+            chunk(b'IEND', b''))
+
+
+def _replace_file(filepath, data, mode):
+    # Screens may read the image at any moment, so it is swapped into place once fully written.
+    temp_path = os.path.join(os.path.dirname(filepath), f'.{os.path.basename(filepath)}.tmp')
+    with open(temp_path, mode) as image_file:
+        image_file.write(data)
+    os.replace(temp_path, filepath)
+
+
+# The renderer shared by the image exporters, so its caches carry over from one export to the next.
+renderer = StandingsRenderer()
+
+
+def export_png(sheets, directory):
+    """Draw each sheet to its own PNG file in the directory, named after the sheet."""
+    os.makedirs(directory, exist_ok=True)
+    for sheet in sheets:
+        _replace_file(os.path.join(directory, f'{sheet.name}.png'), encode_png(renderer.render(sheet)), 'wb')
+
+
+def export_svg(sheets, directory):
+    """Draw each sheet to its own SVG file in the directory, named after the sheet."""
+    os.makedirs(directory, exist_ok=True)
+    for sheet in sheets:
+        _replace_file(os.path.join(directory, f'{sheet.name}.svg'), renderer.render_svg(sheet), 'w')
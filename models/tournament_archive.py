@@ -0,0 +1,355 @@
+"""This file contains the TournamentArchive class, which freezes finished tournaments into an indexed
+columnar store so that rounds from every past year can be queried without reading each event."""
+
+import json
+import os
+import shutil
+from collections import namedtuple
+
+import numpy
+from numpy import int8, int16, int32, int64
+
+from .active_player import ActiveTournament
+from .day import COURSE_LENGTH
+from .ranking import DAYS, TournamentRankings
+from .save_queue import atomic_write
+
+HEADER_FILE = 'header.json'
+EVENT_DIR = 'events'
+GENERATION_DIR = 'generations'
+ARCHIVE_VERSION = 2
+
+# The column of every archived round, and the type it is stored as.
+ROUND_COLUMNS = {
+    'year': int16,
+    'day': int8,
+    'player': int32,
+    'course': int32,
+    'handicap': int8,
+    'tournament': int8,
+    'raw_scores': int8,
+    'points': int16,
+}
+
+# Every index sorts the rounds by its columns in turn. A query is answered from the index whose
+# leading columns match the most of its filters, so its rounds are one contiguous range.
+INDEXES = {
+    'player': ('player', 'course', 'day', 'year'),
+    'course': ('course', 'day', 'year'),
+    'day': ('day', 'year'),
+    'year': ('year',),
+}
+
+ArchivedRound = namedtuple('ArchivedRound', ['year', 'day', 'player', 'course', 'handicap', 'tournament', 'raw_scores', 'points'])
+
+
+class TournamentArchive:
+    """A store of every round of every archived tournament. Each round is a row of fixed-width
+    columns memory mapped from .npy files, next to a sorted index for each of the INDEXES. Each
+    event's players, courses, Calcutta teams and final standings are kept in a JSON file per year.
+
+    Freezing a tournament rewrites the columns and indexes, which only happens once a year, so
+    that queries never have to merge a separate list of recent rounds. Each rewrite is a new
+    generation of files in a directory of its own, and the header names the generation in use, so
+    a rewrite cut short leaves the previous generation whole."""
+
+    def __init__(self, archive_path: str):
+        self.archive_path = archive_path
+        os.makedirs(os.path.join(archive_path, EVENT_DIR), exist_ok=True)
+        self._load()
+
+    def _generation_path(self, generation):
+        return os.path.join(self.archive_path, GENERATION_DIR, str(generation))
+
+    def _path(self, name, generation=None):
+        if generation is None:
+            generation = self.generation
+        return os.path.join(self._generation_path(generation), f'{name}.npy')
+
+    def _event_path(self, year):
+        return os.path.join(self.archive_path, EVENT_DIR, f'{year}.json')
+
+    def _load(self):
+        """Map the archived columns and indexes, or start an empty archive if none were written."""
+        header_path = os.path.join(self.archive_path, HEADER_FILE)
+        if not os.path.exists(header_path):
+            # Starting empty over archived rounds would lose them at the next freeze.
+            generation_dir = os.path.join(self.archive_path, GENERATION_DIR)
+            if os.path.isdir(generation_dir) and os.listdir(generation_dir):
+                raise FileNotFoundError(f"The tournament archive at {self.archive_path} has archived rounds but no header.")
+            self.years = []
+            self.generation = 0
+            self._set_columns(_empty_columns(), [], [])
+            return
+
+        with open(header_path, 'r') as header_file:
+            header = json.load(header_file)
+        if header['version'] != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported tournament archive version {header['version']}.")
+
+        self.years = header['years']
+        self.generation = header['generation']
+        columns = {column: numpy.load(self._path(column), mmap_mode='r') for column in ROUND_COLUMNS}
+        player_names = numpy.load(self._path('player_names')).tolist()
+        course_names = numpy.load(self._path('course_names')).tolist()
+        self._set_columns(columns, player_names, course_names)
+        self.indexes = {name: (numpy.load(self._path(f'index_{name}_keys'), mmap_mode='r'),
+                               numpy.load(self._path(f'index_{name}_rows'), mmap_mode='r'))
+                        for name in INDEXES}
+
+    def _set_columns(self, columns, player_names, course_names):
+        self.columns = columns
+        self.player_names = player_names
+        self.course_names = course_names
+        self.player_index = {player_name: i for i, player_name in enumerate(player_names)}
+        self.course_index = {course_name: i for i, course_name in enumerate(course_names)}
+        years = columns['year']
+        self.min_year = int(years.min()) if len(years) else 0
+        self.radices = {
+            'player': max(len(player_names), 1),
+            'course': max(len(course_names), 1),
+            'day': len(DAYS),
+            'year': int(years.max()) - self.min_year + 1 if len(years) else 1,
+        }
+        if not len(years):
+            self.indexes = {name: (numpy.zeros(0, dtype=int64), numpy.zeros(0, dtype=int32)) for name in INDEXES}
+
+    def __len__(self):
+        return len(self.columns['year'])
+
+    def _encode(self, index_columns, values):
+        """Combine the values of an index's columns into the single sortable key the index is
+        searched by. Year is stored relative to the earliest year in the archive."""
+        key = 0
+        for column, value in zip(index_columns, values):
+            if column == 'year':
+                value = value - self.min_year
+            key = key*self.radices[column] + value
+        return key
+
+    def _build_indexes(self):
+        indexes = dict()
+        for name, index_columns in INDEXES.items():
+            values = [self.columns[column].astype(int64) for column in index_columns]
+            keys = self._encode(index_columns, values)
+            rows = numpy.argsort(keys, kind='stable').astype(int32)
+            indexes[name] = (keys[rows], rows)
+        return indexes
+
+    def freeze(self, year: int, active_players: dict, calcutta_teams: dict):
+        """Archive a finished tournament under its year, replacing any tournament already archived
+        for that year. Every round played is added to the round columns, and the players,
+        courses, Calcutta teams and final standings are written to the year's event file."""
+        keep = numpy.asarray(self.columns['year']) != year
+        columns = {column: numpy.asarray(values)[keep] for column, values in self.columns.items()}
+        player_names = list(self.player_names)
+        course_names = list(self.course_names)
+        player_index = dict(self.player_index)
+        course_index = dict(self.course_index)
+
+        new_rounds = {column: [] for column in ROUND_COLUMNS}
+        courses = dict()
+        for player_name, active_player in active_players.items():
+            if player_name not in player_index:
+                player_index[player_name] = len(player_names)
+                player_names.append(player_name)
+            for day_index, day in enumerate(DAYS):
+                day_model = active_player.days[day]
+                if not day_model:
+                    continue
+                course = day_model.course
+                courses[course.name] = {'par': [int(par) for par in course.par_order],
+                                        'handicap': [int(hc) for hc in course.handicap_order]}
+                if course.name not in course_index:
+                    course_index[course.name] = len(course_names)
+                    course_names.append(course.name)
+
+                new_rounds['year'].append(year)
+                new_rounds['day'].append(day_index)
+                new_rounds['player'].append(player_index[player_name])
+                new_rounds['course'].append(course_index[course.name])
+                new_rounds['handicap'].append(active_player.player_info.twisted_creek_handicap)
+                new_rounds['tournament'].append(active_player.active_tournament.value)
+                new_rounds['raw_scores'].append(list(day_model.scores))
+                new_rounds['points'].append(day_model.points)
+
+        for column, dtype in ROUND_COLUMNS.items():
+            values = numpy.asarray(new_rounds[column], dtype=dtype)
+            if column == 'raw_scores':
+                values = values.reshape(-1, COURSE_LENGTH)
+            columns[column] = numpy.concatenate([columns[column], values])
+
+        atomic_write(self._event_path(year), json.dumps(_event_record(year, active_players, calcutta_teams, courses)))
+        # Nothing is left memory mapped from the current generation while the next is written.
+        self._set_columns(columns, player_names, course_names)
+        self.indexes = self._build_indexes()
+        try:
+            self._save(sorted(set(self.years) | {year}))
+        except BaseException as error:
+            # The previous generation is mapped again, without hiding why the save failed.
+            try:
+                self._load()
+            except Exception:
+                raise error
+            raise
+        self._load()
+
+    def _save(self, years):
+        """Write the columns and indexes as a new generation, and only then switch the header over
+        to it, so a save cut short is never mistaken for a complete archive."""
+        generation = self.generation + 1
+        generation_path = self._generation_path(generation)
+        # A generation left behind by a save cut short is never in use, so it is written afresh.
+        shutil.rmtree(generation_path, ignore_errors=True)
+        os.makedirs(generation_path)
+        try:
+            self._save_generation(generation, years)
+        except BaseException:
+            # Before the first header is written the generations directory holds nothing else.
+            if self.generation == 0:
+                shutil.rmtree(os.path.join(self.archive_path, GENERATION_DIR), ignore_errors=True)
+            else:
+                shutil.rmtree(generation_path, ignore_errors=True)
+            raise
+
+        # Earlier generations are removed where they can be; any still open are removed next time.
+        for old_generation in os.listdir(os.path.join(self.archive_path, GENERATION_DIR)):
+            if old_generation != str(generation):
+                shutil.rmtree(self._generation_path(old_generation), ignore_errors=True)
+
+    def _save_generation(self, generation, years):
+        arrays = dict(self.columns)
+        arrays['player_names'] = numpy.asarray(self.player_names, dtype=str)
+        arrays['course_names'] = numpy.asarray(self.course_names, dtype=str)
+        for name, (keys, rows) in self.indexes.items():
+            arrays[f'index_{name}_keys'] = keys
+            arrays[f'index_{name}_rows'] = rows
+        for name, values in arrays.items():
+            with open(self._path(name, generation), 'wb') as array_file:
+                numpy.save(array_file, values, allow_pickle=False)
+
+        header = {'version': ARCHIVE_VERSION, 'generation': generation, 'years': years, 'rounds': len(self)}
+        atomic_write(os.path.join(self.archive_path, HEADER_FILE), json.dumps(header))
+
+    def event(self, year: int):
+        """Get the players, courses, Calcutta teams and final standings archived for the year."""
+        event_path = self._event_path(year)
+        if not os.path.exists(event_path):
+            raise KeyError(f"No tournament archived for {year}.")
+        with open(event_path, 'r') as event_file:
+            return json.load(event_file)
+
+    def find_rows(self, player: str=None, course: str=None, day: str=None, since: int=None, until: int=None):
+        """Get the rows of every archived round matching the filters, in index order. The rounds are
+        found by a binary search of the index that covers the most filters, and only those rounds
+        are checked against any filters the index does not cover."""
+        filters = dict()
+        if player is not None:
+            if player not in self.player_index:
+                return numpy.zeros(0, dtype=int32)
+            filters['player'] = self.player_index[player]
+        if course is not None:
+            if course not in self.course_index:
+                return numpy.zeros(0, dtype=int32)
+            filters['course'] = self.course_index[course]
+        if day is not None:
+            filters['day'] = DAYS.index(day)
+
+        max_year = self.min_year + self.radices['year'] - 1
+        first_year = self.min_year if since is None else max(since, self.min_year)
+        last_year = max_year if until is None else min(until, max_year)
+        if first_year > last_year or not len(self):
+            return numpy.zeros(0, dtype=int32)
+        year_range = (first_year, last_year) != (self.min_year, max_year)
+
+        index_name, prefix = self._choose_index(filters, year_range)
+        index_columns = INDEXES[index_name]
+        keys, rows = self.indexes[index_name]
+
+        # Every round matching the leading filters, and the year range when it is the next
+        # column, lies between the lowest and highest key they allow.
+        low, high = [], []
+        ranged = False
+        for i, column in enumerate(index_columns):
+            if i < prefix:
+                low.append(filters[column])
+                high.append(filters[column])
+            elif i == prefix and column == 'year' and year_range:
+                low.append(first_year)
+                high.append(last_year)
+                ranged = True
+            elif column == 'year':
+                low.append(self.min_year)
+                high.append(max_year)
+            else:
+                low.append(0)
+                high.append(self.radices[column] - 1)
+
+        start = numpy.searchsorted(keys, self._encode(index_columns, low), side='left')
+        stop = numpy.searchsorted(keys, self._encode(index_columns, high), side='right')
+        found = numpy.asarray(rows[start:stop])
+
+        for column, value in filters.items():
+            if column not in index_columns[:prefix]:
+                found = found[self.columns[column][found] == value]
+        if year_range and not ranged:
+            years = self.columns['year'][found]
+            found = found[(years >= first_year) & (years <= last_year)]
+        return found
+
+    def _choose_index(self, filters, year_range):
+        """Pick the index whose leading columns are covered by the most equality filters, preferring
+        one whose next column is the year when a year range is given."""
+        best = None
+        for index_name, index_columns in INDEXES.items():
+            prefix = 0
+            while prefix < len(index_columns) and index_columns[prefix] in filters:
+                prefix += 1
+            ranged = year_range and prefix < len(index_columns) and index_columns[prefix] == 'year'
+            score = (prefix, ranged, -len(index_columns))
+            if best is None or score > best[0]:
+                best = (score, index_name, prefix)
+        return best[1], best[2]
+
+    def rounds(self, **filters):
+        """Get every archived round matching the filters of find_rows as an ArchivedRound."""
+        rows = numpy.sort(self.find_rows(**filters))
+        columns = {column: self.columns[column][rows].tolist() for column in ROUND_COLUMNS}
+        tournaments = {tournament.value: tournament for tournament in ActiveTournament}
+        return [
+            ArchivedRound(year, DAYS[day], self.player_names[player], self.course_names[course], handicap,
+                          tournaments[tournament], [score or None for score in raw_scores], points)
+            for year, day, player, course, handicap, tournament, raw_scores, points in zip(*columns.values())
+        ]
+
+
+def _empty_columns():
+    columns = {column: numpy.zeros(0, dtype=dtype) for column, dtype in ROUND_COLUMNS.items()}
+    columns['raw_scores'] = columns['raw_scores'].reshape(0, COURSE_LENGTH)
+    return columns
+
+
+def _event_record(year, active_players, calcutta_teams, courses):
+    """Describe a finished tournament: who played with which handicap, the courses played, the
+    Calcutta teams and every final standing."""
+    rankings = TournamentRankings.from_field(active_players.values(), calcutta_teams.values())
+
+    def standings(index):
+        return [[name, *index.key(name)] for name in index.names()]
+
+    return {
+        'year': year,
+        'players': {player_name: {'mosley_open_handicap': active_player.player_info.mosley_open_handicap,
+                                  'twisted_creek_handicap': active_player.player_info.twisted_creek_handicap,
+                                  'tournament': active_player.active_tournament.value}
+                    for player_name, active_player in active_players.items()},
+        'courses': courses,
+        'teams': [{'player_1': team.player_1, 'player_2': team.player_2, 'days': team.days}
+                  for team in calcutta_teams.values()],
+        'standings': {
+            'mosley_open': standings(rankings.mosley_open),
+            'twisted_creek': standings(rankings.twisted_creek),
+            'dogfights': {day: standings(dogfight) for day, dogfight in rankings.dogfights.items()},
+            'calcutta': standings(rankings.calcutta),
+        },
+    }
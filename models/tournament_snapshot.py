@@ -0,0 +1,143 @@
+"""This file contains the functions for exporting the active players to a compact binary snapshot and
+loading them back in, so a tournament can be reopened without parsing the active data library."""
+
+import json
+import os
+
+import numpy
+from numpy import int8, int16, uint8
+
+from .active_player import ActivePlayer, ActiveTournament
+from .course import Course
+from .course_registry import course_registry
+from .day import COURSE_LENGTH, Day
+from .player import Player
+from .ranking import DAYS
+
+SNAPSHOT_VERSION = 2
+HEADER_FILE = 'header.json'
+NO_COURSE = -1
+
+
+def _column_path(snapshot_path, column):
+    return os.path.join(snapshot_path, f'{column}.npy')
+
+
+def library_state(library_path):
+    """Get the modification time and size of every model file in a library directory."""
+    if library_path is None or not os.path.isdir(library_path):
+        return dict()
+    return {entry.name: [entry.stat().st_mtime_ns, entry.stat().st_size]
+            for entry in os.scandir(library_path) if entry.name.endswith('.yaml')}
+
+
+def save_snapshot(snapshot_path: str, active_players: dict, library_path: str=None):
+    """Write every active player to a directory of .npy files: one column per player for each
+    handicap, the active flag and the tournament, and (player x day) columns for the course,
+    points and hole by hole scores. Player and course names are kept in fixed-width string
+    tables, and each course's par and handicap order in an int8 table. When the data library the
+    players were saved to is given, the state of its files is recorded so a stale snapshot is
+    never loaded in place of it. The header is written last, so a snapshot cut short is never
+    mistaken for a complete one."""
+    os.makedirs(snapshot_path, exist_ok=True)
+    header_path = os.path.join(snapshot_path, HEADER_FILE)
+    if os.path.exists(header_path):
+        os.remove(header_path)
+    state = library_state(library_path)
+
+    player_count = len(active_players)
+    raw_scores = numpy.zeros((player_count, len(DAYS), COURSE_LENGTH), dtype=int8)
+    course_ids = numpy.full((player_count, len(DAYS)), NO_COURSE, dtype=int16)
+    points = numpy.zeros((player_count, len(DAYS)), dtype=int16)
+    course_index = dict()
+    courses = []
+    for row, active_player in enumerate(active_players.values()):
+        for day_index, day in enumerate(DAYS):
+            day_model = active_player.days[day]
+            if not day_model:
+                continue
+            course = day_model.course
+            if course.name not in course_index:
+                course_index[course.name] = len(courses)
+                courses.append(course)
+            # Holes that have not been played yet are stored as a raw score of zero, as in the Day.
+            raw_scores[row, day_index] = numpy.frombuffer(day_model.scores, dtype=int8)
+            course_ids[row, day_index] = course_index[course.name]
+            points[row, day_index] = day_model.points
+
+    players = [active_player.player_info for active_player in active_players.values()]
+    columns = {
+        'raw_scores': raw_scores,
+        'course_ids': course_ids,
+        'points': points,
+        'tournaments': numpy.asarray([active_player.active_tournament.value for active_player in active_players.values()], dtype=int8),
+        'mosley_open_handicaps': numpy.asarray([player.mosley_open_handicap for player in players], dtype=int8),
+        'twisted_creek_handicaps': numpy.asarray([player.twisted_creek_handicap for player in players], dtype=int8),
+        'active': numpy.asarray([player.active for player in players], dtype=bool),
+        'player_names': numpy.asarray([player.name for player in players], dtype=str),
+        'course_names': numpy.asarray([course.name for course in courses], dtype=str),
+        'course_par': numpy.asarray([course.par_order for course in courses], dtype=int8).reshape(-1, COURSE_LENGTH),
+        'course_handicap': numpy.asarray([course.handicap_order for course in courses], dtype=int8).reshape(-1, COURSE_LENGTH),
+    }
+    for column, values in columns.items():
+        numpy.save(_column_path(snapshot_path, column), values, allow_pickle=False)
+
+    with open(header_path, 'w') as header_file:
+        json.dump({'version': SNAPSHOT_VERSION, 'players': player_count, 'courses': len(courses), 'library': state}, header_file)
+
+
+def _load_header(snapshot_path):
+    header_path = os.path.join(snapshot_path, HEADER_FILE)
+    if not os.path.exists(header_path):
+        raise FileNotFoundError(f"No complete tournament snapshot at {snapshot_path}.")
+    with open(header_path, 'r') as header_file:
+        header = json.load(header_file)
+    if header['version'] != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported tournament snapshot version {header['version']}.")
+    return header
+
+
+def snapshot_is_current(snapshot_path: str, library_path: str):
+    """Whether a complete snapshot exists and no file in the data library has changed since it
+    was written."""
+    try:
+        header = _load_header(snapshot_path)
+    except (FileNotFoundError, ValueError):
+        return False
+    return header['library'] == library_state(library_path)
+
+
+def load_snapshot(snapshot_path: str):
+    """Load the active players of a snapshot, keyed by player name. Each column is read in one
+    piece and every Day keeps the points it was saved with rather than being scored again."""
+    header = _load_header(snapshot_path)
+
+    def load_column(column):
+        return numpy.load(_column_path(snapshot_path, column), allow_pickle=False).tolist()
+
+    courses = [course_registry.intern(Course(course_name, course_par, course_handicap)) for course_name, course_par, course_handicap
+               in zip(load_column('course_names'), load_column('course_par'), load_column('course_handicap'))]
+
+    # The scores are stored packed one byte per hole, as a Day keeps them, so each round is a slice.
+    packed_scores = numpy.load(_column_path(snapshot_path, 'raw_scores'), allow_pickle=False).astype(uint8).tobytes()
+    round_length = len(DAYS)*COURSE_LENGTH
+
+    active_players = dict()
+    tournaments = {tournament.value: tournament for tournament in ActiveTournament}
+    for row, (player_name, mosley_open_handicap, twisted_creek_handicap, active, tournament, player_course_ids, player_points) in enumerate(zip(
+            load_column('player_names'), load_column('mosley_open_handicaps'), load_column('twisted_creek_handicaps'),
+            load_column('active'), load_column('tournaments'), load_column('course_ids'), load_column('points'))):
+        player = Player(player_name, twisted_creek_handicap)
+        player.mosley_open_handicap = mosley_open_handicap
+        player.active = active
+
+        active_player = ActivePlayer(player, tournaments[tournament])
+        for day_index, (day, course_id, day_points) in enumerate(zip(DAYS, player_course_ids, player_points)):
+            if course_id != NO_COURSE:
+                start = row*round_length + day_index*COURSE_LENGTH
+                active_player.days[day] = Day.from_scores(courses[course_id], packed_scores[start:start+COURSE_LENGTH], day_points)
+        active_players[player_name] = active_player
+
+    if len(active_players) != header['players'] or len(courses) != header['courses']:
+        raise ValueError(f"Tournament snapshot at {snapshot_path} does not match its header.")
+    return active_players
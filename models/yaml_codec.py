@@ -0,0 +1,78 @@
+"""This file contains the YAML codec used to save and load every model. Only the model classes
+registered here can be loaded, so a data file can not run arbitrary code. The files keep the
+same !!python/object tags as before, and libyaml is used when it is available."""
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+OBJECT_TAG_PREFIX = 'tag:yaml.org,2002:python/object:'
+APPLY_TAG_PREFIX = 'tag:yaml.org,2002:python/object/apply:'
+
+# Event listeners are bound to the running application, so they are never saved.
+TRANSIENT_STATE = {'_event_listeners': {}}
+
+
+class ModelLoader(SafeLoader):
+    """A safe loader that can also construct the registered model classes."""
+
+
+class ModelDumper(SafeDumper):
+    """A safe dumper that can also represent the registered model classes."""
+
+
+def class_tag(cls, prefix=OBJECT_TAG_PREFIX):
+    return f'{prefix}{cls.__module__}.{cls.__qualname__}'
+
+
+def register_model(cls):
+    """Allow instances of the class to be saved and loaded. Instances are written as a mapping
+    of their state, using __getstate__ and __setstate__ when the class defines them."""
+    tag = class_tag(cls)
+
+    def represent_model(dumper, model):
+        state = model.__getstate__() if hasattr(model, '__getstate__') else model.__dict__
+        state = {key: TRANSIENT_STATE.get(key, value) for key, value in state.items()}
+        return dumper.represent_mapping(tag, state)
+
+    def construct_model(loader, node):
+        model = cls.__new__(cls)
+        state = loader.construct_mapping(node, deep=True)
+        if hasattr(model, '__setstate__'):
+            model.__setstate__(state)
+        else:
+            model.__dict__.update(state)
+        return model
+
+    ModelDumper.add_representer(cls, represent_model)
+    ModelLoader.add_constructor(tag, construct_model)
+    return cls
+
+
+def register_enum(cls):
+    """Allow members of the enum to be saved and loaded by value."""
+    tag = class_tag(cls, APPLY_TAG_PREFIX)
+
+    def represent_enum(dumper, member):
+        return dumper.represent_sequence(tag, [member.value])
+
+    def construct_enum(loader, node):
+        value, = loader.construct_sequence(node)
+        return cls(value)
+
+    ModelDumper.add_representer(cls, represent_enum)
+    ModelLoader.add_constructor(tag, construct_enum)
+    return cls
+
+
+def load(stream):
+    """Load a model from a YAML stream or string."""
+    return yaml.load(stream, Loader=ModelLoader)
+
+
+def dump(data, stream=None):
+    """Write a model to a YAML stream, or return it as a string when no stream is given."""
+    return yaml.dump(data, stream, Dumper=ModelDumper)
@@ -0,0 +1,17 @@
+"""This file contains helpers shared by the test modules."""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+
+def scandir_entries(library_path, filenames, mtime_ns=0):
+    """Build stand-ins for the directory entries found when scanning a library."""
+    entries = []
+    for filename in filenames:
+        entry = MagicMock()
+        entry.name = filename
+        entry.path = os.path.join(library_path, filename)
+        entry.stat.return_value = SimpleNamespace(st_mtime_ns=mtime_ns, st_size=100)
+        entries.append(entry)
+    return entries
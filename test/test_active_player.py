@@ -0,0 +1,103 @@
+import unittest
+import yaml
+
+from models.active_player import ActivePlayer, ActiveTournament
+from models.course import Course
+from models.day import Day
+from models.player import Player
+
+
+class TestActivePlayer(unittest.TestCase):
+
+    def setUp(self):
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.handicap_order = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18]
+        self.course = Course("Test Course", self.par_order, self.handicap_order)
+        self.player = Player("John Doe", 25)
+        self.active_player = ActivePlayer(self.player)
+
+    def test_initialization(self):
+        self.assertEqual(self.active_player.active_tournament, ActiveTournament.BothTournaments)
+        self.assertEqual(self.active_player.number_of_days_played, 0)
+        self.assertEqual(self.active_player.total_raw_score, 0)
+        self.assertEqual(self.active_player.net_mosley_open_points, 0)
+        self.assertEqual(self.active_player.net_twisted_creek_score, 0)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(TypeError):
+            ActivePlayer("John Doe")
+        with self.assertRaises(TypeError):
+            ActivePlayer(self.player, 1)
+
+    def test_running_totals(self):
+        day_1 = Day(self.course, list(self.par_order))
+        day_2 = Day(self.course, [par + 1 for par in self.par_order])
+        self.active_player.days['Day 1'] = day_1
+        self.active_player.days['Day 2'] = day_2
+
+        self.assertEqual(self.active_player.number_of_days_played, 2)
+        self.assertEqual(self.active_player.total_raw_score, 2*sum(self.par_order) + 18)
+        self.assertEqual(self.active_player.net_mosley_open_points,
+                         day_1.get_net_points(20) + day_2.get_net_points(20))
+        self.assertEqual(self.active_player.net_twisted_creek_score,
+                         day_1.get_net_points(25) + day_2.get_net_points(25))
+
+        # Replacing a day removes the old day from the totals
+        self.active_player.days['Day 2'] = day_1
+        self.assertEqual(self.active_player.number_of_days_played, 2)
+        self.assertEqual(self.active_player.total_raw_score, 2*sum(self.par_order))
+        self.assertEqual(self.active_player.net_twisted_creek_score, 2*day_1.get_net_points(25))
+
+        self.active_player.days['Day 2'] = None
+        self.assertEqual(self.active_player.number_of_days_played, 1)
+        self.assertEqual(self.active_player.total_raw_score, sum(self.par_order))
+
+    def test_handicap_change(self):
+        day_1 = Day(self.course, list(self.par_order))
+        self.active_player.days['Day 1'] = day_1
+        self.player.twisted_creek_handicap = 10
+        self.assertEqual(self.active_player.net_twisted_creek_score, day_1.get_net_points(10))
+
+    def test_set_hole_score(self):
+        with self.assertRaises(ValueError):
+            self.active_player.set_hole_score('Day 1', 0, 4)
+
+        self.active_player.set_hole_score('Day 1', 0, 3, self.course)
+        self.active_player.set_hole_score('Day 1', 1, 5)
+        day = self.active_player.days['Day 1']
+        self.assertEqual(day.thru, 2)
+        self.assertEqual(self.active_player.number_of_days_played, 1)
+        self.assertEqual(self.active_player.total_raw_score, 8)
+        self.assertEqual(self.active_player.net_twisted_creek_score, 5 - (36-25))
+
+        for hole, par in enumerate(self.par_order):
+            self.active_player.set_hole_score('Day 1', hole, par)
+        self.assertEqual(self.active_player.total_raw_score, sum(self.par_order))
+        self.assertEqual(self.active_player.net_twisted_creek_score, Day(self.course, list(self.par_order)).get_net_points(25))
+
+    def test_invalid_first_hole_score(self):
+        for strokes in (0, 20):
+            with self.assertRaises(KeyError):
+                self.active_player.set_hole_score('Day 1', 0, strokes, self.course)
+        self.assertIsNone(self.active_player.days['Day 1'])
+        self.assertEqual(self.active_player.number_of_days_played, 0)
+        self.assertEqual(self.active_player.net_twisted_creek_score, 0)
+
+    def test_yaml_round_trip(self):
+        day_1 = Day(self.course, [par + 1 for par in self.par_order])
+        self.active_player.days['Day 1'] = day_1
+
+        yaml_data = yaml.dump(self.active_player)
+        self.assertNotIn('_total_points', yaml_data)
+        loaded_player = yaml.load(yaml_data, Loader=yaml.Loader)
+
+        self.assertEqual(loaded_player.number_of_days_played, 1)
+        self.assertEqual(loaded_player.total_raw_score, day_1.total_raw_score)
+        self.assertEqual(loaded_player.net_mosley_open_points, self.active_player.net_mosley_open_points)
+
+        loaded_player.days['Day 2'] = Day(self.course, list(self.par_order))
+        self.assertEqual(loaded_player.number_of_days_played, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from models import active_player_list
+from models.active_player import ActivePlayer
+from models.active_player_list import ActivePlayerList
+from models.course import Course
+from models.day import Day
+from models.player import Player
+from models.score_journal import ScoreJournal
+
+
+class TestActivePlayerList(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        os.makedirs(os.path.join('active_data_lib', 'active_players'))
+        self.patcher = patch.object(active_player_list, 'DATA_LIB_PATH', os.path.abspath(os.path.join('active_data_lib', 'active_players')))
+        self.patcher.start()
+
+        self.course = Course('Test Course', [4]*18, list(range(1, 19)))
+        self.player_list_model = MagicMock()
+        self.player_list_model.player_list = dict()
+        for name in ('John Doe', 'Jane Doe', 'Jim Doe'):
+            player = Player(name, 10)
+            player.active = name != 'Jim Doe'
+            self.player_list_model.player_list[name] = player
+
+    def tearDown(self):
+        self.patcher.stop()
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def test_load_creates_active_players(self):
+        active_players = ActivePlayerList(self.player_list_model).active_player_list
+        self.assertEqual(set(active_players), {'John Doe', 'Jane Doe'})
+        self.assertTrue(os.path.exists(active_players['John Doe'].save_path))
+
+    def test_load_keeps_saved_days(self):
+        active_player = ActivePlayer(self.player_list_model.player_list['John Doe'])
+        active_player.days['Day 1'] = Day(self.course, [4]*18)
+        active_player.save()
+
+        active_players = ActivePlayerList(self.player_list_model).active_player_list
+        self.assertEqual(active_players['John Doe'].days['Day 1'].raw_score_list, [4]*18)
+
+    def test_refresh_only_touches_changed_players(self):
+        active_player_list_model = ActivePlayerList(self.player_list_model)
+        john = active_player_list_model.active_player_list['John Doe']
+        jane = active_player_list_model.active_player_list['Jane Doe']
+        john.days['Day 1'] = Day(self.course, [4]*18)
+
+        player_list = self.player_list_model.player_list
+        player_list['Jim Doe'].active = True
+        player_list['Jane Doe'].active = False
+        player_list['John Doe'] = Player('John Doe', 12)
+        player_list['John Doe'].active = True
+
+        with patch.object(ActivePlayer, 'save', autospec=True) as mock_save, \
+             patch.object(ActivePlayer, 'delete', autospec=True) as mock_delete:
+            active_player_list_model.refresh_player_list(self.player_list_model)
+
+        active_players = active_player_list_model.active_player_list
+        self.assertEqual(set(active_players), {'John Doe', 'Jim Doe'})
+        self.assertIs(active_players['John Doe'], john)
+        self.assertEqual(john.days['Day 1'].raw_score_list, [4]*18)
+        self.assertEqual(john.player_info.twisted_creek_handicap, 12)
+        self.assertEqual(john.net_twisted_creek_score, john.days['Day 1'].points - 24)
+
+        saved = {call.args[0].player_info.name for call in mock_save.call_args_list}
+        self.assertEqual(saved, {'John Doe', 'Jim Doe'})
+        mock_delete.assert_called_once_with(jane)
+
+    def test_refresh_saves_players_edited_in_place(self):
+        active_player_list_model = ActivePlayerList(self.player_list_model)
+        john = active_player_list_model.active_player_list['John Doe']
+        self.assertIs(john.player_info, self.player_list_model.player_list['John Doe'])
+
+        john.player_info.mosley_open_handicap = 4
+        with patch.object(ActivePlayer, 'save', autospec=True) as mock_save:
+            active_player_list_model.refresh_player_list(self.player_list_model)
+        mock_save.assert_called_once_with(john)
+
+        with patch.object(ActivePlayer, 'save') as mock_save:
+            active_player_list_model.refresh_player_list(self.player_list_model)
+        mock_save.assert_not_called()
+
+    def test_refresh_after_journal_start_finds_players_edited_in_place(self):
+        journal = ScoreJournal('journal')
+        journal.start(ActivePlayerList(self.player_list_model).active_player_list, dict())
+        active_player_list_model = ActivePlayerList(self.player_list_model, journal=journal)
+        john = active_player_list_model.active_player_list['John Doe']
+
+        john.player_info.twisted_creek_handicap = 14
+        self.assertEqual(active_player_list_model.reconcile(self.player_list_model), ([], [john], []))
+        self.assertEqual(active_player_list_model.reconcile(self.player_list_model), ([], [], []))
+
+    def test_refresh_without_changes_writes_nothing(self):
+        active_player_list_model = ActivePlayerList(self.player_list_model)
+        with patch.object(ActivePlayer, 'save') as mock_save, patch.object(ActivePlayer, 'delete') as mock_delete:
+            active_player_list_model.refresh_player_list(self.player_list_model)
+        mock_save.assert_not_called()
+        mock_delete.assert_not_called()
+
+    def test_start_from_snapshot(self):
+        active_player_list_model = ActivePlayerList(self.player_list_model, snapshot_path='snapshot')
+        john = active_player_list_model.active_player_list['John Doe']
+        john.days['Day 1'] = Day(self.course, [4]*18)
+        john.save()
+        active_player_list_model.save_snapshot()
+
+        with patch.object(active_player_list, 'load_library') as mock_load_library:
+            active_players = ActivePlayerList(self.player_list_model, snapshot_path='snapshot').active_player_list
+        mock_load_library.assert_not_called()
+        self.assertEqual(set(active_players), {'John Doe', 'Jane Doe'})
+        self.assertEqual(active_players['John Doe'].days['Day 1'].raw_score_list, [4]*18)
+
+        # Once the data library changes, the snapshot is out of date and the library is read.
+        john.days['Day 2'] = Day(self.course, [5]*18)
+        john.save()
+        active_players = ActivePlayerList(self.player_list_model, snapshot_path='snapshot').active_player_list
+        self.assertEqual(active_players['John Doe'].days['Day 2'].raw_score_list, [5]*18)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+
+from benchmarks.run_benchmarks import BENCHMARKS, compare, run_benchmarks
+from benchmarks.synthetic import DAYS, SyntheticTournament
+
+
+class TestSyntheticTournament(unittest.TestCase):
+
+    def test_seed_is_repeatable(self):
+        tournament_1 = SyntheticTournament(20, seed=3)
+        tournament_2 = SyntheticTournament(20, seed=3)
+        for day in DAYS:
+            np.testing.assert_array_equal(tournament_1.score_matrices[day], tournament_2.score_matrices[day])
+        self.assertEqual([player.mosley_open_handicap for player in tournament_1.players],
+                         [player.mosley_open_handicap for player in tournament_2.players])
+
+    def test_active_players_and_teams(self):
+        tournament = SyntheticTournament(11)
+        active_players = tournament.active_players(['Day 1'])
+        self.assertEqual(len(active_players), 11)
+        self.assertTrue(all(player.days['Day 1'] for player in active_players.values()))
+        self.assertIsNone(next(iter(active_players.values())).days['Day 2'])
+        self.assertEqual(len(tournament.calcutta_teams()), 5)
+
+
+class TestRunBenchmarks(unittest.TestCase):
+
+    def test_run_and_compare(self):
+        names = ['day_scoring', 'calcutta_scoring', 'rankings', 'course_list_load']
+        results = run_benchmarks([10], names, repeat=1, log=lambda line: None)
+        self.assertEqual([result['benchmark'] for result in results], names)
+        for result in results:
+            self.assertEqual(result['size'], 10)
+            self.assertGreater(result['seconds'], 0)
+            self.assertGreaterEqual(result['peak_bytes'], 0)
+
+        lines = []
+        compare(results, results, log=lines.append)
+        self.assertEqual(len(lines), len(names))
+        self.assertIn('x  1.00', lines[0])
+
+    def test_every_benchmark_is_known(self):
+        self.assertIn('leaderboard', BENCHMARKS)
+        self.assertIn('active_player_list_load', BENCHMARKS)
+
+
+if __name__ == '__main__':
+    unittest.main()
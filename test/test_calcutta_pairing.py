@@ -0,0 +1,47 @@
+import unittest
+from numpy.random import default_rng
+
+from models.calcutta_pairing import pair_balanced, pair_best_with_worst
+from models.calcutta_team import calculate_field_team_points
+
+
+class TestCalcuttaPairing(unittest.TestCase):
+
+    def setUp(self):
+        rng = default_rng(0)
+        self.net_score_matrix = rng.integers(-2, 3, (20, 18))
+        self.modifiers = rng.integers(0, 4, 20)
+
+    def test_pair_best_with_worst(self):
+        self.assertEqual(pair_best_with_worst(6), [(0, 5), (1, 4), (2, 3)])
+        self.assertEqual(pair_best_with_worst(2), [(0, 1)])
+
+    def test_pair_balanced_even_field(self):
+        pairs = pair_balanced(self.net_score_matrix, self.modifiers)
+        self.assertEqual(len(pairs), 10)
+        self.assertEqual(sorted(row for pair in pairs for row in pair), list(range(20)))
+        for i, j in pairs:
+            self.assertLess(i, 10)
+            self.assertGreaterEqual(j, 10)
+
+    def test_pair_balanced_is_more_even(self):
+        balanced_points = calculate_field_team_points(self.net_score_matrix, self.modifiers,
+                                                      pair_balanced(self.net_score_matrix, self.modifiers))
+        default_points = calculate_field_team_points(self.net_score_matrix, self.modifiers, pair_best_with_worst(20))
+        self.assertLessEqual(balanced_points.var(), default_points.var())
+
+    def test_pair_balanced_odd_field(self):
+        pairs = pair_balanced(self.net_score_matrix[:7], self.modifiers[:7])
+        self.assertEqual(len(pairs), 4)
+        rows = [row for pair in pairs for row in pair]
+        self.assertEqual(rows.count(3), 2)
+        self.assertEqual(sorted(set(rows)), list(range(7)))
+        self.assertNotIn((3, 3), pairs)
+
+    def test_pair_balanced_too_few_players(self):
+        self.assertEqual(pair_balanced(self.net_score_matrix[:1], self.modifiers[:1]), [])
+        self.assertEqual(pair_balanced(self.net_score_matrix[:0], self.modifiers[:0]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from models.course import Course
+from models.day import Day, calculate_field_calcutta_scores
+from models.calcutta_team import CalcuttaTeam, calculate_field_team_points, calculate_hole_points
+
+
+class TestCalcuttaTeam(unittest.TestCase):
+
+    def setUp(self):
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.handicap_order = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18]
+        self.course = Course("Test Course", self.par_order, self.handicap_order)
+        self.score_lists = [
+            [par + (hole % 3) - 1 for hole, par in enumerate(self.par_order)],
+            [par + 1 for par in self.par_order],
+            list(self.par_order),
+            [par + (hole % 2) for hole, par in enumerate(self.par_order)],
+        ]
+        self.handicaps = [5, 22, 0, 12]
+
+    def test_calculate_field_scores_matches_single_team(self):
+        days = Day.from_field(self.course, self.score_lists)
+        teams = [CalcuttaTeam('A', 'B'), CalcuttaTeam('C', 'D'), CalcuttaTeam('A', 'D')]
+        team_index = [[0, 1], [2, 3], [0, 3]]
+
+        net_score_matrix, modifiers = calculate_field_calcutta_scores(
+            self.score_lists, self.course.par_array, self.course.dot_table[self.handicaps])
+        CalcuttaTeam.calculate_field_scores(teams, net_score_matrix, modifiers, team_index, 'Day 1')
+
+        for team, (i, j) in zip(teams, team_index):
+            expected_team = CalcuttaTeam(team.player_1, team.player_2)
+            scores_1, modifiers_1 = days[i].get_calcutta_scores(self.handicaps[i])
+            scores_2, modifiers_2 = days[j].get_calcutta_scores(self.handicaps[j])
+            expected_team.calculate_scores(scores_1, modifiers_1, scores_2, modifiers_2, 'Day 1')
+            self.assertEqual(team.days['Day 1'], expected_team.days['Day 1'])
+
+    def test_update_hole_matches_full_round(self):
+        team = CalcuttaTeam('A', 'B')
+        days = [Day.empty(self.course), Day.empty(self.course)]
+        for hole in range(18):
+            for i in range(2):
+                old_points = calculate_hole_points(days[0].get_calcutta_hole(hole, self.handicaps[0]),
+                                                   days[1].get_calcutta_hole(hole, self.handicaps[1]))
+                days[i].set_hole(hole, self.score_lists[i][hole])
+                new_points = calculate_hole_points(days[0].get_calcutta_hole(hole, self.handicaps[0]),
+                                                   days[1].get_calcutta_hole(hole, self.handicaps[1]))
+                team.update_hole('Day 2', old_points, new_points)
+
+        expected_team = CalcuttaTeam('A', 'B')
+        scores_1, modifiers_1 = days[0].get_calcutta_scores(self.handicaps[0])
+        scores_2, modifiers_2 = days[1].get_calcutta_scores(self.handicaps[1])
+        expected_team.calculate_scores(scores_1, modifiers_1, scores_2, modifiers_2, 'Day 2')
+        self.assertEqual(team.days['Day 2'], expected_team.days['Day 2'])
+
+    def test_calculate_field_team_points(self):
+        net_score_matrix = [[0] * 18, [-1] * 18]
+        points = calculate_field_team_points(net_score_matrix, [0, 2], [[0, 1]])
+        self.assertEqual(list(points), [3*18 + 2 - 36])
+
+    def test_calculate_field_scores_invalid_day(self):
+        with self.assertRaises(KeyError):
+            CalcuttaTeam.calculate_field_scores([CalcuttaTeam('A', 'B')], [[0] * 18], [0], [[0, 0]], 'Day 4')
+
+    def test_total_points(self):
+        team = CalcuttaTeam('A', 'B')
+        team.days = {'Day 1': 3, 'Day 2': -1, 'Day 3': 0}
+        self.assertEqual(team.total_points, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
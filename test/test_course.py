@@ -4,6 +4,7 @@ from unittest.mock import patch, mock_open, MagicMock
 
 sys.path.append("/Users/sammo/Mosley_Open_v4")
 from models.course import Course
+from models.yaml_codec import ModelDumper
 
 
 class TestCourseModel(unittest.TestCase):
@@ -45,12 +46,39 @@ class TestCourseModel(unittest.TestCase):
             Course(self.course_name, self.par_order, list(range(1, 18)))
         self.assertEqual(str(context.exception), "Course handicap length must be 18, got 17.")
 
+    def test_scoring_tables(self):
+        par_array = self.course.par_array
+        self.assertEqual(par_array.tolist(), self.par_order)
+        self.assertFalse(par_array.flags.writeable)
+        self.assertIs(self.course.par_array, par_array)
+
+        dot_table = self.course.dot_table
+        self.assertEqual(dot_table.shape, (55, 18))
+        self.assertFalse(dot_table.flags.writeable)
+        self.assertEqual(dot_table[0].tolist(), [0] * 18)
+        self.assertEqual(dot_table[19].tolist(), [2] + [1] * 17)
+        self.assertEqual(dot_table[54].tolist(), [2] * 18)
+
+    def test_invalidate_scoring_tables(self):
+        par_array = self.course.par_array
+        self.course.par_order = [3] * 18
+        self.assertIs(self.course.par_array, par_array)
+
+        self.course.invalidate_scoring_tables()
+        self.assertEqual(self.course.par_array.tolist(), [3] * 18)
+
+    def test_scoring_tables_not_saved(self):
+        self.course.par_array
+        self.course.dot_table
+        self.assertNotIn('_par_array', self.course.__getstate__())
+        self.assertNotIn('_dot_table', self.course.__getstate__())
+
     @patch("builtins.open", new_callable=mock_open)
     @patch("yaml.dump")
     def test_save_course(self, mock_yaml_dump, mock_open):
         self.course.save()
         mock_open.assert_called_once_with(self.course.save_path, 'w')
-        mock_yaml_dump.assert_called_once_with(self.course, mock_open())
+        mock_yaml_dump.assert_called_once_with(self.course, mock_open(), Dumper=ModelDumper)
 
     @patch('models.course.path.exists')
     @patch('models.course.remove')
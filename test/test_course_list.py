@@ -3,9 +3,12 @@ from unittest.mock import patch, mock_open, MagicMock
 import os
 import yaml
 
-from models.course_list import CourseList
+from models.course_list import CourseList, COURSE_LIB_PATH
 from models.course import Course
 
+from test.helpers import scandir_entries
+
+
 class TestCourseList(unittest.TestCase):
 
     def setUp(self):
@@ -27,11 +30,11 @@ class TestCourseList(unittest.TestCase):
 
         self.course_lib_path = '\\Users\\sammo\\Mosley_Open_v4\\courselib'
 
-    @patch('os.listdir')
+    @patch('os.scandir')
     @patch('builtins.open', new_callable=mock_open, read_data='')
     @patch('yaml.load')
-    def test_load_course_library(self, mock_yaml_load, mock_open, mock_listdir):
-        mock_listdir.return_value = ['course1.yaml', 'course2.yaml']
+    def test_load_course_library(self, mock_yaml_load, mock_open, mock_scandir):
+        mock_scandir.return_value = scandir_entries(COURSE_LIB_PATH, ['course1.yaml', 'course2.yaml'])
         mock_yaml_load.side_effect = [self.mock_course1, self.mock_course2]
         
         course_list = CourseList()
@@ -40,21 +43,21 @@ class TestCourseList(unittest.TestCase):
         self.assertIn('Sample Course1', course_list.course_list)
         self.assertIn('Sample Course2', course_list.course_list)
 
-    @patch('os.listdir')
+    @patch('os.scandir')
     @patch('builtins.open', new_callable=mock_open, read_data='')
     @patch('yaml.load')
-    def test_load_course_library_invalid_course(self, mock_yaml_load, mock_open, mock_listdir):
-        mock_listdir.return_value = ['invalid_course.yaml']
+    def test_load_course_library_invalid_course(self, mock_yaml_load, mock_open, mock_scandir):
+        mock_scandir.return_value = scandir_entries(COURSE_LIB_PATH, ['invalid_course.yaml'])
         mock_yaml_load.return_value = {}
 
         with self.assertRaises(TypeError):
             CourseList()
 
-    @patch('os.listdir')
+    @patch('os.scandir')
     @patch('builtins.open', new_callable=mock_open, read_data='')
     @patch('yaml.load')
-    def test_refresh_course_list(self, mock_yaml_load, mock_open, mock_listdir):
-        mock_listdir.return_value = ['course1.yaml']
+    def test_refresh_course_list(self, mock_yaml_load, mock_open, mock_scandir):
+        mock_scandir.return_value = scandir_entries(COURSE_LIB_PATH, ['course1.yaml'])
         mock_yaml_load.return_value = self.mock_course1
         
         course_list = CourseList()
@@ -63,12 +66,20 @@ class TestCourseList(unittest.TestCase):
         self.assertEqual(len(course_list.course_list), 1)
         
         # Update the mock to simulate a new course file
-        mock_listdir.return_value = ['course1.yaml', 'course2.yaml']
-        mock_yaml_load.side_effect = [self.mock_course1, self.mock_course2]
+        mock_scandir.return_value = scandir_entries(COURSE_LIB_PATH, ['course1.yaml', 'course2.yaml'])
+        mock_yaml_load.side_effect = [self.mock_course2]
         course_list.refresh_course_list()
         
-        # After refreshing, two courses should be loaded
+        # After refreshing, two courses should be loaded, and only the new file read
         self.assertEqual(len(course_list.course_list), 2)
+        self.assertEqual(mock_yaml_load.call_count, 2)
+
+        # A changed file is read again, and a removed file is dropped
+        mock_scandir.return_value = scandir_entries(COURSE_LIB_PATH, ['course2.yaml'], mtime_ns=1)
+        mock_yaml_load.side_effect = [self.mock_course2]
+        course_list.refresh_course_list()
+        self.assertEqual(list(course_list.course_list), ['Sample Course2'])
+        self.assertEqual(mock_yaml_load.call_count, 3)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
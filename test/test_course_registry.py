@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from models import course_list
+from models import yaml_codec
+from models.active_player import ActivePlayer
+from models.course import Course
+from models.course_registry import CourseRegistry, course_registry
+from models.day import Day
+from models.player import Player
+
+
+class TestCourseRegistry(unittest.TestCase):
+
+    def setUp(self):
+        course_registry.clear()
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.handicap_order = list(range(1, 19))
+        self.course = Course("Test Course", self.par_order, self.handicap_order)
+
+    def test_intern_keeps_first_instance(self):
+        registry = CourseRegistry()
+        self.assertIs(registry.intern(self.course), self.course)
+        self.assertIs(registry.intern(Course("Test Course", self.par_order, self.handicap_order)), self.course)
+        self.assertIs(registry.get("Test Course"), self.course)
+
+    def test_update_merges_into_registered_instance(self):
+        registry = CourseRegistry()
+        registry.register(self.course)
+        self.course.par_array
+
+        edited_course = Course("Test Course", [4]*18, self.handicap_order)
+        self.assertIs(registry.update(edited_course), self.course)
+        self.assertEqual(self.course.par_order, [4]*18)
+        self.assertEqual(self.course.par_array.tolist(), [4]*18)
+
+    def test_get_loads_unknown_course_from_library(self):
+        registry = CourseRegistry()
+        with tempfile.TemporaryDirectory() as library_path, patch.object(course_list, 'COURSE_LIB_PATH', library_path):
+            with open(os.path.join(library_path, 'Test Course.yaml'), 'w') as course_file:
+                yaml_codec.dump(self.course, course_file)
+
+            self.assertEqual(registry.get("Test Course").par_order, self.par_order)
+            with self.assertRaises(KeyError):
+                registry.get("Missing Course")
+
+    def test_day_saved_by_course_id(self):
+        active_player = ActivePlayer(Player("John Doe", 10))
+        active_player.days['Day 1'] = Day(self.course, list(self.par_order))
+        active_player.days['Day 2'] = Day(self.course, [5]*18)
+
+        data = yaml_codec.dump(active_player)
+        self.assertNotIn('par_order', data)
+
+        loaded_player = yaml_codec.load(data)
+        self.assertIs(loaded_player.days['Day 1'].course, self.course)
+        self.assertIs(loaded_player.days['Day 2'].course, self.course)
+        self.assertEqual(loaded_player.days['Day 1'].points, active_player.days['Day 1'].points)
+        self.assertEqual(loaded_player.total_raw_score, active_player.total_raw_score)
+
+    def test_legacy_day_is_interned(self):
+        course_registry.register(self.course)
+        # Days saved before courses were interned embed a full copy of the course.
+        course_data = yaml_codec.dump(Course("Test Course", self.par_order, self.handicap_order))
+        legacy_data = ("!!python/object:models.day.Day\ncourse: " + course_data.replace('\n', '\n  ') +
+                       "\npoints: 38\nraw_score_list: " + str([4]*18) + "\n")
+
+        legacy_day = yaml_codec.load(legacy_data)
+        self.assertIs(legacy_day.course, self.course)
+        self.assertEqual(legacy_day.course_id, "Test Course")
+        self.assertEqual(legacy_day.points, 38)
+
+
+if __name__ == '__main__':
+    unittest.main()
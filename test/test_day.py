@@ -0,0 +1,141 @@
+import unittest
+
+from models.course import Course
+from models.day import Day, InvalidScoreError, calculate_days_calcutta_scores, calculate_field_points, stack_scores
+
+
+class TestDay(unittest.TestCase):
+
+    def setUp(self):
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.handicap_order = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18]
+        self.course = Course("Test Course", self.par_order, self.handicap_order)
+
+    def test_calculate_points(self):
+        # All pars earn 2 points per hole
+        day = Day(self.course, list(self.par_order))
+        self.assertEqual(day.points, 36)
+
+        # One birdie and one double bogey
+        score_list = list(self.par_order)
+        score_list[0] -= 1
+        score_list[1] += 2
+        day = Day(self.course, score_list)
+        self.assertEqual(day.points, 36 + 2 - 2)
+
+    def test_calculate_points_invalid(self):
+        score_list = list(self.par_order)
+        score_list[3] += 4
+        with self.assertRaises(KeyError):
+            Day(self.course, score_list)
+
+    def test_calculate_field_points(self):
+        field = [list(self.par_order), [par + 1 for par in self.par_order], [par - 1 for par in self.par_order]]
+        points = calculate_field_points(field, self.par_order)
+        self.assertEqual(list(points), [36, 18, 72])
+
+    def test_calculate_field_points_reports_all_invalid_holes(self):
+        field = [list(self.par_order), list(self.par_order), list(self.par_order)]
+        field[0][2] = 0
+        field[2][5] = 9
+        field[2][17] = 10
+        with self.assertRaises(InvalidScoreError) as context:
+            calculate_field_points(field, self.par_order)
+        self.assertEqual(context.exception.invalid_holes, [(0, 2, 0), (2, 5, 9), (2, 17, 10)])
+
+    def test_calculate_field_points_invalid_shape(self):
+        with self.assertRaises(ValueError):
+            calculate_field_points([[4] * 17], self.par_order)
+
+    def test_generate_dots(self):
+        day = Day(self.course, list(self.par_order))
+        self.assertEqual(day.generate_dots(0).tolist(), [0] * 18)
+        self.assertEqual(day.generate_dots(18).tolist(), [1] * 18)
+        self.assertEqual(day.generate_dots(20).tolist(), [2, 2] + [1] * 16)
+        self.assertEqual(day.generate_dots(5).tolist(), [1] * 5 + [0] * 13)
+        self.assertEqual(day.generate_dots(54).tolist(), [2] * 18)
+
+        with self.assertRaises(ValueError):
+            day.generate_dots(55)
+
+    def test_get_calcutta_scores(self):
+        score_list = list(self.par_order)
+        score_list[0] -= 1
+        score_list[1] += 3
+        score_list[2] += 3
+        day = Day(self.course, score_list)
+        net_score_list, modifiers = day.get_calcutta_scores(2)
+
+        # One bonus point for the birdie, and no deduction for the triple bogeys
+        self.assertEqual(modifiers, 1)
+        self.assertEqual(net_score_list[:3], [-2, 2, 2])
+        self.assertEqual(net_score_list[3:], [0] * 15)
+
+    def test_partial_round(self):
+        day = Day.empty(self.course)
+        self.assertEqual(day.thru, 0)
+        self.assertEqual(day.points, 0)
+
+        self.assertEqual(day.set_hole(0, 3), (4, 3))
+        self.assertEqual(day.set_hole(1, 6), (0, 6))
+        self.assertEqual(day.set_hole(0, 4), (-2, 1))
+        self.assertEqual(day.thru, 2)
+        self.assertEqual(day.points, 2)
+        self.assertEqual(day.total_raw_score, 10)
+        self.assertEqual(day.calculate_points(), day.points)
+
+        self.assertEqual(day.set_hole(1, None), (0, -6))
+        self.assertEqual(day.thru, 1)
+
+        with self.assertRaises(KeyError):
+            day.set_hole(2, 7)
+        with self.assertRaises(ValueError):
+            day.set_hole(18, 4)
+
+    def test_partial_round_calcutta_scores(self):
+        day = Day.empty(self.course)
+        day.set_hole(0, 3)
+        net_score_list, modifiers = day.get_calcutta_scores(0)
+        self.assertEqual(net_score_list, [-1] + [2] * 17)
+        self.assertEqual(modifiers, 1)
+        self.assertEqual(day.get_calcutta_hole(0, 0), (-1, 1))
+        self.assertEqual(day.get_calcutta_hole(1, 0), (2, 0))
+
+    def test_from_field(self):
+        field = [list(self.par_order), [par + 1 for par in self.par_order]]
+        days = Day.from_field(self.course, field)
+        self.assertEqual([day.points for day in days], [36, 18])
+        self.assertEqual(days[1].raw_score_list, field[1])
+        self.assertIs(days[0].course, self.course)
+
+    def test_packed_scores(self):
+        day = Day.empty(self.course)
+        day.set_hole(2, 4)
+        self.assertEqual(day.scores, bytes([0, 0, 4] + [0]*15))
+        self.assertEqual(day.raw_score_list, [None, None, 4] + [None]*15)
+        self.assertEqual((day.thru, day.total_raw_score), (1, 4))
+        self.assertFalse(hasattr(day, '__dict__'))
+
+        with self.assertRaises(KeyError):
+            Day(self.course, [0] + list(self.par_order[1:]))
+        with self.assertRaises(KeyError):
+            Day(self.course, [300] + list(self.par_order[1:]))
+
+    def test_calculate_days_calcutta_scores(self):
+        partial_day = Day.empty(self.course)
+        partial_day.set_hole(0, 3)
+        partial_day.set_hole(4, 7)
+        days = [Day(self.course, [par + hole % 3 - 1 for hole, par in enumerate(self.par_order)]), partial_day]
+        score_matrix = stack_scores(days)
+        self.assertEqual(score_matrix.shape, (2, 18))
+        self.assertEqual(score_matrix[1].tolist(), [3, 0, 0, 0, 7] + [0]*13)
+
+        net_score_matrix, modifiers = calculate_days_calcutta_scores(days, [10, 25])
+        for i, (day, handicap) in enumerate(zip(days, [10, 25])):
+            net_score_list, day_modifiers = day.get_calcutta_scores(handicap)
+            self.assertEqual(net_score_matrix[i].tolist(), net_score_list)
+            self.assertEqual(int(modifiers[i]), day_modifiers)
+
+
+if __name__ == '__main__':
+    unittest.main()
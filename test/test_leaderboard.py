@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+import openpyxl
+
+from models.leaderboard import format_sheet
+
+
+class TestFormatSheet(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+    def test_rows_share_named_styles(self):
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet('Dogfight')
+        header = ['Player', 'Point Target', 'Points', 'Net Points', 'Position']
+        data = [[f'Player {i}', 30, 36-i, 6-i, i+1] for i in range(50)]
+        format_sheet(sheet, 'Day 1 Dogfight', header, data)
+        workbook.save('board.xlsx')
+
+        # One style per kind of row and border edge, however many players there are.
+        self.assertEqual(len([name for name in workbook.named_styles if name.startswith('Leaderboard')]), 15)
+
+        sheet = openpyxl.load_workbook('board.xlsx')['Dogfight']
+        self.assertEqual([str(cell_range) for cell_range in sheet.merged_cells.ranges], ['A1:E1'])
+        self.assertEqual(sheet['A1'].value, 'Day 1 Dogfight')
+        self.assertEqual([cell.value for cell in sheet[2]], header)
+        self.assertEqual(sheet['A3'].style, 'Leaderboard Leader L')
+        self.assertEqual(sheet['C4'].style, 'Leaderboard Field')
+        self.assertEqual(sheet['E52'].style, 'Leaderboard Field RB')
+        self.assertEqual(sheet['E52'].border.bottom.style, 'thick')
+        self.assertEqual(sheet.column_dimensions['A'].width, 1.8*len('Day 1 Dogfight') + 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
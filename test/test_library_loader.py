@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from models import yaml_codec
+from models.course import Course
+from models.library_loader import PARSE_CHUNK_SIZE, load_library, read_files
+from models.player import Player
+
+
+class TestLibraryLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.players = [Player(f'Player {i}', i % 31) for i in range(PARSE_CHUNK_SIZE + 6)]
+        self.filepaths = [self.write(player, f'{player.name}.yaml') for player in self.players]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, model, filename):
+        filepath = os.path.join(self.directory.name, filename)
+        with open(filepath, 'w') as file:
+            yaml_codec.dump(model, file)
+        return filepath
+
+    def test_read_files_in_order(self):
+        texts = read_files(self.filepaths, threads=4)
+        self.assertEqual(len(texts), len(self.filepaths))
+        self.assertIn('Player 3', texts[3])
+
+    def test_load_library(self):
+        players = load_library(self.filepaths, Player, threads=4)
+        self.assertEqual([player.name for player in players], [player.name for player in self.players])
+        self.assertEqual(players[5].twisted_creek_handicap, 5)
+
+    def test_load_library_with_processes(self):
+        players = load_library(self.filepaths, Player, threads=4, processes=2)
+        self.assertEqual([player.__dict__ for player in players], [player.__dict__ for player in self.players])
+
+    def test_invalid_file(self):
+        course_path = self.write(Course('Test Course', [4]*18, list(range(1, 19))), 'course.yaml')
+        with self.assertRaises(TypeError) as context:
+            load_library(self.filepaths + [course_path], Player)
+        self.assertIn(course_path, str(context.exception))
+
+    def test_missing_files(self):
+        missing_path = os.path.join(self.directory.name, 'missing.yaml')
+        with self.assertRaises(FileNotFoundError):
+            load_library([missing_path], Player)
+
+        players = load_library([self.filepaths[0], missing_path], Player, missing_ok=True)
+        self.assertEqual(players[0].name, 'Player 0')
+        self.assertIsNone(players[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
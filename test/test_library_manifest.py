@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from models import library_manifest
+from models.library_manifest import LibraryManifest
+from models.player import Player
+
+
+class TestLibraryManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.players = [Player(f'Player {i}', i) for i in range(5)]
+        for player in self.players:
+            player.save_path = os.path.join(self.directory.name, f'{player.name}.yaml')
+            player.save()
+        self.manifest = LibraryManifest(self.directory.name, Player, lambda player: player.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_first_refresh_loads_everything(self):
+        players = self.manifest.refresh()
+        self.assertEqual(sorted(players), [player.name for player in self.players])
+        entry = self.manifest.entries['Player 2.yaml']
+        self.assertEqual(entry.key, 'Player 2')
+        self.assertEqual(entry.size, os.path.getsize(self.players[2].save_path))
+
+    def test_refresh_reads_only_changed_files(self):
+        players = self.manifest.refresh()
+        self.players[1].active = True
+        self.players[1].save()
+        os.utime(self.players[1].save_path, ns=(1, 1))
+        self.players[3].delete()
+        new_player = Player('Player 9', 9)
+        new_player.save_path = os.path.join(self.directory.name, 'Player 9.yaml')
+        new_player.save()
+
+        with patch.object(library_manifest, 'load_library', wraps=library_manifest.load_library) as mock_load:
+            refreshed = self.manifest.refresh()
+        loaded_paths = sorted(mock_load.call_args[0][0])
+        self.assertEqual(loaded_paths, sorted([self.players[1].save_path, new_player.save_path]))
+
+        self.assertTrue(refreshed['Player 1'].active)
+        self.assertNotIn('Player 3', refreshed)
+        self.assertIn('Player 9', refreshed)
+        self.assertIs(refreshed['Player 0'], players['Player 0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
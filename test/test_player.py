@@ -3,6 +3,7 @@ from unittest.mock import patch, mock_open, MagicMock
 import os
 import yaml
 from models.player import Player
+from models.yaml_codec import ModelDumper
 
 
 class TestPlayer(unittest.TestCase):
@@ -41,7 +42,7 @@ class TestPlayer(unittest.TestCase):
     def test_save(self, mock_yaml_dump, mock_file):
         self.player.save()
         mock_file.assert_called_once_with(self.player.save_path, 'w')
-        mock_yaml_dump.assert_called_once_with(self.player, mock_file())
+        mock_yaml_dump.assert_called_once_with(self.player, mock_file(), Dumper=ModelDumper)
 
     @patch("models.player.path.exists", return_value=True)
     @patch("models.player.remove")
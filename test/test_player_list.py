@@ -5,6 +5,8 @@ import yaml
 from models.player_list import PlayerList, PLAYER_LIB_PATH
 from models.player import Player
 
+from test.helpers import scandir_entries
+
 
 class TestPlayerList(unittest.TestCase):
 
@@ -16,10 +18,10 @@ class TestPlayerList(unittest.TestCase):
         self.player2_name = "Jane Doe"
         self.player2 = Player(self.player2_name, self.handicap)
 
-    @patch("os.listdir", return_value=["player1.yaml", "player2.yaml", "not_a_player.txt"])
+    @patch("os.scandir", return_value=scandir_entries(PLAYER_LIB_PATH, ["player1.yaml", "player2.yaml", "not_a_player.txt"]))
     @patch("builtins.open", new_callable=mock_open)
     @patch("yaml.load")
-    def test_load_player_library(self, mock_yaml_load, mock_file, mock_listdir):
+    def test_load_player_library(self, mock_yaml_load, mock_file, mock_scandir):
         mock_yaml_load.side_effect = [self.player1, self.player2]  # Simulate loading two valid Player objects
         player_list = PlayerList()
         
@@ -28,17 +30,17 @@ class TestPlayerList(unittest.TestCase):
         self.assertIn(self.player2_name, player_list.player_list)
         self.assertIsInstance(player_list.player_list[self.player1_name], Player)
         
-        mock_listdir.assert_called_once_with(PLAYER_LIB_PATH)
+        mock_scandir.assert_called_once_with(PLAYER_LIB_PATH)
         self.assertEqual(mock_file.call_count, 2)  # Ensure we tried to open two files
 
-    @patch("os.listdir", return_value=["invalid.yaml"])
+    @patch("os.scandir", return_value=scandir_entries(PLAYER_LIB_PATH, ["invalid.yaml"]))
     @patch("builtins.open", new_callable=mock_open)
     @patch("yaml.load", return_value={})
-    def test_load_invalid_player_file(self, mock_yaml_load, mock_file, mock_listdir):
+    def test_load_invalid_player_file(self, mock_yaml_load, mock_file, mock_scandir):
         with self.assertRaises(TypeError):
             PlayerList()
         
-        mock_listdir.assert_called_once_with(PLAYER_LIB_PATH)
+        mock_scandir.assert_called_once_with(PLAYER_LIB_PATH)
         mock_file.assert_called_once_with(os.path.join(PLAYER_LIB_PATH, "invalid.yaml"), 'r')
 
     @patch("models.player_list.PlayerList._load_player_library", return_value={})
@@ -135,6 +135,23 @@ class TestPlayerListController(unittest.TestCase):
         mock_update_player_list.assert_called_once()
         self.controller.clear_entry_fields.assert_called_once()
 
+    @patch('controllers.player_list_controller.PlayerListController.update_player_list')
+    def test_update_active_player_refreshes_scores(self, mock_update_player_list):
+        self.mock_view.player_entry_frame.player.get.return_value = 'Player1'
+        self.mock_view.player_entry_frame.mosley_open_hc.get.return_value = '10'
+        self.mock_view.player_entry_frame.twisted_creek_hc.get.return_value = '15'
+
+        player = MagicMock(spec=Player)
+        player.active = True
+        self.mock_model.player_list = {'Player1': player}
+        self.controller.update_player()
+        self.assertEqual((player.mosley_open_handicap, player.twisted_creek_handicap), (10, 15))
+        self.mock_app.score_controller.refresh_player_list.assert_called_once_with(self.mock_model)
+
+        player.active = False
+        self.controller.update_player()
+        self.mock_app.score_controller.refresh_player_list.assert_called_once()
+
     def test_delete_player(self):
         player = MagicMock(spec=Player)
         self.mock_model.player_list = {'Player1': player}
@@ -0,0 +1,94 @@
+import unittest
+import random
+
+from models.active_player import ActivePlayer, ActiveTournament
+from models.calcutta_team import CalcuttaTeam
+from models.course import Course
+from models.day import Day
+from models.player import Player
+from models.ranking import RankingIndex, TournamentRankings
+
+
+class TestRankingIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = RankingIndex()
+
+    def test_update_and_rank(self):
+        self.index.update('A', (10, 80))
+        self.index.update('B', (12, 85))
+        self.index.update('C', (10, 82))
+        self.assertEqual(self.index.names(), ['B', 'C', 'A'])
+        self.assertEqual(self.index.rank('A'), 3)
+        self.assertEqual(self.index.top(2), ['B', 'C'])
+
+        self.index.update('A', (15, 90))
+        self.assertEqual(self.index.names(), ['A', 'B', 'C'])
+        self.assertEqual(self.index.key('A'), (15, 90))
+        self.assertEqual(len(self.index), 3)
+
+    def test_ties_keep_insertion_order(self):
+        for name in ['A', 'B', 'C']:
+            self.index.update(name, (5,))
+        self.index.update('A', (5,))
+        self.assertEqual(self.index.names(), ['A', 'B', 'C'])
+
+    def test_remove(self):
+        self.index.update('A', (1,))
+        self.index.update('B', (2,))
+        self.index.remove('B')
+        self.index.remove('Missing')
+        self.assertNotIn('B', self.index)
+        self.assertEqual(self.index.names(), ['A'])
+
+    def test_matches_sorted(self):
+        keys = {f'Player {i}': (random.randint(-10, 10), random.randint(70, 100)) for i in range(200)}
+        for name, key in keys.items():
+            self.index.update(name, key)
+        for name in random.sample(list(keys), 50):
+            keys[name] = (random.randint(-10, 10), random.randint(70, 100))
+            self.index.update(name, keys[name])
+        self.assertEqual(self.index.names(), sorted(keys, key=lambda name: keys[name], reverse=True))
+
+
+class TestTournamentRankings(unittest.TestCase):
+
+    def setUp(self):
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.handicap_order = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18]
+        self.course = Course("Test Course", self.par_order, self.handicap_order)
+        self.players = []
+        for i, handicap in enumerate([4, 12, 20, 28]):
+            active_player = ActivePlayer(Player(f"Player {i}", handicap))
+            active_player.days['Day 1'] = Day(self.course, [par + (hole + i) % 3 for hole, par in enumerate(self.par_order)])
+            self.players.append(active_player)
+
+    def test_from_field(self):
+        team = CalcuttaTeam('Player 0', 'Player 3')
+        team.days['Day 1'] = 4
+        rankings = TournamentRankings.from_field(self.players, [team])
+
+        expected = sorted(self.players, key=lambda player: (player.net_mosley_open_points, player.total_raw_score), reverse=True)
+        self.assertEqual(rankings.mosley_open.names(), [player.player_info.name for player in expected])
+        self.assertEqual(len(rankings.dogfights['Day 1']), 4)
+        self.assertEqual(len(rankings.dogfights['Day 2']), 0)
+        self.assertEqual(rankings.calcutta.names(), ['Player 0 and Player 3'])
+
+    def test_update_player_after_cut(self):
+        rankings = TournamentRankings.from_field(self.players, [])
+        self.players[1].active_tournament = ActiveTournament.TwistedCreek
+        self.players[2].active_tournament = ActiveTournament.MosleyOpen
+        rankings.update_player(self.players[1])
+        rankings.update_player(self.players[2])
+
+        self.assertNotIn('Player 1', rankings.mosley_open)
+        self.assertNotIn('Player 2', rankings.twisted_creek)
+        self.assertEqual(len(rankings.mosley_open), 3)
+        self.assertEqual(len(rankings.twisted_creek), 3)
+
+        rankings.remove_player('Player 0')
+        self.assertNotIn('Player 0', rankings.dogfights['Day 1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
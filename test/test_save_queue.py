@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from models import save_queue, yaml_codec
+from models.calcutta_team import CalcuttaTeam
+from models.save_queue import SaveQueue, atomic_write
+
+
+class TestSaveQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.team = CalcuttaTeam('John Doe', 'Jane Doe')
+        self.team.save_path = os.path.join(self.directory.name, 'John Doe_Jane Doe.yaml')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_atomic_write(self):
+        filepath = os.path.join(self.directory.name, 'file.yaml')
+        atomic_write(filepath, 'first')
+        atomic_write(filepath, 'second')
+        with open(filepath, 'r') as file:
+            self.assertEqual(file.read(), 'second')
+        self.assertEqual(os.listdir(self.directory.name), ['file.yaml'])
+
+    def test_failed_write_keeps_old_file(self):
+        filepath = os.path.join(self.directory.name, 'file.yaml')
+        atomic_write(filepath, 'first')
+        with patch('os.replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                atomic_write(filepath, 'second')
+        with open(filepath, 'r') as file:
+            self.assertEqual(file.read(), 'first')
+        self.assertEqual(os.listdir(self.directory.name), ['file.yaml'])
+
+    def test_save_and_flush(self):
+        queue = SaveQueue()
+        self.team.days['Day 1'] = 7
+        queue.save(self.team)
+        queue.flush()
+        self.assertEqual(queue.pending, 0)
+        with open(self.team.save_path, 'r') as file:
+            self.assertEqual(yaml_codec.load(file).days['Day 1'], 7)
+
+    def test_repeated_saves_are_coalesced(self):
+        queue = SaveQueue(start=False)
+        for points in range(5):
+            self.team.days['Day 1'] = points
+            queue.save(self.team)
+        self.assertEqual(queue.pending, 1)
+
+        with patch.object(save_queue, 'atomic_write', wraps=atomic_write) as mock_write:
+            queue.start()
+            queue.flush()
+        mock_write.assert_called_once()
+        with open(self.team.save_path, 'r') as file:
+            self.assertEqual(yaml_codec.load(file).days['Day 1'], 4)
+
+    def test_flush_reports_errors(self):
+        queue = SaveQueue()
+        self.team.save_path = os.path.join(self.directory.name, 'missing', 'team.yaml')
+        queue.save(self.team)
+        with self.assertRaises(IOError):
+            queue.flush()
+        queue.flush()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from controllers.score_controller import ScoreController
+from models.active_player import ActivePlayer, ActiveTournament
+from models.calcutta_team import CalcuttaTeam
+from models.course import Course
+from models.day import Day
+from models.player import Player
+from models.standings import MOSLEY_OPEN
+
+
+class TestScoreController(unittest.TestCase):
+
+    def setUp(self):
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.course = Course("Test Course", self.par_order, list(range(1, 19)))
+
+        self.active_players = dict()
+        for i, handicap in enumerate([4, 12]):
+            active_player = ActivePlayer(Player(f"Player {i}", handicap))
+            active_player.days['Day 1'] = Day(self.course, list(self.par_order))
+            self.active_players[active_player.player_info.name] = active_player
+
+        self.mock_app = MagicMock()
+        self.mock_app.course_list_controller.get_course_names.return_value = ["Test Course"]
+        self.mock_model = MagicMock()
+        self.mock_model.active_player_list = self.active_players
+        self.mock_model.journal = None
+        self.team = CalcuttaTeam("Player 0", "Player 1")
+        self.team.calculate_scores(*self.get_calcutta_scores("Player 0"), *self.get_calcutta_scores("Player 1"), 'Day 1')
+        self.mock_model.store.load_calcutta_teams.return_value = {"Player 0 and Player 1": self.team}
+        self.mock_view = MagicMock()
+        self.mock_view.active_player_list_frames = dict()
+
+        self.controller = ScoreController(self.mock_app, self.mock_model, self.mock_view)
+        self.mock_view.active_player_list_frames = {'Day 1': MagicMock()}
+
+    def get_calcutta_scores(self, player_name):
+        player = self.active_players[player_name]
+        return player.days['Day 1'].get_calcutta_scores(player.player_info.twisted_creek_handicap)
+
+    def assert_team_rescored(self):
+        rescored_team = CalcuttaTeam("Player 0", "Player 1")
+        rescored_team.calculate_scores(*self.get_calcutta_scores("Player 0"), *self.get_calcutta_scores("Player 1"), 'Day 1')
+        self.assertEqual(self.team.days['Day 1'], rescored_team.days['Day 1'])
+        self.assertEqual(self.controller.rankings.calcutta.key("Player 0 and Player 1"), (rescored_team.total_points,))
+
+    def test_refresh_re_ranks_edited_players(self):
+        player = self.active_players["Player 0"]
+        self.controller.get_standings().sheet(MOSLEY_OPEN)
+        player.player_info.mosley_open_handicap = 20
+        self.mock_model.refresh_player_list.return_value = ([], [player], [])
+        self.controller.refresh_player_list(MagicMock())
+
+        self.assertEqual(self.controller.rankings.mosley_open.key("Player 0"), (20, sum(self.par_order)))
+        self.assertEqual(self.controller.rankings.mosley_open.names(), ["Player 0", "Player 1"])
+        self.assertEqual(self.controller.get_standings().sheet(MOSLEY_OPEN).rows[0][1], 16)
+
+    def test_enter_hole_score(self):
+        old_team_points = self.team.days['Day 1']
+        # Birdies on the two hardest holes for both partners.
+        self.controller.enter_hole_score("Player 0", 'Day 1', 0, "3")
+        self.controller.enter_hole_score("Player 1", 'Day 1', 0, "3")
+
+        player = self.active_players["Player 0"]
+        self.assertEqual(player.days['Day 1'].raw_score_list[0], 3)
+        self.assertEqual(player.total_raw_score, sum(self.par_order) - 1)
+        self.assertEqual(self.controller.rankings.mosley_open.key("Player 0"), (player.net_mosley_open_points, sum(self.par_order) - 1))
+        self.assertGreater(self.team.days['Day 1'], old_team_points)
+        self.assert_team_rescored()
+        self.mock_model.store.save_active_players.assert_called_with([self.active_players["Player 1"]])
+        self.mock_model.store.save_calcutta_teams.assert_called_with([self.team])
+        self.mock_view.active_player_list_frames['Day 1'].active_player_frames["Player 1"].total_score_label.config.assert_called_with(
+            text=str(sum(self.par_order) - 1))
+
+    def test_clear_hole_score(self):
+        self.controller.enter_hole_score("Player 1", 'Day 1', 5, "")
+
+        player = self.active_players["Player 1"]
+        self.assertIsNone(player.days['Day 1'].raw_score_list[5])
+        self.assertEqual(player.total_raw_score, sum(self.par_order) - 5)
+        self.assertEqual(self.controller.rankings.dogfights['Day 1'].key("Player 1"),
+                         (player.get_twisted_creek_daily_points('Day 1'), player.days['Day 1'].points))
+        self.assert_team_rescored()
+
+    def test_unchanged_hole_score_is_not_saved(self):
+        self.controller.enter_hole_score("Player 0", 'Day 1', 0, "4")
+        self.mock_model.store.save_active_players.assert_not_called()
+
+    def test_invalid_hole_score_is_reported(self):
+        self.controller.enter_hole_score("Player 0", 'Day 1', 2, "three")
+        self.controller.enter_hole_score("Player 0", 'Day 1', 2, "30")
+
+        self.assertEqual(self.mock_view.show_error.call_count, 2)
+        self.assertEqual(self.active_players["Player 0"].days['Day 1'].raw_score_list[2], 3)
+        self.mock_model.store.save_active_players.assert_not_called()
+
+    def test_invalid_first_hole_score_starts_no_day(self):
+        self.controller.current_course_model = self.course
+        self.controller.enter_hole_score("Player 0", 'Day 2', 0, "0")
+
+        self.mock_view.show_error.assert_called_once()
+        self.assertIsNone(self.active_players["Player 0"].days['Day 2'])
+        self.assertEqual(self.active_players["Player 0"].number_of_days_played, 1)
+        self.assertEqual(self.controller.rankings.dogfights['Day 2'].names(), [])
+
+    def test_cut_lists_the_whole_field(self):
+        self.active_players["Player 0"].active_tournament = ActiveTournament.TwistedCreek
+        self.controller.rankings.update_player(self.active_players["Player 0"])
+        self.mock_view.current_day = 'Day 2'
+        self.mock_view.request_cut_line.return_value = self.active_players["Player 0"].net_mosley_open_points
+        with patch.object(self.controller, 'save_score_data'), patch.object(self.controller, 'update_calcutta_scores'):
+            self.controller.calculate_scores()
+
+        cut_players = self.mock_view.request_cut_line.call_args.args[0]
+        self.assertEqual([player.player_info.name for player in cut_players], ["Player 1", "Player 0"])
+        self.assertEqual(self.active_players["Player 0"].active_tournament, ActiveTournament.MosleyOpen)
+        self.assertEqual(self.controller.rankings.mosley_open.names(), ["Player 1", "Player 0"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import unittest
+
+from models.active_player import ActivePlayer, ActiveTournament
+from models.calcutta_team import CalcuttaTeam
+from models.course import Course
+from models.course_registry import course_registry
+from models.day import Day
+from models.player import Player
+from models.score_journal import JOURNAL_FILE, SNAPSHOT_FILE, ScoreJournal
+
+
+class TestScoreJournal(unittest.TestCase):
+
+    def setUp(self):
+        # Each test is a fresh session, so no course is registered yet.
+        course_registry.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.course = Course('Test Course', [4]*18, list(range(1, 19)))
+        self.players = dict()
+        for name, handicap in (('John Doe', 10), ('Jane Doe', 20), ('Jim Doe', 5)):
+            player = Player(name, handicap)
+            player.active = True
+            self.players[name] = player
+        self.journal = ScoreJournal(self.directory.name, sync_batch=4, snapshot_interval=100)
+
+    def tearDown(self):
+        self.journal.close()
+        self.directory.cleanup()
+
+    def reopen(self, **kwargs):
+        self.journal.close()
+        self.journal = ScoreJournal(self.directory.name, **kwargs)
+        return self.journal
+
+    def test_empty_journal(self):
+        self.assertFalse(self.journal.has_state)
+        active_players = self.journal.rebuild_active_players(self.players)
+        self.assertEqual(set(active_players), set(self.players))
+        self.assertFalse(any(active_players['John Doe'].days.values()))
+
+    def test_recover_days_holes_and_cut(self):
+        self.journal.record_days('Day 1', {'John Doe': Day(self.course, [4]*18), 'Jane Doe': Day(self.course, [5]*18)})
+        self.journal.record_hole('Jim Doe', 'Day 1', 0, 3, self.course)
+        self.journal.record_hole('John Doe', 'Day 1', 17, 3, self.course)
+        active_players = self.journal.rebuild_active_players(self.players)
+        active_players['John Doe'].active_tournament = ActiveTournament.MosleyOpen
+        self.journal.record_cut(active_players.values())
+
+        journal = self.reopen()
+        self.assertTrue(journal.has_state)
+        active_players = journal.rebuild_active_players(self.players)
+        self.assertEqual(active_players['John Doe'].days['Day 1'].raw_score_list, [4]*17 + [3])
+        self.assertEqual(active_players['John Doe'].days['Day 1'].points, 38)
+        self.assertEqual(active_players['Jim Doe'].days['Day 1'].raw_score_list, [3] + [None]*17)
+        self.assertEqual(active_players['Jim Doe'].total_raw_score, 3)
+        self.assertEqual(active_players['John Doe'].active_tournament, ActiveTournament.MosleyOpen)
+        self.assertIsNone(active_players['Jane Doe'].days['Day 2'])
+
+    def test_torn_final_event_is_discarded(self):
+        self.journal.record_hole('John Doe', 'Day 1', 0, 4, self.course)
+        self.journal.close()
+        with open(os.path.join(self.directory.name, JOURNAL_FILE), 'a') as journal_file:
+            journal_file.write('{"type": "hole", "player": "John')
+
+        journal = self.reopen()
+        journal.record_hole('John Doe', 'Day 1', 1, 5, self.course)
+        journal = self.reopen()
+        day = journal.rebuild_active_players(self.players)['John Doe'].days['Day 1']
+        self.assertEqual(day.raw_score_list[:3], [4, 5, None])
+
+    def test_compaction(self):
+        journal = self.reopen(snapshot_interval=10)
+        for hole in range(18):
+            journal.record_hole('John Doe', 'Day 1', hole, 4, self.course)
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, SNAPSHOT_FILE)))
+        self.assertLess(journal.events_since_snapshot, 10)
+
+        journal.sync()
+        with open(os.path.join(self.directory.name, JOURNAL_FILE), 'r') as journal_file:
+            tail = [json.loads(line) for line in journal_file]
+        self.assertEqual(len(tail), journal.events_since_snapshot)
+
+        journal = self.reopen()
+        self.assertEqual(journal.events_since_snapshot, len(tail))
+        day = journal.rebuild_active_players(self.players)['John Doe'].days['Day 1']
+        self.assertEqual(day.raw_score_list, [4]*18)
+
+    def test_start_and_teams(self):
+        active_players = {name: ActivePlayer(player) for name, player in self.players.items()}
+        active_players['John Doe'].days['Day 1'] = Day(self.course, [3]*18)
+        active_players['Jane Doe'].days['Day 1'] = Day(self.course, [5]*9 + [4]*9)
+        team = CalcuttaTeam('John Doe', 'Jane Doe')
+        scores_1, modifiers_1 = active_players['John Doe'].days['Day 1'].get_calcutta_scores(10)
+        scores_2, modifiers_2 = active_players['Jane Doe'].days['Day 1'].get_calcutta_scores(20)
+        team.calculate_scores(scores_1, modifiers_1, scores_2, modifiers_2, 'Day 1')
+
+        self.journal.start(active_players, {'John Doe and Jane Doe': team, 'Jim Doe and Jim Doe': CalcuttaTeam('Jim Doe', 'Jim Doe')})
+        journal = self.reopen()
+        rebuilt_players = journal.rebuild_active_players(self.players)
+        rebuilt_teams = journal.rebuild_calcutta_teams(rebuilt_players)
+        self.assertEqual(rebuilt_teams['John Doe and Jane Doe'].days, team.days)
+        self.assertEqual(rebuilt_teams['Jim Doe and Jim Doe'].days['Day 1'], None)
+
+    def test_roster(self):
+        self.journal.record_hole('John Doe', 'Day 1', 0, 4, self.course)
+        self.journal.record_hole('Jane Doe', 'Day 1', 0, 4, self.course)
+        self.players['Jane Doe'].active = False
+        active_players = self.journal.rebuild_active_players(self.players)
+        self.journal.record_roster(active_players)
+        self.assertEqual(list(self.journal.state['players']), ['John Doe'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from models.active_player import ActivePlayer, ActiveTournament
+from models.calcutta_team import CalcuttaTeam
+from models.course import Course
+from models.day import Day
+from models.player import Player
+from models.simulation import TournamentSimulator
+
+
+class TestTournamentSimulator(unittest.TestCase):
+
+    def setUp(self):
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.handicap_order = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18]
+        self.course = Course("Test Course", self.par_order, self.handicap_order)
+        self.players = []
+        for i in range(6):
+            active_player = ActivePlayer(Player(f"Player {i}", 10))
+            active_player.days['Day 1'] = Day(self.course, [par + (1 if hole < 3*i else 0) for hole, par in enumerate(self.par_order)])
+            self.players.append(active_player)
+        self.teams = [CalcuttaTeam('Player 0', 'Player 5'), CalcuttaTeam('Player 1', 'Player 4'), CalcuttaTeam('Player 2', 'Player 3')]
+
+    def test_fit_probabilities(self):
+        simulator = TournamentSimulator(self.players, self.teams, {'Day 2': self.course})
+        probabilities = simulator.fit_probabilities(self.course)
+        self.assertEqual(probabilities.shape, (6, 18, 8))
+        for row in probabilities.sum(axis=2).ravel():
+            self.assertAlmostEqual(row, 1)
+
+        # A player who made par on a hole is more likely to make par there again.
+        self.assertGreater(probabilities[0, 0, 4], probabilities[5, 0, 4])
+
+    def test_probabilities_sum(self):
+        simulator = TournamentSimulator(self.players, self.teams, {'Day 2': self.course, 'Day 3': self.course}, cut_size=3)
+        result = simulator.run(2000, seed=1, chunk_size=500)
+
+        self.assertEqual(result.simulations, 2000)
+        self.assertAlmostEqual(sum(odds['win'] for odds in result.mosley_open.values()), 1)
+        self.assertAlmostEqual(sum(odds['win'] for odds in result.twisted_creek.values()), 1)
+        self.assertAlmostEqual(sum(odds['top 3'] for odds in result.mosley_open.values()), 3)
+        self.assertAlmostEqual(sum(odds['win'] for odds in result.calcutta.values()), 1)
+        self.assertAlmostEqual(sum(result.cut.values()), 3)
+        self.assertGreater(result.mosley_open['Player 0']['win'], result.mosley_open['Player 5']['win'])
+
+    def test_seed_is_repeatable(self):
+        simulator = TournamentSimulator(self.players, self.teams, {'Day 3': self.course})
+        result_1 = simulator.run(1000, seed=7, chunk_size=250)
+        result_2 = simulator.run(1000, seed=7, chunk_size=250)
+        self.assertEqual(result_1.mosley_open, result_2.mosley_open)
+        self.assertEqual(result_1.cut, {})
+
+    def test_finished_tournament(self):
+        self.players[3].active_tournament = ActiveTournament.TwistedCreek
+        simulator = TournamentSimulator(self.players, self.teams, {})
+        result = simulator.run(100, seed=1)
+        self.assertEqual(result.mosley_open['Player 0']['win'], 1)
+        self.assertEqual(result.mosley_open['Player 3']['top 3'], 0)
+
+    def test_competition_without_a_field(self):
+        for player in self.players:
+            player.active_tournament = ActiveTournament.MosleyOpen
+        simulator = TournamentSimulator(self.players, self.teams, {'Day 3': self.course})
+        result = simulator.run(200, seed=1)
+        self.assertEqual(sum(odds['win'] for odds in result.twisted_creek.values()), 0)
+        self.assertAlmostEqual(sum(odds['win'] for odds in result.mosley_open.values()), 1)
+
+    def test_started_day(self):
+        # Counting Day 2 twice would put Player 5 ahead of Player 0.
+        for i, player in enumerate(self.players):
+            birdies = 2 if i == 5 else 0
+            player.days['Day 2'] = Day(self.course, [par - (1 if hole < birdies else 0) for hole, par in enumerate(self.par_order)])
+        players = {player.player_info.name: player for player in self.players}
+        for team in self.teams:
+            team.calculate_scores(*players[team.player_1].days['Day 2'].get_calcutta_scores(10),
+                                  *players[team.player_2].days['Day 2'].get_calcutta_scores(10), 'Day 2')
+        finished = TournamentSimulator(self.players, self.teams, {}).run(100, seed=1)
+        result = TournamentSimulator(self.players, self.teams, {'Day 2': self.course}).run(100, seed=1)
+        self.assertEqual(result.mosley_open['Player 0']['win'], 1)
+        self.assertEqual(result.mosley_open, finished.mosley_open)
+        self.assertEqual(result.twisted_creek, finished.twisted_creek)
+        self.assertEqual(result.calcutta, finished.calcutta)
+
+        # Only the holes not played yet are simulated.
+        for player in self.players:
+            player.set_hole_score('Day 2', 17, None)
+        simulator = TournamentSimulator(self.players, self.teams, {'Day 2': self.course})
+        self.assertEqual(simulator.model['played'][0].sum(axis=1).tolist(), [17]*6)
+        self.assertEqual(simulator.model['raw_scores'].tolist(), [player.days['Day 1'].total_raw_score for player in self.players])
+        result = simulator.run(500, seed=1)
+        self.assertGreater(result.mosley_open['Player 0']['win'], result.mosley_open['Player 5']['win'])
+
+        with self.assertRaises(ValueError):
+            TournamentSimulator(self.players, self.teams, {'Day 2': Course("Other Course", self.par_order, self.handicap_order)})
+
+    def test_process_pool(self):
+        simulator = TournamentSimulator(self.players, self.teams, {'Day 2': self.course})
+        result = simulator.run(1000, processes=2, seed=3, chunk_size=250)
+        self.assertEqual(result.mosley_open, simulator.run(1000, seed=3, chunk_size=250).mosley_open)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+
+from models.active_player import ActivePlayer, ActiveTournament
+from models.active_player_list import ActivePlayerList
+from models.calcutta_team import CalcuttaTeam
+from models.course import Course
+from models.course_list import CourseList
+from models.day import Day
+from models.player import Player
+from models.player_list import PlayerList
+from models.sqlite_store import SqliteStore
+
+
+class TestSqliteStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = SqliteStore(':memory:')
+        self.course = Course('Test Course', [4]*18, list(range(1, 19)))
+        self.player_1 = Player('John Doe', 25)
+        self.player_1.active = True
+        self.player_2 = Player('Jane Doe', 10)
+        self.player_2.active = True
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_players_round_trip(self):
+        self.player_1.mosley_open_handicap = 18
+        self.player_1.save(self.store)
+        self.player_2.save(self.store)
+
+        player_list = PlayerList(self.store)
+        self.assertEqual(list(player_list.player_list), ['Jane Doe', 'John Doe'])
+        loaded = player_list.player_list['John Doe']
+        self.assertEqual(loaded.__dict__, self.player_1.__dict__)
+
+        self.player_1.delete(self.store)
+        self.assertEqual(list(self.store.load_players()), ['Jane Doe'])
+
+    def test_courses_round_trip(self):
+        self.course.save(self.store)
+        course_list = CourseList(self.store)
+        loaded = course_list.course_list['Test Course']
+        self.assertEqual(loaded.par_order, self.course.par_order)
+        self.assertEqual(loaded.handicap_order, self.course.handicap_order)
+
+        self.course.par_order = [5]*18
+        self.course.save(self.store)
+        self.assertEqual(self.store.load_courses()['Test Course'].par_order, [5]*18)
+
+    def test_active_players_round_trip(self):
+        self.course.save(self.store)
+        active_player = ActivePlayer(self.player_1, ActiveTournament.MosleyOpen)
+        active_player.days['Day 1'] = Day(self.course, [4]*18)
+        active_player.set_hole_score('Day 2', 0, 3, self.course)
+        self.store.save_active_players([active_player])
+
+        loaded = self.store.load_active_players()['John Doe']
+        self.assertEqual(loaded.active_tournament, ActiveTournament.MosleyOpen)
+        self.assertEqual(loaded.days['Day 1'].raw_score_list, [4]*18)
+        self.assertEqual(loaded.days['Day 2'].raw_score_list, [3] + [None]*17)
+        self.assertIsNone(loaded.days['Day 3'])
+        self.assertEqual(loaded.total_raw_score, active_player.total_raw_score)
+        self.assertEqual(loaded.net_mosley_open_points, active_player.net_mosley_open_points)
+
+        active_player.days['Day 2'] = None
+        self.store.save_active_players([active_player])
+        self.assertIsNone(self.store.load_active_players()['John Doe'].days['Day 2'])
+
+        active_player.delete(self.store)
+        self.assertEqual(self.store.load_active_players(), {})
+        self.assertEqual(self.store.connection.execute('SELECT COUNT(*) FROM days').fetchone()[0], 0)
+
+    def test_unknown_course(self):
+        active_player = ActivePlayer(self.player_1)
+        active_player.days['Day 1'] = Day(self.course, [4]*18)
+        self.store.save_active_players([active_player])
+        with self.assertRaises(KeyError):
+            self.store.load_active_players()
+
+    def test_active_player_list(self):
+        self.course.save(self.store)
+        self.store.save_players([self.player_1, self.player_2])
+        active_player_list = ActivePlayerList(PlayerList(self.store), self.store)
+        self.assertEqual(set(active_player_list.active_player_list), {'John Doe', 'Jane Doe'})
+
+        active_player_list.active_player_list['John Doe'].days['Day 1'] = Day(self.course, [4]*18)
+        self.store.save_active_players(active_player_list.active_player_list.values())
+
+        # A player made inactive is removed, and a player whose handicap changed is updated.
+        self.player_1.active = False
+        self.player_2.twisted_creek_handicap = 12
+        self.store.save_players([self.player_1, self.player_2])
+        active_player_list = ActivePlayerList(PlayerList(self.store), self.store)
+        self.assertEqual(list(active_player_list.active_player_list), ['Jane Doe'])
+        self.assertEqual(active_player_list.active_player_list['Jane Doe'].player_info.twisted_creek_handicap, 12)
+        self.assertEqual(list(self.store.load_active_players()), ['Jane Doe'])
+
+    def test_active_player_list_keeps_days(self):
+        self.course.save(self.store)
+        self.store.save_players([self.player_1])
+        active_player = ActivePlayer(self.player_1)
+        active_player.days['Day 1'] = Day(self.course, [4]*18)
+        self.store.save_active_players([active_player])
+
+        active_player_list = ActivePlayerList(PlayerList(self.store), self.store)
+        self.assertEqual(active_player_list.active_player_list['John Doe'].days['Day 1'].raw_score_list, [4]*18)
+
+    def test_calcutta_teams_round_trip(self):
+        team = CalcuttaTeam('John Doe', 'Jane Doe')
+        team.days['Day 1'] = 5
+        team.save(self.store)
+        loaded = self.store.load_calcutta_teams()['John Doe and Jane Doe']
+        self.assertEqual(loaded.days, {'Day 1': 5, 'Day 2': None, 'Day 3': None})
+
+        team.days['Day 2'] = -3
+        self.store.save_calcutta_teams([team])
+        self.assertEqual(self.store.load_calcutta_teams()['John Doe and Jane Doe'].total_points, 2)
+
+        team.delete(self.store)
+        self.assertEqual(self.store.load_calcutta_teams(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+import openpyxl
+
+from models.active_player import ActivePlayer, ActiveTournament
+from models.calcutta_team import CalcuttaTeam
+from models.course import Course
+from models.day import Day
+from models.player import Player
+from models.standings import (CALCUTTA, CUT, MOSLEY_OPEN, SHEET_NAMES, TEAMS, TWISTED_CREEK, Standings, compute_sheets,
+                              snapshot_field)
+from models.standings_export import EXPORTERS, export_standings
+
+
+class TestStandings(unittest.TestCase):
+
+    def setUp(self):
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.course = Course("Test Course", self.par_order, list(range(1, 19)))
+
+        self.active_players = dict()
+        for i, handicap in enumerate([4, 12, 25]):
+            active_player = ActivePlayer(Player(f"Player {i}", handicap))
+            active_player.days['Day 1'] = Day(self.course, [par + i % 2 for par in self.par_order])
+            active_player.days['Day 2'] = Day(self.course, list(self.par_order))
+            self.active_players[active_player.player_info.name] = active_player
+        self.active_players["Player 2"].active_tournament = ActiveTournament.TwistedCreek
+
+        team = CalcuttaTeam("Player 0", "Player 1")
+        team.days = {'Day 1': 5, 'Day 2': -2, 'Day 3': None}
+        self.teams = {"Player 0 and Player 1": team}
+        self.standings = Standings(self.active_players, self.teams)
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_mosley_open_rows(self):
+        sheet = self.standings.sheet(MOSLEY_OPEN)
+        self.assertEqual(sheet.header, ['Player', 'Point Target', 'Points', 'Net Points', 'Points', 'Net Points',
+                                        'Points', 'Net Points', 'Total Score', 'Position'])
+        self.assertEqual([row[0] for row in sheet.rows], ["Player 0", "Player 1"])
+        self.assertEqual(sheet.rows[1], ["Player 1", 24, 18, -6, 36, 12, None, None, 6, 2])
+
+    def test_twisted_creek_and_calcutta_rows(self):
+        self.assertEqual([row[0] for row in self.standings.sheet(TWISTED_CREEK).rows], ["Player 2", "Player 0", "Player 1"])
+        self.assertEqual(self.standings.sheet(CALCUTTA).rows, [["Player 0 and Player 1", 5, -2, None, 3, 1]])
+
+    def test_dogfight_rows(self):
+        sheet = self.standings.sheet('Day 2 Dogfight')
+        self.assertEqual(sheet.rows[0], ["Player 2", 11, 36, 25, 1])
+        self.assertEqual(self.standings.sheet('Day 3 Dogfight').rows, [])
+
+    def test_sheets_are_computed_once(self):
+        sheets = self.standings.sheets()
+        self.assertEqual([sheet.name for sheet in sheets], list(SHEET_NAMES))
+        self.assertIs(self.standings.sheets()[0], sheets[0])
+        with self.assertRaises(KeyError):
+            self.standings.sheet('Nonexistent')
+
+    def test_process_pool_matches_serial(self):
+        field = snapshot_field(self.active_players, self.teams, self.standings.rankings)
+        self.assertEqual(compute_sheets(field, SHEET_NAMES, processes=2), self.standings.sheets())
+
+        standings = Standings(self.active_players, self.teams, processes=2)
+        self.assertEqual(standings.sheets(), self.standings.sheets())
+
+    def test_snapshot_is_independent_of_the_models(self):
+        field = snapshot_field(self.active_players, self.teams, self.standings.rankings)
+        self.active_players["Player 0"].days['Day 1'] = None
+        self.teams["Player 0 and Player 1"].days['Day 1'] = 0
+
+        self.assertEqual(field.players["Player 0"][2][0], 36)
+        self.assertEqual(field.teams["Player 0 and Player 1"], ((5, -2, None), 3))
+
+    def test_only_affected_sheets_are_recomputed(self):
+        sheets = {sheet.name: sheet for sheet in self.standings.sheets()}
+
+        self.active_players["Player 0"].days['Day 3'] = Day(self.course, list(self.par_order))
+        self.standings.rankings.update_player(self.active_players["Player 0"])
+        self.standings.invalidate('Day 3')
+        self.assertEqual([name for name in SHEET_NAMES if self.standings.is_stale(name)],
+                         [MOSLEY_OPEN, TWISTED_CREEK, CALCUTTA, 'Day 3 Dogfight'])
+
+        updated_sheets = {sheet.name: sheet for sheet in self.standings.sheets()}
+        self.assertIs(updated_sheets['Day 1 Dogfight'], sheets['Day 1 Dogfight'])
+        self.assertIsNot(updated_sheets[MOSLEY_OPEN], sheets[MOSLEY_OPEN])
+        self.assertEqual([row[0] for row in updated_sheets['Day 3 Dogfight'].rows], ["Player 0"])
+
+        self.standings.invalidate(CUT)
+        self.assertTrue(self.standings.is_stale(MOSLEY_OPEN))
+        self.assertFalse(self.standings.is_stale(CALCUTTA))
+        self.standings.invalidate(TEAMS)
+        self.assertTrue(self.standings.is_stale(CALCUTTA))
+        self.assertFalse(self.standings.is_stale('Day 2 Dogfight'))
+        with self.assertRaises(KeyError):
+            self.standings.invalidate('Day 4')
+
+    def test_export_changed_sheets_only(self):
+        directory = os.path.join(self.temp_dir.name, 'boards')
+        export_standings(self.standings, 'csv', directory, changed_only=True)
+        self.assertEqual(len(os.listdir(directory)), len(SHEET_NAMES))
+
+        for filename in os.listdir(directory):
+            os.remove(os.path.join(directory, filename))
+        self.standings.invalidate('Day 2')
+        export_standings(self.standings, 'csv', directory, changed_only=True)
+        self.assertEqual(sorted(os.listdir(directory)), sorted(f'{name}.csv' for name in
+                         (MOSLEY_OPEN, TWISTED_CREEK, CALCUTTA, 'Day 2 Dogfight')))
+
+    def test_changed_sheets_are_tracked_per_destination(self):
+        csv_directory = os.path.join(self.temp_dir.name, 'csv')
+        png_directory = os.path.join(self.temp_dir.name, 'png')
+        export_standings(self.standings, 'csv', csv_directory, changed_only=True)
+        export_standings(self.standings, 'png', png_directory, changed_only=True)
+        self.assertEqual(len(os.listdir(png_directory)), len(SHEET_NAMES))
+
+        self.standings.invalidate(TEAMS)
+        self.assertEqual([sheet.name for sheet in self.standings.changed_sheets(('csv', csv_directory))], [CALCUTTA])
+        self.assertEqual([sheet.name for sheet in self.standings.changed_sheets(('png', png_directory))], [CALCUTTA])
+        self.assertEqual(len(self.standings.changed_sheets(('svg', png_directory))), len(SHEET_NAMES))
+
+    def test_exporters(self):
+        paths = {export_format: os.path.join(self.temp_dir.name, f'leaderboard.{export_format}') for export_format in EXPORTERS}
+        for export_format, path in paths.items():
+            export_standings(self.standings, export_format, path)
+
+        workbook = openpyxl.load_workbook(paths['xlsx'])
+        self.assertEqual(workbook.sheetnames, list(SHEET_NAMES))
+        self.assertEqual(workbook[MOSLEY_OPEN]['A3'].value, "Player 0")
+
+        with open(os.path.join(paths['csv'], f'{CALCUTTA}.csv'), newline='') as csv_file:
+            self.assertEqual(list(csv.reader(csv_file)), [['Team', 'Day 1', 'Day 2', 'Day 3', 'Total', 'Position'],
+                                                          ['Player 0 and Player 1', '5', '-2', '', '3', '1']])
+
+        with open(paths['json']) as json_file:
+            sheets = json.load(json_file)
+        self.assertEqual(sheets[2]['rows'], [["Player 0 and Player 1", 5, -2, None, 3, 1]])
+
+        with open(paths['html']) as html_file:
+            page = html_file.read()
+        self.assertIn('<tr class="leader"><td>Player 0 and Player 1</td>', page)
+
+        with self.assertRaises(ValueError):
+            export_standings(self.standings, 'pdf', paths['json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
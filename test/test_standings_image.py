@@ -0,0 +1,82 @@
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+
+import numpy as np
+
+from models.standings import Sheet
+from models.standings_image import (BLACK, GOLD, GREY, StandingsRenderer, encode_png, export_png, export_svg,
+                                    to_rgb)
+
+
+class TestStandingsRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.sheet = Sheet('Day 1 Dogfight', 'Day 1 Dogfight', ['Player', 'Point Target', 'Points', 'Net Points', 'Position'],
+                           [["Player 0", 32, 40, 8, 1], ["Player 1", 24, 30, 6, 2], ["Player 2", 11, None, None, 3]])
+        self.renderer = StandingsRenderer(scale=1)
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_render(self):
+        image = self.renderer.render(self.sheet)
+        row_height = self.renderer.row_height
+        self.assertEqual(image.shape[0], 5*row_height + self.renderer.border)
+        self.assertEqual(image.shape[1], sum(self.renderer.layout(self.sheet)[2]) + self.renderer.border)
+        self.assertEqual(self.renderer.rows_drawn, 5)
+
+        # The leader's row is gold, the rest of the field grey, and both have black text.
+        self.assertEqual(image[2*row_height + 2, 2], GOLD)
+        self.assertEqual(image[3*row_height + 2, 2], GREY)
+        self.assertIn(BLACK, image[2*row_height + 2:3*row_height, 2:50])
+        self.assertEqual(to_rgb(image).shape, image.shape + (3,))
+
+    def test_only_changed_rows_are_redrawn(self):
+        self.renderer.render(self.sheet)
+        changed = self.sheet._replace(rows=[self.sheet.rows[0], self.sheet.rows[1], ["Player 2", 11, 30, 19, 3]])
+        image = self.renderer.render(changed).copy()
+        self.assertEqual(self.renderer.rows_drawn, 6)
+        np.testing.assert_array_equal(image, StandingsRenderer(scale=1).render(changed))
+
+        # A wider value changes the layout, so the whole sheet is drawn again.
+        self.renderer.render(self.sheet._replace(rows=[["Player 0 with a long name", 32, 40, 8, 1]]))
+        self.assertEqual(self.renderer.rows_drawn, 9)
+
+    def test_encode_png(self):
+        image = self.renderer.render(self.sheet)
+        png = encode_png(image)
+        self.assertEqual(png[:8], b'\x89PNG\r\n\x1a\n')
+        width, height = struct.unpack('>II', png[16:24])
+        self.assertEqual((height, width), image.shape)
+
+        # Undo the filter on every scanline, each of which is stored as its difference from the one above.
+        data_start = png.index(b'IDAT') + 4
+        data_length = struct.unpack('>I', png[data_start-8:data_start-4])[0]
+        scanlines = np.frombuffer(zlib.decompress(png[data_start:data_start+data_length]), dtype=np.uint8)
+        scanlines = scanlines.reshape(height, width + 1)
+        self.assertTrue((scanlines[:, 0] == 2).all())
+        np.testing.assert_array_equal(np.cumsum(scanlines[:, 1:], axis=0, dtype=np.uint8), image)
+
+    def test_render_svg(self):
+        svg = self.renderer.render_svg(self.sheet)
+        self.assertTrue(svg.startswith('<svg'))
+        self.assertIn('fill="#BF8F00"', svg)
+        self.assertIn('>Player 1</text>', svg)
+
+        self.renderer.render_svg(self.sheet._replace(rows=[["Player 0", 32, 40, 8, 1], ["Player 1", 24, 31, 7, 2],
+                                                           ["Player 2", 11, None, None, 3]]))
+        self.assertEqual(self.renderer.rows_drawn, 6)
+
+    def test_exporters(self):
+        directory = os.path.join(self.temp_dir.name, 'boards')
+        export_png([self.sheet], directory)
+        export_svg([self.sheet], directory)
+        self.assertEqual(sorted(os.listdir(directory)), ['Day 1 Dogfight.png', 'Day 1 Dogfight.svg'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from models.active_player import ActivePlayer, ActiveTournament
+from models.calcutta_team import CalcuttaTeam
+from models.course import Course
+from models.course_registry import course_registry
+from models.day import Day
+from models.player import Player
+from models.tournament_archive import TournamentArchive
+
+
+class TestTournamentArchive(unittest.TestCase):
+
+    def setUp(self):
+        course_registry.clear()
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.handicap_order = list(range(1, 19))
+        self.courses = [Course("Course 1", self.par_order, self.handicap_order),
+                        Course("Course 2", list(reversed(self.par_order)), list(reversed(self.handicap_order)))]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.archive = TournamentArchive(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def tournament(self, year, player_count=4):
+        """A finished tournament where each player's scores depend on the year."""
+        active_players = dict()
+        for i in range(player_count):
+            active_player = ActivePlayer(Player(f"Player {i}", 5 + i + year % 3))
+            for day_index, day in enumerate(('Day 1', 'Day 2', 'Day 3')):
+                if i == 0 and day == 'Day 3':
+                    continue
+                course = self.courses[(day_index + i + year) % 2]
+                active_player.days[day] = Day(course, [par + (hole + i + year) % 2 for hole, par in enumerate(course.par_order)])
+            active_players[active_player.player_info.name] = active_player
+        active_players["Player 1"].active_tournament = ActiveTournament.TwistedCreek
+
+        team = CalcuttaTeam("Player 0", "Player 1")
+        team.days = {'Day 1': 3, 'Day 2': -1, 'Day 3': None}
+        return active_players, {"Player 0 and Player 1": team}
+
+    def freeze_years(self, years):
+        tournaments = dict()
+        for year in years:
+            tournaments[year] = self.tournament(year)
+            self.archive.freeze(year, *tournaments[year])
+        return tournaments
+
+    def expected_rounds(self, tournaments, player=None, course=None, day=None, since=None, until=None):
+        expected = []
+        for year, (active_players, _) in tournaments.items():
+            for player_name, active_player in active_players.items():
+                for day_name, day_model in active_player.days.items():
+                    if (day_model and player in (None, player_name) and course in (None, day_model.course.name)
+                            and day in (None, day_name) and (since is None or year >= since) and (until is None or year <= until)):
+                        expected.append((year, day_name, player_name, day_model.course.name, day_model.raw_score_list, day_model.points))
+        return sorted(expected)
+
+    def test_queries_match_full_scan(self):
+        tournaments = self.freeze_years([2017, 2018, 2019, 2020, 2021])
+        queries = [
+            {},
+            {'player': "Player 2", 'course': "Course 1"},
+            {'day': 'Day 3', 'since': 2019},
+            {'player': "Player 0", 'day': 'Day 3'},
+            {'course': "Course 2", 'since': 2018, 'until': 2020},
+            {'player': "Player 3", 'until': 2018},
+            {'since': 2025},
+        ]
+        for query in queries:
+            rounds = self.archive.rounds(**query)
+            found = sorted((r.year, r.day, r.player, r.course, r.raw_scores, r.points) for r in rounds)
+            self.assertEqual(found, self.expected_rounds(tournaments, **query), query)
+
+    def test_unknown_player_or_course(self):
+        self.freeze_years([2020])
+        self.assertEqual(self.archive.rounds(player="Nobody"), [])
+        self.assertEqual(self.archive.rounds(course="Nowhere"), [])
+
+    def test_reopened_archive(self):
+        tournaments = self.freeze_years([2019, 2020])
+        archive = TournamentArchive(self.temp_dir.name)
+
+        self.assertEqual(archive.years, [2019, 2020])
+        self.assertEqual(len(archive), len(self.expected_rounds(tournaments)))
+        rounds = archive.rounds(player="Player 1", since=2020)
+        self.assertTrue(rounds)
+        self.assertTrue(all(r.tournament == ActiveTournament.TwistedCreek and r.handicap == 6 + 2020 % 3 for r in rounds))
+
+    def test_refreezing_a_year_replaces_it(self):
+        self.freeze_years([2019, 2020])
+        active_players, teams = self.tournament(2020, player_count=2)
+        self.archive.freeze(2020, active_players, teams)
+
+        self.assertEqual({r.player for r in self.archive.rounds(since=2020)}, {"Player 0", "Player 1"})
+        self.assertEqual(len(self.archive.rounds(until=2019)), 11)
+
+    def test_failed_freeze_keeps_earlier_years(self):
+        tournaments = self.freeze_years([2023])
+        with patch('models.tournament_archive.atomic_write', side_effect=[None, OSError("Access is denied")]):
+            with self.assertRaises(OSError):
+                self.archive.freeze(2024, *self.tournament(2024))
+
+        self.assertEqual(self.archive.years, [2023])
+        self.assertEqual(len(self.archive), len(self.expected_rounds(tournaments)))
+        archive = TournamentArchive(self.temp_dir.name)
+        self.assertEqual(len(archive), len(self.expected_rounds(tournaments)))
+
+        archive.freeze(2025, *self.tournament(2025))
+        self.assertEqual(archive.years, [2023, 2025])
+        self.assertEqual(os.listdir(os.path.join(self.temp_dir.name, 'generations')), ['2'])
+
+    def test_failed_first_freeze(self):
+        with patch('models.tournament_archive.atomic_write', side_effect=[None, OSError("Access is denied")]):
+            with self.assertRaisesRegex(OSError, "Access is denied"):
+                self.archive.freeze(2024, *self.tournament(2024))
+
+        self.assertEqual(self.archive.years, [])
+        self.assertEqual(len(self.archive), 0)
+        archive = TournamentArchive(self.temp_dir.name)
+        self.assertEqual(len(archive), 0)
+
+        tournaments = self.freeze_years([2024])
+        self.assertEqual(self.archive.years, [2024])
+        self.assertEqual(len(TournamentArchive(self.temp_dir.name)), len(self.expected_rounds(tournaments)))
+
+    def test_missing_header_is_not_an_empty_archive(self):
+        self.freeze_years([2023])
+        os.remove(os.path.join(self.temp_dir.name, 'header.json'))
+        with self.assertRaises(FileNotFoundError):
+            TournamentArchive(self.temp_dir.name)
+
+    def test_event_record(self):
+        self.freeze_years([2021])
+        event = self.archive.event(2021)
+
+        self.assertEqual(event['players']["Player 1"]['tournament'], ActiveTournament.TwistedCreek.value)
+        self.assertEqual(event['courses']["Course 2"]['par'], list(reversed(self.par_order)))
+        self.assertEqual(event['teams'], [{'player_1': "Player 0", 'player_2': "Player 1",
+                                           'days': {'Day 1': 3, 'Day 2': -1, 'Day 3': None}}])
+        self.assertNotIn("Player 1", [standing[0] for standing in event['standings']['mosley_open']])
+        self.assertEqual(event['standings']['calcutta'], [["Player 0 and Player 1", 2]])
+        with self.assertRaises(KeyError):
+            self.archive.event(1999)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+from models.active_player import ActivePlayer, ActiveTournament
+from models.course import Course
+from models.course_registry import course_registry
+from models.day import Day
+from models.player import Player
+from models.tournament_snapshot import HEADER_FILE, load_snapshot, save_snapshot, snapshot_is_current
+
+
+class TestTournamentSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        # Each test is a fresh session, so no course is registered yet.
+        course_registry.clear()
+        self.par_order = [4, 4, 3, 4, 4, 5, 3, 4, 5, 4, 4, 3, 4, 4, 5, 3, 4, 5]
+        self.handicap_order = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18]
+        self.course_1 = Course("Course 1", self.par_order, self.handicap_order)
+        self.course_2 = Course("Course 2", list(reversed(self.par_order)), list(reversed(self.handicap_order)))
+
+        self.active_players = dict()
+        for i, handicap in enumerate([0, 8, 17, 25, 30]):
+            player = Player(f"Player {i}", handicap)
+            player.active = True
+            active_player = ActivePlayer(player)
+            active_player.days['Day 1'] = Day(self.course_1, [par + (hole + i) % 3 - 1 for hole, par in enumerate(self.par_order)])
+            active_player.days['Day 2'] = Day(self.course_2, [par + (hole * i) % 2 for hole, par in enumerate(self.course_2.par_order)][:9] + [None]*9)
+            self.active_players[player.name] = active_player
+        self.active_players["Player 3"].active_tournament = ActiveTournament.TwistedCreek
+        # A Mosley Open handicap set apart from the Twisted Creek handicap.
+        self.active_players["Player 4"].player_info.mosley_open_handicap = 12
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.snapshot_path = os.path.join(self.temp_dir.name, 'snapshot')
+        self.library_path = os.path.join(self.temp_dir.name, 'active_players')
+        os.makedirs(self.library_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        save_snapshot(self.snapshot_path, self.active_players)
+        active_players = load_snapshot(self.snapshot_path)
+
+        self.assertEqual(list(active_players), list(self.active_players))
+        for player_name, active_player in self.active_players.items():
+            loaded_player = active_players[player_name]
+            self.assertEqual(loaded_player.player_info.__dict__, active_player.player_info.__dict__)
+            self.assertEqual(loaded_player.active_tournament, active_player.active_tournament)
+            self.assertEqual(loaded_player.days['Day 2'].raw_score_list, active_player.days['Day 2'].raw_score_list)
+            self.assertEqual(loaded_player.days['Day 2'].points, active_player.days['Day 2'].points)
+            self.assertEqual(loaded_player.net_mosley_open_points, active_player.net_mosley_open_points)
+            self.assertIsNone(loaded_player.days['Day 3'])
+
+        self.assertEqual(active_players["Player 4"].player_info.mosley_open_handicap, 12)
+        self.assertIs(active_players["Player 0"].days['Day 1'].course, active_players["Player 1"].days['Day 1'].course)
+        self.assertEqual(active_players["Player 0"].days['Day 2'].course.handicap_order, list(reversed(self.handicap_order)))
+
+    def test_empty_snapshot(self):
+        save_snapshot(self.snapshot_path, dict())
+        self.assertEqual(load_snapshot(self.snapshot_path), dict())
+
+    def test_snapshot_is_current(self):
+        library_file = os.path.join(self.library_path, 'Player 0_active.yaml')
+        with open(library_file, 'w') as active_file:
+            active_file.write('saved')
+        save_snapshot(self.snapshot_path, self.active_players, self.library_path)
+        self.assertTrue(snapshot_is_current(self.snapshot_path, self.library_path))
+
+        with open(library_file, 'w') as active_file:
+            active_file.write('saved again')
+        self.assertFalse(snapshot_is_current(self.snapshot_path, self.library_path))
+
+    def test_incomplete_snapshot(self):
+        save_snapshot(self.snapshot_path, self.active_players, self.library_path)
+        os.remove(os.path.join(self.snapshot_path, HEADER_FILE))
+
+        self.assertFalse(snapshot_is_current(self.snapshot_path, self.library_path))
+        with self.assertRaises(FileNotFoundError):
+            load_snapshot(self.snapshot_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import yaml
+
+from models import yaml_codec
+from models.active_player import ActivePlayer, ActiveTournament
+from models.calcutta_team import CalcuttaTeam
+from models.course import Course
+from models.day import Day
+from models.player import Player
+
+
+class TestYamlCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.course = Course('Test Course', [4]*18, list(range(1, 19)))
+        self.player = Player('John Doe', 25)
+        self.active_player = ActivePlayer(self.player, ActiveTournament.TwistedCreek)
+        self.active_player.days['Day 1'] = Day(self.course, [4]*17 + [None])
+        self.team = CalcuttaTeam('John Doe', 'Jane Doe')
+        self.team.days['Day 1'] = 4
+
+    def test_same_format_as_python_objects(self):
+        for model in (self.course, self.player, self.active_player, self.team):
+            self.assertEqual(yaml_codec.dump(model), yaml.dump(model))
+
+    def test_reads_existing_files(self):
+        for model in (self.course, self.player, self.active_player, self.team):
+            loaded = yaml_codec.load(yaml.dump(model))
+            self.assertIsInstance(loaded, type(model))
+            self.assertEqual(yaml_codec.dump(loaded), yaml.dump(model))
+
+    def test_active_player_state(self):
+        loaded = yaml_codec.load(yaml_codec.dump(self.active_player))
+        self.assertEqual(loaded.active_tournament, ActiveTournament.TwistedCreek)
+        self.assertEqual(loaded.total_raw_score, self.active_player.total_raw_score)
+        self.assertEqual(loaded.net_twisted_creek_score, self.active_player.net_twisted_creek_score)
+        loaded.days['Day 1'] = None
+        self.assertEqual(loaded.number_of_days_played, 0)
+
+    def test_event_listeners_not_saved(self):
+        self.course.add_event_listener('changed', lambda model: None)
+        loaded = yaml_codec.load(yaml_codec.dump(self.course))
+        self.assertEqual(loaded._event_listeners, {})
+
+    def test_rejects_unregistered_objects(self):
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            yaml_codec.load("!!python/object/apply:os.system ['echo unsafe']")
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            yaml_codec.load("!!python/object:collections.OrderedDict {}")
+
+
+if __name__ == '__main__':
+    unittest.main()
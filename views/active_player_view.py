@@ -36,6 +36,12 @@ class ActivePlayerView(ttk.Frame):
         self.total_score_label = ttk.Label(self, font=LABEL_FONT)
         self.total_score_label.grid(row=0, column=20, padx=LABEL_PADDING, sticky=FILL_FRAME)
 
+    def bind_score_entries(self, callback):
+        """Call the callback with the hole index and entry text whenever a score entry is left."""
+        for i in range(COURSE_LENGTH):
+            score_entry = self.score_entry_dict[f'Hole {i+1}']
+            score_entry.bind('<FocusOut>', lambda event, hole=i, entry=score_entry: callback(hole, entry.get()))
+
     def set_score_data(self, raw_scores: list, total_score: int):
         """Populate the entries."""
 
@@ -44,7 +50,8 @@ class ActivePlayerView(ttk.Frame):
 
         if len(raw_scores) == COURSE_LENGTH:
             for i in range(COURSE_LENGTH):
-                self.score_entry_dict[f'Hole {i+1}'].insert(0, raw_scores[i])
+                if raw_scores[i] is not None:
+                    self.score_entry_dict[f'Hole {i+1}'].insert(0, raw_scores[i])
         
         if total_score:
             self.total_score_label.config(text=total_score)
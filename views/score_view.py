@@ -2,7 +2,7 @@
 
 import tkinter as tk
 from tkinter import ttk
-from tkinter.messagebox import showinfo
+from tkinter.messagebox import showerror, showinfo
 
 from .active_player_list_view import ActivePlayerListView
 
@@ -72,6 +72,10 @@ class ScoreView(ttk.Frame):
         self.return_btn.configure(command=self.controller.open_menu)
         self.course_box.bind("<<ComboboxSelected>>", self.controller.load_course)
 
+    def show_error(self, message):
+        """Tell the user why their input was not accepted."""
+        showerror(title='Invalid Score', message=message)
+
     def request_cut_line(self, player_list):
         """This function generates a window for requesting a cut line from the user."""
         split_request = SplitRequest(player_list)